@@ -0,0 +1,72 @@
+"""
+bench_ring_buffer.py
+
+Single-threaded micro-benchmark showing that BoundedBlockingQueue
+throughput does not depend on capacity.
+
+The queue is kept full and then cycled (get + put) so every get()
+dequeues from a buffer holding `capacity` items. A list-backed queue
+using pop(0) is included as a baseline; its cost grows with capacity.
+
+Run from the Assignment1 directory:
+    python -m Benchmarks.bench_ring_buffer
+"""
+
+import threading
+import time
+from typing import Any, List
+
+from blocking_queue import BoundedBlockingQueue
+
+CAPACITIES = [10, 1_000, 10_000, 100_000]
+OPERATIONS = 200_000
+
+
+class _ListBackedQueue:
+    """Minimal list + pop(0) queue mirroring the original implementation."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._buffer: List[Any] = []
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item: Any) -> None:
+        with self._not_full:
+            while len(self._buffer) >= self._capacity:
+                self._not_full.wait()
+            self._buffer.append(item)
+            self._not_empty.notify()
+
+    def get(self) -> Any:
+        with self._not_empty:
+            while not self._buffer:
+                self._not_empty.wait()
+            item = self._buffer.pop(0)
+            self._not_full.notify()
+            return item
+
+
+def _cycle(queue: Any, capacity: int, operations: int) -> float:
+    """Fill the queue, then time `operations` get+put pairs. Returns ops/sec."""
+    for i in range(capacity):
+        queue.put(i)
+
+    start = time.perf_counter()
+    for i in range(operations):
+        queue.put(queue.get())
+    elapsed = time.perf_counter() - start
+    return operations / elapsed
+
+
+def main() -> None:
+    print(f"{'capacity':>10} {'ring ops/s':>14} {'list ops/s':>14}")
+    for capacity in CAPACITIES:
+        ring = _cycle(BoundedBlockingQueue(capacity), capacity, OPERATIONS)
+        baseline = _cycle(_ListBackedQueue(capacity), capacity, OPERATIONS)
+        print(f"{capacity:>10} {ring:>14,.0f} {baseline:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+bench_spsc.py
+
+One producer, one consumer: SPSCQueue (lock-free fast path) versus
+BoundedBlockingQueue (Condition on every operation).
+
+Run from the Assignment1 directory:
+    python -m Benchmarks.bench_spsc
+"""
+
+from Benchmarks.run_benchmarks import bench_queue
+
+ITEMS = 200_000
+CAPACITIES = [16, 1024, 65536]
+REPEAT = 3
+
+
+def main() -> None:
+    print(f"{'capacity':>10} {'batch':>6} {'Bounded items/s':>17} {'SPSC items/s':>14} {'speedup':>8}")
+    for capacity in CAPACITIES:
+        for batch_size in (1, 64):
+            rates = {}
+            for name in ("BoundedBlockingQueue", "SPSCQueue"):
+                rates[name] = max(
+                    bench_queue(name, capacity, 64, 1, 1, batch_size, ITEMS)["items_per_second"]
+                    for _ in range(REPEAT)
+                )
+            bounded, spsc = rates["BoundedBlockingQueue"], rates["SPSCQueue"]
+            print(f"{capacity:>10} {batch_size:>6} {bounded:>17,.0f} {spsc:>14,.0f} {spsc / bounded:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+run_benchmarks.py
+
+Reproducible benchmark harness for the producer-consumer pipeline.
+
+Sweeps queue capacity, payload size, producer/consumer counts and batch
+size, and compares BoundedBlockingQueue against two baselines:
+- queue.Queue from the standard library,
+- a minimal collections.deque + Condition queue.
+SPSCQueue is included for single-producer/single-consumer cases.
+
+End-to-end run_pipeline() throughput is measured over the same grid.
+Each case reports throughput and per-item latency percentiles
+(enqueue -> dequeue); results are printed and saved as JSON together
+with the git commit, so runs can be compared across commits.
+
+Run from the Assignment1 directory:
+    python -m Benchmarks.run_benchmarks [--quick] [--output results.json]
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import queue as queue_module
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+from logging_utils import OFF, configure_logging
+from pipeline import run_pipeline
+from spsc_queue import SPSCQueue
+
+_END = object()
+
+
+class DequeQueue:
+    """Baseline: bounded deque guarded by a single Condition."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._items: Deque[Any] = deque()
+        self._condition = threading.Condition()
+
+    def put(self, item: Any) -> None:
+        with self._condition:
+            while len(self._items) >= self._capacity:
+                self._condition.wait()
+            self._items.append(item)
+            self._condition.notify_all()
+
+    def get(self) -> Any:
+        with self._condition:
+            while not self._items:
+                self._condition.wait()
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+
+QUEUE_FACTORIES: Dict[str, Callable[[int], Any]] = {
+    "BoundedBlockingQueue": BoundedBlockingQueue,
+    "SPSCQueue": SPSCQueue,
+    "queue.Queue": lambda capacity: queue_module.Queue(maxsize=capacity),
+    "deque+Condition": DequeQueue,
+}
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    """Return p50/p90/p99 in microseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        f"p{p}": ordered[round(p / 100 * last)] * 1e6 for p in (50, 90, 99)
+    }
+
+
+def _split(total: int, parts: int) -> List[int]:
+    return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
+
+
+def bench_queue(
+    name: str,
+    capacity: int,
+    item_size: int,
+    producers: int,
+    consumers: int,
+    batch_size: int,
+    items: int,
+) -> Dict[str, Any]:
+    """Time `items` payloads through one queue implementation."""
+    queue = QUEUE_FACTORIES[name](capacity)
+    closable = isinstance(queue, (BoundedBlockingQueue, SPSCQueue))
+    payload = b"x" * item_size
+    latencies: List[List[float]] = [[] for _ in range(consumers)]
+
+    def produce(count: int) -> None:
+        clock = time.perf_counter
+        if batch_size == 1:
+            for _ in range(count):
+                queue.put((clock(), payload))
+        else:
+            for start in range(0, count, batch_size):
+                now = clock()
+                queue.put_many([(now, payload)] * min(batch_size, count - start))
+
+    def consume(samples: List[float]) -> None:
+        clock = time.perf_counter
+        try:
+            while True:
+                if batch_size == 1:
+                    item = queue.get()
+                    if item is _END:
+                        return
+                    samples.append(clock() - item[0])
+                else:
+                    now_batch = queue.get_many(batch_size)
+                    now = clock()
+                    samples.extend(now - item[0] for item in now_batch)
+        except QueueClosed:
+            return
+
+    producer_threads = [
+        threading.Thread(target=produce, args=(count,)) for count in _split(items, producers)
+    ]
+    consumer_threads = [
+        threading.Thread(target=consume, args=(samples,)) for samples in latencies
+    ]
+
+    started = time.perf_counter()
+    for thread in [*producer_threads, *consumer_threads]:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    if closable:
+        queue.close()
+    else:
+        for _ in range(consumers):
+            queue.put(_END)
+    for thread in consumer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "seconds": elapsed,
+        "items_per_second": items / elapsed,
+        "latency_us": _percentiles([s for samples in latencies for s in samples]),
+    }
+
+
+def bench_pipeline(
+    capacity: int,
+    item_size: int,
+    producers: int,
+    consumers: int,
+    batch_size: int,
+    items: int,
+) -> Dict[str, Any]:
+    """Time run_pipeline() end to end with per-item logging off."""
+    payload = b"x" * item_size
+    started = time.perf_counter()
+    result = run_pipeline(
+        source=itertools.repeat(payload, items),
+        buffer_capacity=capacity,
+        batch_size=batch_size,
+        num_producers=producers,
+        num_consumers=consumers,
+        sink=lambda item: None,
+        log_items=False,
+    )
+    elapsed = time.perf_counter() - started
+    assert result.consumed_count == items
+    return {"seconds": elapsed, "items_per_second": items / elapsed, "latency_us": {}}
+
+
+def _best_of(repeat: int, run: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    return max((run() for _ in range(repeat)), key=lambda r: r["items_per_second"])
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    items: int,
+    capacities: List[int],
+    item_sizes: List[int],
+    topologies: List[List[int]],
+    batch_sizes: List[int],
+    repeat: int,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    grid = itertools.product(capacities, item_sizes, topologies, batch_sizes)
+    for capacity, item_size, (producers, consumers), batch_size in grid:
+        case = {
+            "capacity": capacity,
+            "item_size": item_size,
+            "producers": producers,
+            "consumers": consumers,
+            "batch_size": batch_size,
+            "items": items,
+        }
+        for name in QUEUE_FACTORIES:
+            # The baselines have no batch API; only compare them unbatched.
+            if batch_size > 1 and name not in ("BoundedBlockingQueue", "SPSCQueue"):
+                continue
+            if name == "SPSCQueue" and (producers, consumers) != (1, 1):
+                continue
+            measured = _best_of(repeat, lambda: bench_queue(name, **case))
+            results.append({"implementation": name, **case, **measured})
+        measured = _best_of(repeat, lambda: bench_pipeline(**case))
+        results.append({"implementation": "run_pipeline", **case, **measured})
+    return results
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    header = (
+        f"{'implementation':<22}{'cap':>7}{'size':>6}{'P/C':>6}{'batch':>6}"
+        f"{'items/s':>13}{'p50 us':>10}{'p99 us':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        latency = row["latency_us"]
+        print(
+            f"{row['implementation']:<22}{row['capacity']:>7}{row['item_size']:>6}"
+            f"{str(row['producers']) + '/' + str(row['consumers']):>6}{row['batch_size']:>6}"
+            f"{row['items_per_second']:>13,.0f}"
+            f"{latency.get('p50', float('nan')):>10.1f}{latency.get('p99', float('nan')):>10.1f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--quick", action="store_true", help="small grid for smoke runs")
+    parser.add_argument("--items", type=int, default=None, help="items per case")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best kept)")
+    parser.add_argument("--output", default="bench_results.json", help="JSON output path")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        config = dict(
+            items=args.items or 20_000,
+            capacities=[64],
+            item_sizes=[64],
+            topologies=[[1, 1], [4, 4]],
+            batch_sizes=[1, 64],
+            repeat=1,
+        )
+    else:
+        config = dict(
+            items=args.items or 100_000,
+            capacities=[16, 1024, 65536],
+            item_sizes=[16, 4096],
+            topologies=[[1, 1], [1, 4], [4, 4]],
+            batch_sizes=[1, 64],
+            repeat=args.repeat,
+        )
+
+    # Keep log output out of the measurements.
+    configure_logging(level=OFF)
+    results = run_suite(**config)
+    _print_table(results)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Unit tests for AsyncBoundedQueue and run_pipeline_async.
+
+These tests validate:
+- Awaitable put/get and batch variants
+- Backpressure: put() suspends while the queue is full
+- close() wakes waiters and ends the stream once drained
+- Thread-safe bridging from a plain thread into the event loop
+- End-to-end async pipeline with async and sync sources, where None is
+  ordinary data
+- A failing transform cancels every pipeline task before re-raising
+"""
+
+import asyncio
+import threading
+import unittest
+
+from async_queue import AsyncBoundedQueue
+from blocking_queue import QueueClosed
+from pipeline import run_pipeline_async
+
+
+class TestAsyncBoundedQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def test_put_and_get_preserve_fifo_order(self):
+        q = AsyncBoundedQueue(capacity=2)
+        for i in range(10):
+            await q.put(i)
+            self.assertEqual(await q.get(), i)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            AsyncBoundedQueue(0)
+
+    async def test_put_suspends_when_full(self):
+        """
+        Backpressure:
+        - Capacity 1, second put() must not complete until a get().
+        """
+        q = AsyncBoundedQueue(capacity=1)
+        await q.put("first")
+
+        second = asyncio.create_task(q.put("second"))
+        await asyncio.sleep(0.05)
+        self.assertFalse(second.done(), "put() should suspend on a full queue")
+
+        self.assertEqual(await q.get(), "first")
+        await asyncio.wait_for(second, timeout=1.0)
+        self.assertEqual(await q.get(), "second")
+
+    async def test_batch_variants(self):
+        q = AsyncBoundedQueue(capacity=3)
+        consumer = asyncio.create_task(self._drain(q, 7))
+        await q.put_many(range(7))
+        self.assertEqual(await asyncio.wait_for(consumer, timeout=1.0), list(range(7)))
+        self.assertEqual(await q.get_many(4, timeout=0.05), [])
+
+    async def test_close_wakes_waiters_and_drains(self):
+        """
+        A consumer waiting on an empty queue is woken by close(); queued
+        items are still delivered before get_many() raises QueueClosed.
+        """
+        q = AsyncBoundedQueue(capacity=2)
+        waiter = asyncio.create_task(q.get())
+        await asyncio.sleep(0.01)
+        await q.close()
+        with self.assertRaises(QueueClosed):
+            await asyncio.wait_for(waiter, timeout=1.0)
+
+        q = AsyncBoundedQueue(capacity=2)
+        await q.put_many([None, 1])
+        await q.close()
+        with self.assertRaises(QueueClosed):
+            await q.put(2)
+        self.assertEqual(await q.get_many(5), [None, 1])
+        with self.assertRaises(QueueClosed):
+            await q.get_many(5)
+
+    async def _drain(self, q, count):
+        received = []
+        while len(received) < count:
+            received.extend(await q.get_many(2))
+        return received
+
+    async def test_thread_producer_feeds_async_consumer(self):
+        """
+        Bridging:
+        - A plain thread uses put_threadsafe()/put_many_threadsafe().
+        - The coroutine consumer receives everything in order.
+        """
+        q = AsyncBoundedQueue(capacity=2, loop=asyncio.get_running_loop())
+
+        def producer_task():
+            for i in range(5):
+                q.put_threadsafe(i)
+            q.put_many_threadsafe(range(5, 10))
+
+        t = threading.Thread(target=producer_task, name="BridgeProducerThread")
+        t.start()
+        received = await asyncio.wait_for(self._drain(q, 10), timeout=2.0)
+        await asyncio.to_thread(t.join, 1.0)
+
+        self.assertEqual(received, list(range(10)))
+        self.assertFalse(t.is_alive())
+
+    def test_threadsafe_requires_bound_loop(self):
+        q = AsyncBoundedQueue(capacity=1)
+        with self.assertRaises(RuntimeError):
+            q.put_threadsafe(1)
+
+
+class TestAsyncPipeline(unittest.IsolatedAsyncioTestCase):
+
+    async def test_async_source_in_order(self):
+        async def source():
+            for i in range(20):
+                yield i
+
+        result = await run_pipeline_async(source(), buffer_capacity=3)
+        self.assertEqual(result.destination, list(range(20)))
+        self.assertEqual(result.produced_count, 20)
+        self.assertEqual(result.consumed_count, 20)
+
+    async def test_multiple_consumers_with_async_transform(self):
+        async def double(x):
+            await asyncio.sleep(0)
+            return 2 * x
+
+        result = await run_pipeline_async(
+            range(100),
+            buffer_capacity=4,
+            batch_size=3,
+            num_consumers=4,
+            transform=double,
+        )
+        self.assertEqual(sorted(result.destination), [2 * x for x in range(100)])
+
+    async def test_transform_error_leaves_no_pending_tasks(self):
+        """
+        The producer is mid-way through a long source with a tiny queue and
+        the other consumers wait on get(); none of them may outlive the
+        failed call on a long-lived loop.
+        """
+        def explode(x):
+            if x == 7:
+                raise ValueError("bad item")
+            return x
+
+        with self.assertRaisesRegex(ValueError, "bad item"):
+            await run_pipeline_async(
+                range(100_000), buffer_capacity=2, num_consumers=3, transform=explode
+            )
+
+        current = asyncio.current_task()
+        self.assertEqual([t for t in asyncio.all_tasks() if t is not current], [])
+
+    async def test_none_in_source_is_ordinary_data(self):
+        source = [1, None, 2, None, 3] * 10
+        result = await run_pipeline_async(
+            source, buffer_capacity=3, batch_size=4, num_consumers=3
+        )
+        self.assertEqual(len(result.destination), len(source))
+        self.assertEqual(result.destination.count(None), 20)
+        self.assertEqual(result.produced_count, len(source))
+
+
+if __name__ == "__main__":
+    unittest.main()
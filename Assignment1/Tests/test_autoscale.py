@@ -0,0 +1,131 @@
+"""
+Unit tests for consumer autoscaling.
+
+These tests validate:
+- Policy validation
+- Hysteresis: signals must persist before the pool changes, and the
+  pool stays within its bounds
+- A producer blocked across several ticks is seen on every tick
+- run_pipeline grows the pool under backlog and shrinks it when idle,
+  without losing items
+"""
+
+import threading
+import time
+import unittest
+
+from autoscale import AutoscalePolicy, Autoscaler
+from metrics import InstrumentedBlockingQueue
+from pipeline import run_pipeline
+
+
+def _slow_identity(x):
+    time.sleep(0.002)
+    return x
+
+
+class TestAutoscalePolicy(unittest.TestCase):
+
+    def test_invalid_policies_rejected(self):
+        with self.assertRaises(ValueError):
+            AutoscalePolicy(min_consumers=0)
+        with self.assertRaises(ValueError):
+            AutoscalePolicy(min_consumers=4, max_consumers=2)
+        with self.assertRaises(ValueError):
+            AutoscalePolicy(scale_up_occupancy=0.2, scale_down_occupancy=0.5)
+
+
+class TestAutoscalerHysteresis(unittest.TestCase):
+
+    def setUp(self):
+        policy = AutoscalePolicy(min_consumers=1, max_consumers=3, scale_up_after=2, scale_down_after=3)
+        self.scaler = Autoscaler(InstrumentedBlockingQueue(4), policy, [], lambda: None)
+
+    def test_scale_up_needs_consecutive_hot_samples(self):
+        self.assertEqual(self.scaler.step(0.9, 0.0, 0.0, active=1), 0)
+        # A neutral sample resets the streak.
+        self.assertEqual(self.scaler.step(0.5, 0.0, 0.0, active=1), 0)
+        self.assertEqual(self.scaler.step(0.9, 0.0, 0.0, active=1), 0)
+        self.assertEqual(self.scaler.step(0.1, 0.5, 0.0, active=1), 1)
+
+    def test_scale_down_needs_idle_consumers_and_respects_bounds(self):
+        self.assertEqual(self.scaler.step(0.0, 0.0, 0.1, active=2), 0)
+        for _ in range(2):
+            self.assertEqual(self.scaler.step(0.0, 0.0, 0.9, active=2), 0)
+        self.assertEqual(self.scaler.step(0.0, 0.0, 0.9, active=2), -1)
+        for _ in range(5):
+            self.assertEqual(self.scaler.step(0.0, 0.0, 0.9, active=1), 0)
+        for _ in range(5):
+            self.assertEqual(self.scaler.step(1.0, 1.0, 0.0, active=3), 0)
+
+    def test_long_producer_wait_counts_on_every_tick(self):
+        queue = InstrumentedBlockingQueue(1)
+        queue.put(0)
+        policy = AutoscalePolicy(min_consumers=1, max_consumers=1, interval=0.05)
+        scaler = Autoscaler(queue, policy, [], lambda: None)
+        samples = []
+
+        def record(occupancy, producer_blocked, consumer_idle, active):
+            samples.append(producer_blocked)
+            return 0
+
+        scaler.step = record
+
+        producer = threading.Thread(target=queue.put, args=(1,))
+        producer.start()
+        scaler.start()
+        time.sleep(0.4)
+        # Still blocked: nothing has finished waiting yet.
+        blocked_samples = list(samples)
+        queue.get()
+        producer.join()
+        scaler.stop()
+
+        self.assertGreaterEqual(len(blocked_samples), 3)
+        # Every tick after the producer blocked reports it as blocked.
+        self.assertGreaterEqual(min(blocked_samples[1:]), 0.5)
+
+
+class TestAutoscaledPipeline(unittest.TestCase):
+
+    def test_pool_grows_under_backlog(self):
+        result = run_pipeline(
+            source=range(400),
+            buffer_capacity=8,
+            transform=_slow_identity,
+            log_items=False,
+            autoscale=AutoscalePolicy(min_consumers=1, max_consumers=4, interval=0.02),
+        )
+        self.assertEqual(sorted(result.destination), list(range(400)))
+        self.assertEqual(result.consumed_count, 400)
+        self.assertGreater(result.peak_consumers, 1)
+        self.assertLessEqual(result.peak_consumers, 4)
+
+    def test_pool_shrinks_when_idle(self):
+        def trickle():
+            for i in range(30):
+                time.sleep(0.01)
+                yield i
+
+        counts = []
+        result = run_pipeline(
+            source=trickle(),
+            num_consumers=4,
+            log_items=False,
+            on_metrics=lambda m: counts.append(m.consumer_count),
+            metrics_interval=0.05,
+            autoscale=AutoscalePolicy(
+                min_consumers=1, max_consumers=4, interval=0.01, scale_down_after=2
+            ),
+        )
+        self.assertEqual(sorted(result.destination), list(range(30)))
+        self.assertLess(min(counts), 4)
+        self.assertGreaterEqual(min(counts), 1)
+
+    def test_autoscale_requires_thread_backend(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], backend="process", autoscale=AutoscalePolicy())
+
+
+if __name__ == "__main__":
+    unittest.main()
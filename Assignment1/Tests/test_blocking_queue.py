@@ -17,7 +17,7 @@ import unittest
 import threading
 import time
 
-from blocking_queue import BoundedBlockingQueue
+from blocking_queue import BoundedBlockingQueue, QueueClosed
 
 
 class TestBoundedBlockingQueueBasic(unittest.TestCase):
@@ -44,6 +44,159 @@ class TestBoundedBlockingQueueBasic(unittest.TestCase):
         with self.assertRaises(ValueError):
             BoundedBlockingQueue(0)
 
+    def test_fifo_order_preserved_across_wraparound(self):
+        """
+        Ring buffer behavior:
+        - Head/tail indices wrap around the fixed slot array many times.
+        - FIFO order and size must be preserved throughout.
+        """
+        q = BoundedBlockingQueue(capacity=3)
+        q.put(0)
+        q.put(1)
+        for i in range(2, 20):
+            q.put(i)
+            self.assertEqual(q.get(), i - 2)
+            self.assertEqual(q.size(), 2)
+        self.assertEqual(q.get(), 18)
+        self.assertEqual(q.get(), 19)
+        self.assertEqual(q.size(), 0)
+
+
+class TestBoundedBlockingQueueBatch(unittest.TestCase):
+    """
+    Tests for the batch put_many()/get_many() APIs.
+    """
+
+    def test_put_many_then_get_many_preserves_order(self):
+        """
+        - A batch that fits is enqueued in one call.
+        - get_many() returns at most max_items, in FIFO order.
+        """
+        q = BoundedBlockingQueue(capacity=5)
+        q.put_many([1, 2, 3, 4])
+        self.assertEqual(q.get_many(3), [1, 2, 3])
+        self.assertEqual(q.get_many(10), [4])
+        self.assertEqual(q.size(), 0)
+
+    def test_get_many_timeout_returns_empty_list(self):
+        """
+        An empty queue with a timeout yields [] instead of blocking forever.
+        """
+        q = BoundedBlockingQueue(capacity=2)
+        self.assertEqual(q.get_many(5, timeout=0.05), [])
+
+    def test_get_many_rejects_non_positive_max_items(self):
+        q = BoundedBlockingQueue(capacity=2)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+
+    def test_put_many_blocks_only_for_overflow(self):
+        """
+        Concurrency scenario:
+        - Capacity 2, batch of 5 items.
+        - The first 2 items are enqueued immediately; the producer then blocks.
+        - A consumer draining the queue lets the rest of the batch through.
+        """
+        q = BoundedBlockingQueue(capacity=2)
+        finished = threading.Event()
+
+        def producer_task():
+            q.put_many(range(5))
+            finished.set()
+
+        t = threading.Thread(target=producer_task, name="BatchProducerThread")
+        t.start()
+        time.sleep(0.1)
+
+        self.assertFalse(finished.is_set(), "put_many should block on overflow")
+        self.assertEqual(q.size(), 2)
+
+        received: list[Any] = []
+        while len(received) < 5:
+            received.extend(q.get_many(5, timeout=1.0))
+
+        self.assertEqual(received, [0, 1, 2, 3, 4])
+        t.join(timeout=1.0)
+        self.assertFalse(t.is_alive(), "Producer thread did not finish (possible deadlock)")
+
+
+class TestBoundedBlockingQueueTimeoutsAndClose(unittest.TestCase):
+    """
+    Tests for bounded waits, non-blocking offer/poll and close().
+    """
+
+    def test_put_and_get_time_out(self):
+        q = BoundedBlockingQueue(capacity=1)
+        with self.assertRaises(TimeoutError):
+            q.get(timeout=0.05)
+        q.put("only")
+        with self.assertRaises(TimeoutError):
+            q.put("overflow", timeout=0.05)
+        self.assertEqual(q.get(timeout=0.05), "only")
+
+    def test_offer_and_poll_never_block(self):
+        q = BoundedBlockingQueue(capacity=1)
+        self.assertIsNone(q.poll())
+        self.assertEqual(q.poll(default="empty"), "empty")
+        self.assertTrue(q.offer(1))
+        self.assertFalse(q.offer(2))
+        self.assertEqual(q.poll(), 1)
+
+    def test_close_drains_then_signals_end_of_stream(self):
+        """
+        - Items queued before close() are still delivered.
+        - After draining, get()/get_many() raise QueueClosed.
+        - Puts after close() raise QueueClosed.
+        """
+        q = BoundedBlockingQueue(capacity=3)
+        q.put_many([1, 2])
+        q.close()
+
+        self.assertTrue(q.closed)
+        with self.assertRaises(QueueClosed):
+            q.put(3)
+        with self.assertRaises(QueueClosed):
+            q.offer(3)
+        self.assertEqual(q.get(), 1)
+        self.assertEqual(q.get_many(5), [2])
+        with self.assertRaises(QueueClosed):
+            q.get()
+        with self.assertRaises(QueueClosed):
+            q.get_many(5)
+
+    def test_close_wakes_blocked_consumers_and_producers(self):
+        """
+        Concurrency scenario:
+        - Two consumers block on an empty queue, a producer blocks on a full one.
+        - close() must wake all of them with QueueClosed (no deadlock).
+        """
+        empty = BoundedBlockingQueue(capacity=1)
+        full = BoundedBlockingQueue(capacity=1)
+        full.put("x")
+        outcomes: list[Any] = []
+
+        def wait_on(fn):
+            try:
+                fn()
+            except QueueClosed:
+                outcomes.append("closed")
+
+        threads = [
+            threading.Thread(target=wait_on, args=(empty.get,)),
+            threading.Thread(target=wait_on, args=(empty.get,)),
+            threading.Thread(target=wait_on, args=(lambda: full.put("y"),)),
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+
+        empty.close()
+        full.close()
+        for t in threads:
+            t.join(timeout=1.0)
+            self.assertFalse(t.is_alive(), "Waiter was not woken by close()")
+        self.assertEqual(outcomes, ["closed"] * 3)
+
 
 class TestBoundedBlockingQueueConcurrency(unittest.TestCase):
     """
@@ -0,0 +1,97 @@
+"""
+Unit tests for ByteBoundedBlockingQueue.
+
+These tests validate:
+- Capacity is enforced in bytes, not items
+- Producers block when the byte budget would be exceeded and resume
+  once consumers free enough room
+- Oversized items do not deadlock an empty queue
+- A pluggable size function and use through run_pipeline
+"""
+
+import threading
+import time
+import unittest
+
+from blocking_queue import QueueClosed
+from byte_queue import ByteBoundedBlockingQueue
+from pipeline import run_pipeline
+
+
+class TestByteBoundedBlockingQueue(unittest.TestCase):
+
+    def test_many_small_items_fit_budget(self):
+        q = ByteBoundedBlockingQueue(max_bytes=10)
+        for _ in range(10):
+            self.assertTrue(q.offer(b"x"))
+        self.assertFalse(q.offer(b"x"))
+        self.assertEqual(q.size(), 10)
+        self.assertEqual(q.bytes_used(), 10)
+
+    def test_large_item_blocks_until_room_is_freed(self):
+        """
+        Concurrency scenario:
+        - 6 of 10 bytes used; a 5-byte put must block.
+        - Freeing 4 bytes is not enough; freeing the second item is.
+        """
+        q = ByteBoundedBlockingQueue(max_bytes=10)
+        q.put(b"aaaa")
+        q.put(b"bb")
+        done = threading.Event()
+
+        def producer_task():
+            q.put(b"ccccc")
+            done.set()
+
+        t = threading.Thread(target=producer_task)
+        t.start()
+        time.sleep(0.1)
+        self.assertFalse(done.is_set(), "put() should block on the byte budget")
+
+        self.assertEqual(q.get(), b"aaaa")
+        self.assertTrue(done.wait(timeout=1.0))
+        t.join(timeout=1.0)
+        self.assertEqual(q.bytes_used(), 7)
+
+    def test_oversized_item_admitted_when_empty(self):
+        q = ByteBoundedBlockingQueue(max_bytes=4)
+        q.put(b"0123456789")
+        with self.assertRaises(TimeoutError):
+            q.put(b"x", timeout=0.05)
+        self.assertEqual(q.get(), b"0123456789")
+
+    def test_put_many_and_custom_size_fn(self):
+        q = ByteBoundedBlockingQueue(max_bytes=100, size_fn=lambda item: item["size"])
+        q.put_many([{"size": 40}, {"size": 60}])
+        self.assertFalse(q.offer({"size": 1}))
+        self.assertEqual(len(q.get_many(5)), 2)
+        self.assertEqual(q.bytes_used(), 0)
+
+    def test_close_semantics(self):
+        q = ByteBoundedBlockingQueue(max_bytes=8)
+        q.put("ab")
+        q.close()
+        with self.assertRaises(QueueClosed):
+            q.put("c")
+        self.assertEqual(q.get(), "ab")
+        with self.assertRaises(QueueClosed):
+            q.get()
+
+    def test_invalid_budget_rejected(self):
+        with self.assertRaises(ValueError):
+            ByteBoundedBlockingQueue(0)
+
+    def test_pipeline_with_byte_budget(self):
+        source = [b"x" * size for size in range(1, 200)]
+        result = run_pipeline(
+            source=source,
+            batch_size=8,
+            num_consumers=2,
+            log_items=False,
+            queue_factory=lambda _: ByteBoundedBlockingQueue(max_bytes=512),
+        )
+        self.assertEqual(sorted(result.destination, key=len), source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Unit tests for the pipeline logger.
+
+These tests validate:
+- Level gating: disabled messages are neither formatted nor written
+- The background writer delivers every record, in order, on flush()
+- Pipeline per-item logging can be switched off while keeping summaries
+"""
+
+import io
+import unittest
+
+from logging_utils import DEBUG, INFO, PipelineLogger, configure_logging, get_logger
+from pipeline import run_pipeline
+
+
+class _Explosive:
+    """Fails loudly if anyone tries to format it."""
+
+    def __str__(self):
+        raise AssertionError("disabled message was formatted")
+
+
+class TestPipelineLogger(unittest.TestCase):
+
+    def test_disabled_level_skips_formatting(self):
+        stream = io.StringIO()
+        logger = PipelineLogger(level=INFO, stream=stream, asynchronous=False)
+        logger.debug("value %s", _Explosive())
+        self.assertEqual(stream.getvalue(), "")
+        self.assertFalse(logger.enabled_for(DEBUG))
+
+    def test_background_writer_flushes_in_order(self):
+        stream = io.StringIO()
+        logger = PipelineLogger(level=DEBUG, stream=stream, buffer_size=4)
+        for i in range(50):
+            logger.debug("line %d", i)
+        logger.flush()
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 50)
+        self.assertTrue(lines[0].endswith(" - line 0"))
+        self.assertTrue(lines[-1].endswith(" - line 49"))
+        logger.close()
+
+
+class TestPipelineLoggingOptions(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        configure_logging(level=DEBUG, stream=self.stream)
+
+    def tearDown(self):
+        configure_logging()
+
+    def test_log_items_off_keeps_summaries(self):
+        run_pipeline(source=range(100), log_items=False, summary_every=25)
+        get_logger().flush()
+        output = self.stream.getvalue()
+
+        self.assertNotIn("Produced 0 ", output)
+        self.assertNotIn("Consumed 0 ", output)
+        self.assertIn("Produced 100 items so far", output)
+        self.assertIn("Consumed 100 items so far", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
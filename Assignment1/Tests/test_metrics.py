@@ -0,0 +1,99 @@
+"""
+Unit tests for pipeline metrics.
+
+These tests validate:
+- InstrumentedBlockingQueue records blocked time on the right condition
+- Occupancy histogram and latency percentiles are populated
+- run_pipeline exposes metrics and periodic snapshots when asked to
+"""
+
+import threading
+import time
+import unittest
+
+from metrics import InstrumentedBlockingQueue, QueueMetrics
+from pipeline import run_pipeline
+
+
+class TestInstrumentedQueue(unittest.TestCase):
+
+    def test_consumer_wait_is_recorded(self):
+        """A get() on an empty queue accrues time on _not_empty only."""
+        q = InstrumentedBlockingQueue(capacity=1)
+        threading.Timer(0.1, q.put, args=("late",)).start()
+
+        self.assertEqual(q.get(), "late")
+        self.assertGreaterEqual(q.metrics.get_wait_seconds, 0.05)
+        self.assertEqual(q.metrics.put_wait_seconds, 0.0)
+
+    def test_producer_wait_is_recorded(self):
+        """A put() on a full queue accrues time on _not_full only."""
+        q = InstrumentedBlockingQueue(capacity=1)
+        q.put(1)
+        threading.Timer(0.1, q.get).start()
+
+        q.put(2)
+        self.assertGreaterEqual(q.metrics.put_wait_seconds, 0.05)
+
+    def test_histogram_and_latency(self):
+        q = InstrumentedBlockingQueue(capacity=4)
+        for i in range(4):
+            q.put(i)
+        time.sleep(0.01)
+        for _ in range(4):
+            q.get()
+
+        metrics = q.metrics
+        self.assertEqual(sum(metrics.occupancy_histogram), 4)
+        # The last put left the queue completely full.
+        self.assertEqual(metrics.occupancy_histogram[-1], 1)
+        percentiles = metrics.latency_percentiles()
+        self.assertGreaterEqual(percentiles["p50"], 0.01)
+        self.assertLessEqual(percentiles["p50"], percentiles["p99"])
+
+    def test_latency_reservoir_is_bounded(self):
+        metrics = QueueMetrics(capacity=1, latency_samples=10)
+        for i in range(1000):
+            metrics.record_get(float(i))
+        self.assertEqual(len(metrics._latencies), 10)
+        self.assertEqual(metrics.get_count, 1000)
+
+
+class TestPipelineMetrics(unittest.TestCase):
+
+    def test_metrics_off_by_default(self):
+        self.assertIsNone(run_pipeline(source=range(5)).metrics)
+
+    def test_result_metrics_and_snapshots(self):
+        snapshots = []
+
+        def slow(x):
+            time.sleep(0.002)
+            return x
+
+        result = run_pipeline(
+            source=range(100),
+            buffer_capacity=4,
+            transform=slow,
+            log_items=False,
+            on_metrics=snapshots.append,
+            metrics_interval=0.05,
+        )
+
+        metrics = result.metrics
+        self.assertIsNotNone(metrics)
+        self.assertEqual(metrics.consumed_count, 100)
+        self.assertGreater(metrics.items_per_second, 0)
+        # A slow consumer means the producer spends time blocked.
+        self.assertGreater(metrics.producer_wait_seconds, 0)
+        self.assertEqual(sum(metrics.occupancy_histogram), 100)
+        self.assertIn("p99", metrics.latency_percentiles)
+        self.assertGreater(len(snapshots), 0)
+
+    def test_metrics_rejected_for_process_backend(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], backend="process", collect_metrics=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
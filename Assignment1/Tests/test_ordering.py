@@ -0,0 +1,116 @@
+"""
+Unit tests for ordered output (ReorderBuffer and run_pipeline(ordered=True)).
+
+These tests validate:
+- Out-of-order results are parked and emitted in sequence order
+- The in-flight window blocks producers until earlier items are emitted
+- Parallel consumers (and producers) still yield source order
+- The reorder window and its peak occupancy are reported in metrics
+"""
+
+import random
+import threading
+import time
+import unittest
+
+from ordering import ReorderBuffer
+from pipeline import run_pipeline
+
+
+def _jittered_square(x):
+    # Uneven work so parallel consumers finish out of order.
+    time.sleep(random.random() * 0.001)
+    return x * x
+
+
+class TestReorderBuffer(unittest.TestCase):
+
+    def test_emits_in_sequence_order(self):
+        emitted = []
+        buffer = ReorderBuffer(emitted.append, window=8)
+        buffer.reserve(4)
+        for sequence in (2, 0, 3, 1):
+            buffer.push((sequence, f"item-{sequence}"))
+        self.assertEqual(emitted, ["item-0", "item-1", "item-2", "item-3"])
+        self.assertEqual(buffer.pending(), 0)
+        self.assertEqual(buffer.peak_pending, 2)
+
+    def test_reserve_blocks_while_window_is_full(self):
+        """
+        Concurrency scenario:
+        - The window (2) is fully reserved.
+        - A further reserve() must wait until item 0 is emitted.
+        """
+        buffer = ReorderBuffer(lambda item: None, window=2)
+        buffer.reserve(2)
+        admitted = threading.Event()
+
+        def producer_task():
+            buffer.reserve(1)
+            admitted.set()
+
+        t = threading.Thread(target=producer_task)
+        t.start()
+        buffer.push((1, "b"))
+        time.sleep(0.1)
+        self.assertFalse(admitted.is_set(), "reserve() should block on a full window")
+
+        buffer.push((0, "a"))
+        self.assertTrue(admitted.wait(timeout=1.0))
+        t.join(timeout=1.0)
+
+    def test_window_must_cover_a_reservation(self):
+        with self.assertRaises(ValueError):
+            ReorderBuffer(lambda item: None, window=0)
+        with self.assertRaises(ValueError):
+            ReorderBuffer(lambda item: None, window=2).reserve(3)
+
+
+class TestOrderedPipeline(unittest.TestCase):
+
+    def test_parallel_consumers_preserve_source_order(self):
+        result = run_pipeline(
+            source=range(300),
+            num_consumers=4,
+            transform=_jittered_square,
+            ordered=True,
+            log_items=False,
+        )
+        self.assertEqual(result.destination, [x * x for x in range(300)])
+        self.assertEqual(result.consumed_count, 300)
+
+    def test_parallel_producers_and_batches_preserve_order(self):
+        received = []
+        run_pipeline(
+            source=(x for x in range(500)),
+            batch_size=7,
+            num_producers=3,
+            num_consumers=3,
+            transform=_jittered_square,
+            sink=received.append,
+            ordered=True,
+            log_items=False,
+        )
+        self.assertEqual(received, [x * x for x in range(500)])
+
+    def test_reorder_window_reported_in_metrics(self):
+        result = run_pipeline(
+            source=range(200),
+            num_consumers=4,
+            transform=_jittered_square,
+            ordered=True,
+            reorder_window=16,
+            collect_metrics=True,
+            log_items=False,
+        )
+        self.assertEqual(result.destination, [x * x for x in range(200)])
+        self.assertEqual(result.metrics.reorder_window, 16)
+        self.assertLessEqual(result.metrics.reorder_peak_pending, 16)
+
+    def test_ordered_requires_thread_backend(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], backend="process", ordered=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
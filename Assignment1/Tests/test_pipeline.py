@@ -1,7 +1,20 @@
+import itertools
 import unittest
+from blocking_queue import BoundedBlockingQueue
+from consumer import Consumer
 from pipeline import run_pipeline
 
 
+def _square(x):
+    # Module-level so it can be pickled for the process backend.
+    return x * x
+
+
+def _lambda_for_thirteen(x):
+    # The transform itself pickles; one of its results (a lambda) does not.
+    return (lambda: x) if x == 13 else x
+
+
 class TestProducerConsumerPipeline(unittest.TestCase):
     """
     Tests the end-to-end producer–consumer pipeline using a bounded blocking queue.
@@ -80,6 +93,226 @@ class TestProducerConsumerPipeline(unittest.TestCase):
         self.assertEqual(result.destination, source)
         self.assertEqual(result.produced_count, result.consumed_count)
 
+    def test_batched_transfer_preserves_order(self):
+        """
+        Batching:
+        - batch_size > 1 switches producer/consumer to put_many/get_many.
+        - A batch size that does not divide the input evenly must still
+          deliver every item, in order, and stop once the queue is
+          closed and drained.
+        """
+        source = list(range(103))
+        result = run_pipeline(
+            source=source,
+            buffer_capacity=8,
+            sentinel=None,
+            batch_size=10,
+        )
+
+        self.assertEqual(result.destination, source)
+        self.assertEqual(result.produced_count, result.consumed_count)
+
+    def test_multiple_producers_and_consumers_transfer_everything(self):
+        """
+        Worker pool:
+        - Several producers share the source (sharded) and several consumers
+          share the queue.
+        - Every consumer must receive end-of-stream and exit (no hang).
+        - Every item must be delivered exactly once; order is not guaranteed.
+        """
+        source = list(range(500))
+        result = run_pipeline(
+            source=source,
+            buffer_capacity=4,
+            sentinel=None,
+            num_producers=3,
+            num_consumers=4,
+        )
+
+        self.assertEqual(sorted(result.destination), source)
+        self.assertEqual(result.produced_count, 500)
+        self.assertEqual(result.consumed_count, 500)
+
+    def test_multiple_consumers_with_batching(self):
+        """
+        Batched consumers sharing a queue with several producers must each
+        shut down once the queue is closed and drained, without losing
+        items; the sentinel argument is ignored.
+        """
+        source = list(range(200))
+        result = run_pipeline(
+            source=source,
+            buffer_capacity=16,
+            sentinel="END",
+            batch_size=8,
+            num_producers=2,
+            num_consumers=5,
+        )
+
+        self.assertEqual(sorted(result.destination), source)
+
+    def test_batched_consumer_keeps_items_drained_past_its_sentinel(self):
+        """
+        A standalone batched Consumer that drains data and further
+        sentinels past its own sentinel stores that data itself, in
+        order, and hands back only the surplus sentinels.
+        """
+        queue = BoundedBlockingQueue(capacity=8)
+        queue.put_many([1, 2, "END", 3, "END"])
+        destination = []
+        consumer = Consumer(queue, destination, sentinel="END", batch_size=8, log_items=False)
+        consumer.start()
+        consumer.join(timeout=5)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(destination, [1, 2, 3])
+        self.assertEqual(consumer.consumed_count, 3)
+        self.assertEqual(queue.get_many(8, timeout=0.01), ["END"])
+
+    def test_worker_counts_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], num_producers=0)
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], num_consumers=0)
+
+    def test_transform_applied_by_thread_consumers(self):
+        result = run_pipeline(source=[1, 2, 3], transform=_square)
+        self.assertEqual(result.destination, [1, 4, 9])
+
+    def test_process_backend_transfers_and_transforms(self):
+        """
+        Process backend:
+        - Consumers run in worker processes and apply the transform.
+        - Every item is delivered exactly once and all workers shut down.
+        """
+        source = list(range(300))
+        result = run_pipeline(
+            source=source,
+            buffer_capacity=8,
+            batch_size=4,
+            num_consumers=3,
+            transform=_square,
+            backend="process",
+        )
+
+        self.assertEqual(sorted(result.destination), [x * x for x in source])
+        self.assertEqual(result.produced_count, result.consumed_count)
+
+    def test_process_backend_single_consumer_preserves_order(self):
+        source = list(range(50))
+        result = run_pipeline(source=source, buffer_capacity=2, backend="process")
+        self.assertEqual(result.destination, source)
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], backend="fiber")
+
+    def test_generator_source_is_consumed_lazily(self):
+        """
+        Streaming source:
+        - An unbounded generator must be pulled only as fast as items are
+          delivered: while the pipeline runs, pulled - delivered never
+          exceeds the queue capacity plus the batch held by the producer
+          and the batch held by the consumer.
+        - The generator stops once the sink has seen enough items; a
+          source that was materialized up front would hit the guard.
+        """
+        capacity, batch_size = 8, 4
+        pulled = 0
+        delivered = []
+        gaps = []
+
+        def numbers():
+            nonlocal pulled
+            for i in itertools.count():
+                if len(delivered) >= 200:
+                    return
+                if i > 10_000:
+                    raise AssertionError("source was not consumed lazily")
+                pulled += 1
+                yield i
+
+        def sink(item):
+            delivered.append(item)
+            gaps.append(pulled - len(delivered))
+
+        result = run_pipeline(
+            source=numbers(),
+            buffer_capacity=capacity,
+            batch_size=batch_size,
+            sink=sink,
+            log_items=False,
+        )
+
+        self.assertEqual(delivered, list(range(result.produced_count)))
+        self.assertGreaterEqual(len(delivered), 200)
+        self.assertLessEqual(max(gaps), capacity + 2 * batch_size)
+
+    def test_callable_sink_streams_items(self):
+        """
+        Streaming sink:
+        - Items are handed to the callable instead of being accumulated.
+        - The result's destination stays empty; counts are still reported.
+        """
+        received = []
+        result = run_pipeline(
+            source=iter(range(40)),
+            buffer_capacity=3,
+            num_producers=2,
+            num_consumers=3,
+            batch_size=4,
+            sink=received.append,
+        )
+
+        self.assertEqual(result.destination, [])
+        self.assertEqual(sorted(received), list(range(40)))
+        self.assertEqual(result.produced_count, 40)
+        self.assertEqual(result.consumed_count, 40)
+
+    def test_generator_sink_is_primed_and_closed(self):
+        received = []
+        closed = []
+
+        def collector():
+            try:
+                while True:
+                    received.append((yield))
+            finally:
+                closed.append(True)
+
+        run_pipeline(source=range(10), sink=collector())
+
+        self.assertEqual(received, list(range(10)))
+        self.assertEqual(closed, [True])
+
+    def test_process_backend_with_sink(self):
+        received = []
+        result = run_pipeline(
+            source=(x for x in range(30)),
+            num_producers=2,
+            num_consumers=2,
+            backend="process",
+            sink=received.append,
+        )
+        self.assertEqual(sorted(received), list(range(30)))
+        self.assertEqual(result.produced_count, 30)
+        self.assertEqual(result.consumed_count, 30)
+
+    def test_process_backend_unpicklable_result_is_reraised(self):
+        """
+        A result that cannot be pickled back to the parent must fail the
+        run, not be dropped while the pipeline reports success.
+        """
+        with self.assertRaises(Exception) as ctx:
+            run_pipeline(
+                source=range(20),
+                num_consumers=2,
+                transform=_lambda_for_thirteen,
+                backend="process",
+                log_items=False,
+            )
+        self.assertIn("lambda", str(ctx.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
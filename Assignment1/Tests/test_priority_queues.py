@@ -0,0 +1,130 @@
+"""
+Unit tests for PriorityBlockingQueue and FairShareBlockingQueue.
+
+These tests validate:
+- Priority ordering with FIFO among equal keys
+- Weighted interleaving across lanes and work-conserving behavior
+- Bounded capacity / backpressure inherited from BoundedBlockingQueue
+- Use through run_pipeline(queue_factory=...)
+"""
+
+import threading
+import time
+import unittest
+
+from blocking_queue import QueueClosed
+from pipeline import run_pipeline
+from priority_queues import FairShareBlockingQueue, PriorityBlockingQueue
+
+
+class TestPriorityBlockingQueue(unittest.TestCase):
+
+    def test_lowest_key_first_and_fifo_for_ties(self):
+        q = PriorityBlockingQueue(capacity=10, key=lambda item: item[0])
+        q.put_many([(5, "bulk-a"), (1, "retry"), (5, "bulk-b"), (0, "interactive")])
+        self.assertEqual(
+            [payload for _, payload in q.get_many(10)],
+            ["interactive", "retry", "bulk-a", "bulk-b"],
+        )
+
+    def test_items_need_not_be_comparable(self):
+        q = PriorityBlockingQueue(capacity=2, key=lambda item: 0)
+        first, second = object(), object()
+        q.put(first)
+        q.put(second)
+        self.assertIs(q.get(), first)
+        self.assertIs(q.get(), second)
+
+    def test_backpressure_and_close_are_inherited(self):
+        q = PriorityBlockingQueue(capacity=1)
+        q.put(1)
+        with self.assertRaises(TimeoutError):
+            q.put(0, timeout=0.05)
+        q.close()
+        self.assertEqual(q.get(), 1)
+        with self.assertRaises(QueueClosed):
+            q.get()
+
+
+class TestFairShareBlockingQueue(unittest.TestCase):
+
+    def _queue(self, capacity=100):
+        return FairShareBlockingQueue(
+            capacity=capacity,
+            weights={"interactive": 3, "bulk": 1},
+            lane=lambda item: item[0],
+        )
+
+    def test_weighted_interleaving(self):
+        q = self._queue()
+        q.put_many([("bulk", i) for i in range(20)])
+        q.put_many([("interactive", i) for i in range(20)])
+
+        first_eight = [lane for lane, _ in q.get_many(8)]
+        self.assertEqual(first_eight.count("interactive"), 6)
+        self.assertEqual(first_eight.count("bulk"), 2)
+
+    def test_work_conserving_when_one_lane_is_empty(self):
+        q = self._queue()
+        q.put_many([("bulk", i) for i in range(5)])
+        self.assertEqual(q.get_many(5), [("bulk", i) for i in range(5)])
+        self.assertEqual(q.lane_sizes(), {"interactive": 0, "bulk": 0})
+
+    def test_ratio_holds_after_a_lane_empties_and_refills(self):
+        q = FairShareBlockingQueue(
+            capacity=1000, weights={"a": 2, "b": 5, "c": 1}, lane=lambda item: item[0]
+        )
+        q.put_many([(name, i) for name in "bc" for i in range(100)])
+        for _ in range(2):
+            q.put_many([("a", 0), ("a", 1)])
+            while q.lane_sizes()["a"]:
+                q.get()
+        q.put_many([("a", i) for i in range(100)])
+
+        one_round = [name for name, _ in q.get_many(8)]
+        self.assertEqual(
+            [one_round.count(name) for name in "abc"], [2, 5, 1], one_round
+        )
+
+    def test_invalid_configuration_rejected(self):
+        with self.assertRaises(ValueError):
+            FairShareBlockingQueue(4, weights={}, lane=lambda item: item)
+        with self.assertRaises(ValueError):
+            FairShareBlockingQueue(4, weights={"a": 0}, lane=lambda item: item)
+        with self.assertRaises(ValueError):
+            self._queue().put(("unknown", 1))
+
+    def test_capacity_shared_across_lanes(self):
+        q = self._queue(capacity=2)
+        q.put(("bulk", 1))
+        q.put(("interactive", 1))
+        blocked = threading.Thread(target=q.put, args=(("interactive", 2),))
+        blocked.start()
+        time.sleep(0.1)
+        self.assertTrue(blocked.is_alive(), "put() should block when all lanes are full")
+        q.get()
+        blocked.join(timeout=1.0)
+        self.assertFalse(blocked.is_alive())
+
+
+class TestSchedulingInPipeline(unittest.TestCase):
+
+    def test_priority_queue_factory(self):
+        result = run_pipeline(
+            source=[(3, "c"), (1, "a"), (2, "b")],
+            buffer_capacity=10,
+            queue_factory=lambda capacity: PriorityBlockingQueue(capacity),
+        )
+        self.assertEqual(sorted(result.destination), [(1, "a"), (2, "b"), (3, "c")])
+
+    def test_queue_factory_requires_thread_backend(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(
+                source=[1],
+                backend="process",
+                queue_factory=PriorityBlockingQueue,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Unit tests for consumer error handling.
+
+These tests validate:
+- RetryingTransform retries with backoff, then dead-letters or re-raises
+- A poison item is dead-lettered without stalling the pipeline
+- A fatal error stops and unblocks every worker and is re-raised by
+  run_pipeline (thread and process backends), instead of hanging
+"""
+
+import os
+import threading
+import unittest
+
+from pipeline import run_pipeline
+from retry import DEAD_LETTERED, RetryingTransform
+
+
+def _fail_on_seven(x):
+    # Module-level so it can be pickled for the process backend.
+    if x == 7:
+        raise ValueError("poison item")
+    return x
+
+
+def _exit_on_seven(x):
+    # Simulates a worker process killed mid-run: no exception, no message.
+    if x == 7:
+        os._exit(3)
+    return x
+
+
+class TestRetryingTransform(unittest.TestCase):
+
+    def test_transient_failure_is_retried(self):
+        attempts = []
+
+        def flaky(x):
+            attempts.append(x)
+            if len(attempts) < 3:
+                raise ConnectionError("transient")
+            return x * 2
+
+        transform = RetryingTransform(flaky, retries=3, backoff=0.001)
+        self.assertEqual(transform(21), 42)
+        self.assertEqual(transform.retry_count, 2)
+
+    def test_exhausted_retries_dead_letter_or_raise(self):
+        dead = []
+        transform = RetryingTransform(
+            _fail_on_seven, retries=1, dead_letter=lambda item, error: dead.append((item, str(error)))
+        )
+        self.assertIs(transform(7), DEAD_LETTERED)
+        self.assertEqual(dead, [(7, "poison item")])
+        self.assertEqual(transform.dead_lettered_count, 1)
+
+        with self.assertRaises(ValueError):
+            RetryingTransform(_fail_on_seven, retries=2)(7)
+
+    def test_invalid_settings_rejected(self):
+        with self.assertRaises(ValueError):
+            RetryingTransform(_fail_on_seven, retries=-1)
+
+
+class TestPipelineErrorHandling(unittest.TestCase):
+
+    def test_poison_item_is_dead_lettered(self):
+        dead = []
+        result = run_pipeline(
+            source=range(20),
+            num_consumers=3,
+            transform=_fail_on_seven,
+            retries=2,
+            dead_letter=lambda item, error: dead.append(item),
+            log_items=False,
+        )
+        self.assertEqual(sorted(result.destination), [x for x in range(20) if x != 7])
+        self.assertEqual(dead, [7])
+        self.assertEqual(result.dead_lettered_count, 1)
+
+    def test_dead_lettered_item_keeps_ordered_output_flowing(self):
+        result = run_pipeline(
+            source=range(20),
+            batch_size=3,
+            num_consumers=3,
+            transform=_fail_on_seven,
+            dead_letter=lambda item, error: None,
+            ordered=True,
+            log_items=False,
+        )
+        self.assertEqual(result.destination, [x for x in range(20) if x != 7])
+        self.assertEqual(result.consumed_count, len(result.destination))
+
+    def test_fatal_error_unblocks_and_is_reraised(self):
+        """
+        Without a dead-letter sink the poison item is fatal. The producer
+        is mid-way through a long source with a tiny queue, so without
+        propagation it would block on put() forever.
+        """
+        outcome = []
+
+        def run():
+            try:
+                run_pipeline(
+                    source=range(100_000),
+                    buffer_capacity=2,
+                    num_consumers=2,
+                    transform=_fail_on_seven,
+                    log_items=False,
+                )
+            except ValueError as exc:
+                outcome.append(exc)
+
+        t = threading.Thread(target=run)
+        t.start()
+        t.join(timeout=5.0)
+        self.assertFalse(t.is_alive(), "Pipeline hung after a fatal error")
+        self.assertEqual([str(exc) for exc in outcome], ["poison item"])
+
+    def test_source_error_is_reraised(self):
+        def broken_source():
+            yield 1
+            raise RuntimeError("source failed")
+
+        with self.assertRaises(RuntimeError):
+            run_pipeline(source=broken_source(), num_consumers=2, log_items=False)
+
+    def test_process_backend_fatal_error_is_reraised(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(
+                source=range(10_000),
+                buffer_capacity=2,
+                num_consumers=2,
+                transform=_fail_on_seven,
+                backend="process",
+                log_items=False,
+            )
+
+    def test_process_backend_dead_worker_is_reported(self):
+        """
+        A worker process that dies without sending its final message must
+        fail the run instead of leaving the parent waiting forever.
+        """
+        outcome = []
+
+        def run():
+            try:
+                run_pipeline(
+                    source=range(1000),
+                    buffer_capacity=4,
+                    num_consumers=2,
+                    transform=_exit_on_seven,
+                    backend="process",
+                    log_items=False,
+                )
+            except RuntimeError as exc:
+                outcome.append(exc)
+
+        t = threading.Thread(target=run)
+        t.start()
+        t.join(timeout=10.0)
+        self.assertFalse(t.is_alive(), "Parent hung after a worker process died")
+        self.assertEqual(len(outcome), 1)
+        self.assertIn("exited with code 3", str(outcome[0]))
+
+    def test_retries_require_thread_backend(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[1], transform=_fail_on_seven, retries=1, backend="process")
+
+
+if __name__ == "__main__":
+    unittest.main()
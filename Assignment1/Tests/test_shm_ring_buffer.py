@@ -0,0 +1,136 @@
+"""
+Unit tests for SharedMemoryRingBuffer.
+
+These tests validate:
+- put/get of bytes payloads returned as zero-copy memoryviews
+- Views are released (and their room reclaimed) on the next get
+- Frames wrap around the end of the ring without corruption
+- Blocking, timeouts and close() follow the BoundedBlockingQueue contract
+- Use as the process-backend channel in run_pipeline
+"""
+
+import threading
+import time
+import unittest
+
+from blocking_queue import QueueClosed
+from pipeline import run_pipeline
+from shm_ring_buffer import SharedMemoryRingBuffer
+
+
+def _byte_sum(view):
+    # Module-level so it can be pickled for the process backend.
+    return sum(view)
+
+
+class TestSharedMemoryRingBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = SharedMemoryRingBuffer(capacity=256)
+
+    def tearDown(self):
+        self.ring.dispose()
+
+    def test_get_returns_view_released_on_next_get(self):
+        self.ring.put(b"hello")
+        self.ring.put(bytearray(b"world"))
+        first = self.ring.get()
+        self.assertIsInstance(first, memoryview)
+        self.assertTrue(first.readonly)
+        self.assertEqual(bytes(first), b"hello")
+
+        self.assertEqual(bytes(self.ring.get()), b"world")
+        with self.assertRaises(ValueError):
+            bytes(first)
+        self.ring.release()
+        self.assertEqual(self.ring.bytes_used(), 0)
+
+    def test_fifo_order_across_wraparound(self):
+        """
+        Payloads of varying sizes force frames to wrap at the end of
+        the ring; every payload must come back intact and in order.
+        """
+        for i in range(300):
+            payload = bytes([i % 256]) * (i % 37 + 1)
+            self.ring.put(payload)
+            self.assertEqual(bytes(self.ring.get()), payload)
+        self.ring.put_many([b"a", b"bb", b"ccc"])
+        self.assertEqual([bytes(v) for v in self.ring.get_many(5)], [b"a", b"bb", b"ccc"])
+
+    def test_producer_blocks_until_consumer_releases(self):
+        """
+        Concurrency scenario:
+        - The ring is full; a put must block.
+        - A consumer taking (and later releasing) frames unblocks it.
+        """
+        for _ in range(4):
+            self.ring.put(b"x" * 56)
+        done = threading.Event()
+
+        def producer_task():
+            self.ring.put(b"y" * 56)
+            done.set()
+
+        t = threading.Thread(target=producer_task)
+        t.start()
+        time.sleep(0.1)
+        self.assertFalse(done.is_set(), "put() should block on a full ring")
+
+        self.assertEqual(len(self.ring.get_many(4)), 4)
+        self.ring.release()
+        self.assertTrue(done.wait(timeout=1.0))
+        t.join(timeout=1.0)
+        self.assertEqual(bytes(self.ring.get()), b"y" * 56)
+
+    def test_timeouts_and_oversized_items(self):
+        with self.assertRaises(TimeoutError):
+            self.ring.get(timeout=0.05)
+        self.assertEqual(self.ring.get_many(3, timeout=0.05), [])
+        with self.assertRaises(ValueError):
+            self.ring.put(b"z" * 1024)
+
+    def test_close_drains_then_signals_end_of_stream(self):
+        self.ring.put(b"last")
+        self.ring.close()
+        self.assertTrue(self.ring.closed)
+        with self.assertRaises(QueueClosed):
+            self.ring.put(b"more")
+        self.assertEqual(bytes(self.ring.get()), b"last")
+        with self.assertRaises(QueueClosed):
+            self.ring.get()
+
+
+class TestSharedMemoryPipeline(unittest.TestCase):
+
+    def test_shared_memory_channel_with_transform(self):
+        source = [bytes([i % 256]) * (i % 50 + 1) for i in range(400)]
+        result = run_pipeline(
+            source=source,
+            batch_size=16,
+            num_consumers=2,
+            transform=_byte_sum,
+            backend="process",
+            channel="shared_memory",
+            channel_bytes=4096,
+            log_items=False,
+        )
+        self.assertEqual(sorted(result.destination), sorted(sum(p) for p in source))
+        self.assertEqual(result.consumed_count, len(source))
+
+    def test_shared_memory_channel_copies_untransformed_payloads(self):
+        source = [b"alpha", b"beta", b"gamma"]
+        result = run_pipeline(
+            source=source,
+            backend="process",
+            channel="shared_memory",
+            log_items=False,
+        )
+        self.assertEqual(result.destination, source)
+
+    def test_channel_requires_process_backend(self):
+        with self.assertRaises(ValueError):
+            run_pipeline(source=[b"x"], channel="shared_memory")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for SpillingBlockingQueue.
+
+These tests validate:
+- Producers never block: overflow beyond capacity spills to disk
+- FIFO order across memory, disk and interleaved put/get
+- Disk space is reclaimed once the spilled items are drained
+- close() semantics and use through run_pipeline
+"""
+
+import tempfile
+import threading
+import unittest
+
+from blocking_queue import QueueClosed
+from pipeline import run_pipeline
+from spill_queue import SpillingBlockingQueue
+
+
+class TestSpillingBlockingQueue(unittest.TestCase):
+
+    def test_overflow_spills_instead_of_blocking(self):
+        q = SpillingBlockingQueue(capacity=3)
+        for i in range(10):
+            q.put(i, timeout=0.01)
+        self.assertEqual(q.size(), 10)
+        self.assertEqual(q.spilled_count(), 7)
+        self.assertGreater(q.spilled_bytes(), 0)
+        self.assertEqual([q.get() for _ in range(10)], list(range(10)))
+
+    def test_fifo_with_interleaved_puts_and_gets(self):
+        """
+        Items put while older items are still on disk must also spill,
+        so they are served after the spilled ones.
+        """
+        q = SpillingBlockingQueue(capacity=2)
+        q.put_many(range(5))
+        self.assertEqual(q.get_many(3), [0, 1, 2])
+        q.put_many(["a", "b"])
+        q.put({"key": "c"})
+        received = []
+        while q.size():
+            received.extend(q.get_many(2))
+        self.assertEqual(received, [3, 4, "a", "b", {"key": "c"}])
+
+    def test_segment_file_is_reclaimed_after_drain(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            q = SpillingBlockingQueue(capacity=1, spill_dir=spill_dir)
+            q.put_many(range(4))
+            # get_many() reads through from memory into the spilled items.
+            self.assertEqual(q.get_many(4), [0, 1, 2, 3])
+            self.assertEqual(q.spilled_count(), 0)
+            self.assertEqual(q.spilled_bytes(), 0)
+            # Memory-only operation resumes after the drain.
+            q.put("fresh")
+            self.assertEqual(q.spilled_count(), 0)
+            self.assertEqual(q.get(), "fresh")
+
+    def test_close_delivers_spilled_items(self):
+        q = SpillingBlockingQueue(capacity=1)
+        self.assertTrue(q.offer("x"))
+        self.assertTrue(q.offer("y"))
+        q.close()
+        with self.assertRaises(QueueClosed):
+            q.put("z")
+        self.assertEqual(q.get(), "x")
+        self.assertEqual(q.get(), "y")
+        with self.assertRaises(QueueClosed):
+            q.get()
+
+    def test_burst_with_concurrent_consumer(self):
+        q = SpillingBlockingQueue(capacity=4)
+        received = []
+
+        def consumer_task():
+            try:
+                while True:
+                    received.extend(q.get_many(3))
+            except QueueClosed:
+                pass
+
+        t = threading.Thread(target=consumer_task)
+        t.start()
+        for start in range(0, 500, 7):
+            q.put_many(range(start, min(start + 7, 500)))
+        q.close()
+        t.join(timeout=5.0)
+        self.assertFalse(t.is_alive(), "Consumer did not finish (possible deadlock)")
+        self.assertEqual(received, list(range(500)))
+
+    def test_pipeline_with_spilling_queue(self):
+        result = run_pipeline(
+            source=range(300),
+            batch_size=10,
+            log_items=False,
+            queue_factory=lambda cap: SpillingBlockingQueue(cap),
+        )
+        self.assertEqual(result.destination, list(range(300)))
+
+
+if __name__ == "__main__":
+    unittest.main()
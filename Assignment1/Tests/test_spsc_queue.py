@@ -0,0 +1,144 @@
+"""
+Unit tests for SPSCQueue.
+
+These tests validate:
+- FIFO order through the lock-free fast path, including wraparound
+- Blocking on full/empty and wakeup by the other side
+- Timeouts, offer/poll and close() semantics matching BoundedBlockingQueue
+- A one-producer/one-consumer stress run without lost or reordered items
+- Automatic selection by run_pipeline for the 1:1 topology
+"""
+
+from typing import Any
+import threading
+import time
+import unittest
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+from pipeline import make_queue
+from spsc_queue import SPSCQueue
+
+
+class TestSPSCQueueBasic(unittest.TestCase):
+
+    def test_fifo_across_wraparound(self):
+        q = SPSCQueue(capacity=3)
+        for i in range(20):
+            q.put(i)
+            self.assertEqual(q.get(), i)
+        q.put_many(range(3))
+        self.assertEqual(q.size(), 3)
+        self.assertEqual(q.get_many(10), [0, 1, 2])
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            SPSCQueue(0)
+
+    def test_offer_poll_and_timeouts(self):
+        q = SPSCQueue(capacity=1)
+        self.assertEqual(q.poll(default="empty"), "empty")
+        with self.assertRaises(TimeoutError):
+            q.get(timeout=0.05)
+        self.assertEqual(q.get_many(1, timeout=0.05), [])
+        self.assertTrue(q.offer("a"))
+        self.assertFalse(q.offer("b"))
+        with self.assertRaises(TimeoutError):
+            q.put("b", timeout=0.05)
+        self.assertEqual(q.poll(), "a")
+
+    def test_close_drains_then_signals_end_of_stream(self):
+        q = SPSCQueue(capacity=2)
+        q.put(1)
+        q.close()
+        with self.assertRaises(QueueClosed):
+            q.put(2)
+        self.assertEqual(q.get(), 1)
+        with self.assertRaises(QueueClosed):
+            q.get()
+
+
+class TestSPSCQueueConcurrency(unittest.TestCase):
+
+    def test_blocked_consumer_is_woken_by_put(self):
+        q = SPSCQueue(capacity=1)
+        consumed: list[Any] = []
+        t = threading.Thread(target=lambda: consumed.append(q.get()))
+        t.start()
+        time.sleep(0.1)
+        self.assertEqual(consumed, [])
+
+        q.put("value")
+        t.join(timeout=1.0)
+        self.assertFalse(t.is_alive(), "Consumer was not woken (lost wakeup)")
+        self.assertEqual(consumed, ["value"])
+
+    def test_blocked_producer_is_woken_by_get(self):
+        q = SPSCQueue(capacity=1)
+        q.put("first")
+        t = threading.Thread(target=q.put, args=("second",))
+        t.start()
+        time.sleep(0.1)
+        self.assertTrue(t.is_alive(), "Producer should block on a full queue")
+
+        self.assertEqual(q.get(), "first")
+        t.join(timeout=1.0)
+        self.assertFalse(t.is_alive(), "Producer was not woken (lost wakeup)")
+        self.assertEqual(q.get(), "second")
+
+    def test_close_wakes_blocked_consumer(self):
+        q = SPSCQueue(capacity=1)
+        outcome: list[Any] = []
+
+        def consume():
+            try:
+                q.get()
+            except QueueClosed:
+                outcome.append("closed")
+
+        t = threading.Thread(target=consume)
+        t.start()
+        time.sleep(0.1)
+        q.close()
+        t.join(timeout=1.0)
+        self.assertEqual(outcome, ["closed"])
+
+    def test_stress_one_producer_one_consumer(self):
+        """
+        Small capacity forces constant switching between the fast path and
+        the wait/notify slow path; nothing may be lost or reordered.
+        """
+        q = SPSCQueue(capacity=4)
+        received: list[int] = []
+        items = 50_000
+
+        def produce():
+            for i in range(0, items, 7):
+                q.put_many(range(i, min(i + 7, items)))
+            q.close()
+
+        def consume():
+            try:
+                while True:
+                    received.extend(q.get_many(5))
+            except QueueClosed:
+                pass
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10.0)
+            self.assertFalse(t.is_alive(), "SPSC stress run deadlocked")
+        self.assertEqual(received, list(range(items)))
+
+
+class TestQueueSelection(unittest.TestCase):
+
+    def test_make_queue_picks_spsc_only_for_one_to_one(self):
+        self.assertIsInstance(make_queue(4, 1, 1), SPSCQueue)
+        self.assertIsInstance(make_queue(4, 2, 1), BoundedBlockingQueue)
+        self.assertIsInstance(make_queue(4, 1, 3), BoundedBlockingQueue)
+
+
+if __name__ == "__main__":
+    unittest.main()
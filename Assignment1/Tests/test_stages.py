@@ -0,0 +1,106 @@
+"""
+Unit tests for the multi-stage Pipeline builder.
+
+These tests validate:
+- Items flow through every stage's transform in order
+- Per-stage worker pools shut down cleanly (no deadlock)
+- Sinks receive the output of the last stage
+- An error in any stage stops the whole pipeline and is re-raised
+- Invalid configurations are rejected
+"""
+
+import threading
+import unittest
+
+from stages import Pipeline
+
+
+class TestStagePipeline(unittest.TestCase):
+
+    def test_single_worker_stages_preserve_order(self):
+        """
+        Two single-worker stages compose like function application and
+        keep FIFO order end to end.
+        """
+        result = (
+            Pipeline()
+            .stage(lambda x: x + 1, capacity=2)
+            .stage(lambda x: x * 10, capacity=1)
+            .run(range(20))
+        )
+
+        self.assertEqual(result.destination, [(x + 1) * 10 for x in range(20)])
+        self.assertEqual(result.produced_count, 20)
+        self.assertEqual(result.consumed_count, 20)
+
+    def test_parallel_stages_deliver_every_item(self):
+        """
+        Stages with several workers each must still deliver every item
+        exactly once and cascade shutdown through all stages.
+        """
+        result = (
+            Pipeline(batch_size=4)
+            .stage(str, workers=4, capacity=8)
+            .stage(len, workers=2)
+            .stage(lambda n: n * 2, workers=3)
+            .run(range(300))
+        )
+
+        self.assertEqual(
+            sorted(result.destination), sorted(len(str(x)) * 2 for x in range(300))
+        )
+
+    def test_sink_receives_last_stage_output(self):
+        received = []
+        result = (
+            Pipeline()
+            .stage(lambda x: x * x, workers=2)
+            .sink(received.append)
+            .run(range(10))
+        )
+
+        self.assertEqual(result.destination, [])
+        self.assertEqual(sorted(received), [x * x for x in range(10)])
+
+    def test_middle_stage_error_stops_every_stage(self):
+        """
+        A failing middle stage must stop the producer and the other stages
+        (which would otherwise block on full queues) and surface its error.
+        """
+        def explode(x):
+            if x == 50:
+                raise ValueError("bad item")
+            return x
+
+        errors = []
+
+        def run():
+            try:
+                (
+                    Pipeline(log_items=False)
+                    .stage(lambda x: x + 1, workers=2, capacity=2)
+                    .stage(explode, workers=2, capacity=2)
+                    .stage(str, capacity=2)
+                    .run(range(1_000_000))
+                )
+            except ValueError as exc:
+                errors.append(exc)
+
+        runner = threading.Thread(target=run, daemon=True)
+        runner.start()
+        runner.join(timeout=10)
+
+        self.assertFalse(runner.is_alive(), "pipeline did not stop after a stage failed")
+        self.assertEqual([str(error) for error in errors], ["bad item"])
+
+    def test_invalid_configuration_rejected(self):
+        with self.assertRaises(ValueError):
+            Pipeline().run([1])
+        with self.assertRaises(ValueError):
+            Pipeline().stage(str, workers=0)
+        with self.assertRaises(ValueError):
+            Pipeline().stage(str, capacity=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
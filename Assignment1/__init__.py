@@ -4,12 +4,45 @@ Assignment 1: Producer–Consumer pattern with thread synchronization.
 This package contains:
 - A bounded blocking queue implementation.
 - Producer and consumer thread classes.
-- A pipeline that wires them together.
+- A pipeline that wires them together (thread, process and asyncio variants).
 """
 
-from .blocking_queue import BoundedBlockingQueue
+from .async_queue import AsyncBoundedQueue
+from .autoscale import AutoscalePolicy
+from .blocking_queue import BoundedBlockingQueue, QueueClosed
+from .byte_queue import ByteBoundedBlockingQueue
+from .metrics import InstrumentedBlockingQueue, PipelineMetrics
+from .priority_queues import FairShareBlockingQueue, PriorityBlockingQueue
+from .process_backend import ProcessBlockingQueue
 from .producer import Producer
-from .consumer import Consumer
-from .pipeline import run_pipeline
+from .retry import RetryingTransform
+from .shm_ring_buffer import SharedMemoryRingBuffer
+from .spill_queue import SpillingBlockingQueue
+from .spsc_queue import SPSCQueue
+from .consumer import Consumer, NO_SENTINEL
+from .pipeline import run_pipeline, run_pipeline_async
+from .stages import Pipeline, Stage
 
-__all__ = ["BoundedBlockingQueue", "Producer", "Consumer", "run_pipeline"]
+__all__ = [
+    "AsyncBoundedQueue",
+    "AutoscalePolicy",
+    "BoundedBlockingQueue",
+    "ByteBoundedBlockingQueue",
+    "FairShareBlockingQueue",
+    "InstrumentedBlockingQueue",
+    "PipelineMetrics",
+    "PriorityBlockingQueue",
+    "ProcessBlockingQueue",
+    "QueueClosed",
+    "SharedMemoryRingBuffer",
+    "SpillingBlockingQueue",
+    "SPSCQueue",
+    "Producer",
+    "RetryingTransform",
+    "Consumer",
+    "NO_SENTINEL",
+    "Pipeline",
+    "Stage",
+    "run_pipeline",
+    "run_pipeline_async",
+]
@@ -0,0 +1,234 @@
+"""
+async_queue.py
+
+Asyncio-native bounded queue with the same capacity/backpressure
+contract as BoundedBlockingQueue.
+
+Coroutines await on asyncio.Condition variables instead of blocking a
+thread. Thread-safe bridging methods let code running in ordinary
+threads feed (or drain) the queue without busy-waiting: the calling
+thread blocks on a concurrent future that the event loop resolves.
+"""
+
+import asyncio
+from typing import Any, Iterable, List, Optional
+
+from blocking_queue import QueueClosed
+
+
+class AsyncBoundedQueue:
+    """
+    A bounded queue for asyncio code.
+
+    - `await put(item)` suspends while the queue is full.
+    - `await get()` suspends while the queue is empty.
+    - put_many()/get_many() move a batch under a single lock acquisition.
+    - *_threadsafe() variants may be called from other threads.
+    - close() signals end-of-stream out of band, with the same semantics
+      as BoundedBlockingQueue.close().
+
+    Storage is the same fixed-size ring buffer as BoundedBlockingQueue.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        self._capacity = capacity
+        self._slots: List[Any] = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._closed = False
+
+        # The loop is bound explicitly or on first use from a coroutine;
+        # bridging methods need it to schedule work from other threads.
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+    # ---------- Ring buffer primitives (caller must hold the lock) ----------
+
+    def _append(self, item: Any) -> None:
+        self._slots[self._tail] = item
+        self._tail += 1
+        if self._tail == self._capacity:
+            self._tail = 0
+        self._count += 1
+
+    def _popleft(self) -> Any:
+        item = self._slots[self._head]
+        self._slots[self._head] = None
+        self._head += 1
+        if self._head == self._capacity:
+            self._head = 0
+        self._count -= 1
+        return item
+
+    def _bind_loop(self) -> None:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+    # ---------- Coroutine API ----------
+
+    async def put(self, item: Any) -> None:
+        """
+        Put an item, suspending while the queue is full.
+
+        Raises QueueClosed if the queue is (or becomes) closed.
+        """
+        self._bind_loop()
+        async with self._not_full:
+            await self._not_full.wait_for(self._has_space)
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            self._append(item)
+            self._not_empty.notify()
+
+    async def get(self) -> Any:
+        """
+        Remove and return an item, suspending while the queue is empty.
+
+        Raises QueueClosed once the queue is closed and fully drained.
+        """
+        self._bind_loop()
+        async with self._not_empty:
+            await self._not_empty.wait_for(self._has_item)
+            if not self._count:
+                raise QueueClosed("Queue is closed and drained")
+            item = self._popleft()
+            self._not_full.notify()
+            return item
+
+    async def put_many(self, items: Iterable[Any]) -> None:
+        """
+        Put a batch of items, preserving their order.
+
+        Suspends only for the part of the batch that does not fit.
+        Raises QueueClosed if the queue is closed before the batch fits.
+        """
+        self._bind_loop()
+        batch = list(items)
+        index = 0
+        total = len(batch)
+        async with self._not_full:
+            while index < total:
+                await self._not_full.wait_for(self._has_space)
+                if self._closed:
+                    raise QueueClosed("Cannot put into a closed queue")
+                moved = min(self._capacity - self._count, total - index)
+                for item in batch[index:index + moved]:
+                    self._append(item)
+                index += moved
+                self._not_empty.notify(moved)
+
+    async def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to `max_items` items in FIFO order.
+
+        Suspends until at least one item is available. If `timeout` is
+        given and expires first, an empty list is returned. Raises
+        QueueClosed once the queue is closed and fully drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+
+        self._bind_loop()
+        async with self._not_empty:
+            try:
+                await asyncio.wait_for(self._not_empty.wait_for(self._has_item), timeout)
+            except asyncio.TimeoutError:
+                return []
+            if not self._count:
+                raise QueueClosed("Queue is closed and drained")
+
+            taken = min(max_items, self._count)
+            items = [self._popleft() for _ in range(taken)]
+            self._not_full.notify(taken)
+            return items
+
+    async def close(self) -> None:
+        """
+        Close the queue and wake every waiting coroutine.
+
+        Further puts raise QueueClosed. Items already queued can still be
+        retrieved; once they are drained, get()/get_many() raise
+        QueueClosed, signalling end-of-stream without an in-band sentinel.
+        """
+        self._bind_loop()
+        async with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def _has_space(self) -> bool:
+        return self._closed or self._count < self._capacity
+
+    def _has_item(self) -> bool:
+        return self._closed or self._count > 0
+
+    # ---------- Thread-safe bridging ----------
+
+    def _run_threadsafe(self, coro: Any, timeout: Optional[float]) -> Any:
+        if self._loop is None:
+            coro.close()
+            raise RuntimeError(
+                "AsyncBoundedQueue is not bound to an event loop; pass loop= "
+                "or use it from a coroutine first"
+            )
+        # Apply the timeout inside the loop so a timed-out operation is
+        # cancelled there and cannot complete later (e.g. dropping an item).
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(coro, timeout), self._loop
+        )
+        return future.result()
+
+    def put_threadsafe(self, item: Any, timeout: Optional[float] = None) -> None:
+        """
+        Put an item from a non-event-loop thread.
+
+        The calling thread blocks (without spinning) until the event loop
+        has accepted the item, so backpressure reaches thread producers.
+        Raises TimeoutError if `timeout` expires first. Must not be called
+        from the loop's own thread.
+        """
+        self._run_threadsafe(self.put(item), timeout)
+
+    def put_many_threadsafe(self, items: Iterable[Any], timeout: Optional[float] = None) -> None:
+        """Put a batch from a non-event-loop thread with a single loop hop."""
+        self._run_threadsafe(self.put_many(list(items)), timeout)
+
+    def get_threadsafe(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return an item from a non-event-loop thread."""
+        return self._run_threadsafe(self.get(), timeout)
+
+    def get_many_threadsafe(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove up to `max_items` items from a non-event-loop thread.
+
+        Returns an empty list if `timeout` expires first, like get_many().
+        """
+        return self._run_threadsafe(self.get_many(max_items, timeout), None)
+
+    def close_threadsafe(self) -> None:
+        """Close the queue from a non-event-loop thread."""
+        self._run_threadsafe(self.close(), None)
+
+    # ---------- Introspection ----------
+
+    def size(self) -> int:
+        """Return current number of items in the queue."""
+        return self._count
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
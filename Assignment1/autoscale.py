@@ -0,0 +1,139 @@
+"""
+autoscale.py
+
+Adaptive sizing of a pipeline's consumer pool.
+
+An Autoscaler thread samples the shared queue every `interval` seconds
+and grows or shrinks the pool between `min_consumers` and
+`max_consumers`:
+
+- Scale up when the queue is filling (occupancy at or above
+  `scale_up_occupancy`) or producers are blocked on a full queue.
+- Scale down when the queue is nearly empty and consumers spend most of
+  their time waiting for items.
+
+Hysteresis keeps the pool from flapping: the up and down occupancy
+thresholds are apart, a signal must hold for several consecutive samples
+before acting, and the pool changes by one consumer per decision.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, List
+
+from consumer import Consumer
+from metrics import InstrumentedBlockingQueue
+
+
+@dataclass
+class AutoscalePolicy:
+    """Bounds, thresholds and pacing for consumer autoscaling."""
+    min_consumers: int = 1
+    max_consumers: int = 8
+    interval: float = 0.1
+    scale_up_occupancy: float = 0.75
+    scale_down_occupancy: float = 0.25
+    # Fraction of the interval producers spent blocked on a full queue
+    # that counts as "consumer-bound".
+    scale_up_blocked: float = 0.2
+    # Fraction of consumer time spent waiting on an empty queue that
+    # counts as "over-provisioned".
+    scale_down_idle: float = 0.5
+    scale_up_after: int = 2
+    scale_down_after: int = 5
+
+    def __post_init__(self) -> None:
+        if self.min_consumers <= 0:
+            raise ValueError("min_consumers must be positive")
+        if self.max_consumers < self.min_consumers:
+            raise ValueError("max_consumers must be at least min_consumers")
+        if self.interval <= 0:
+            raise ValueError("Autoscale interval must be positive")
+        if not 0 <= self.scale_down_occupancy < self.scale_up_occupancy <= 1:
+            raise ValueError("Occupancy thresholds must satisfy 0 <= down < up <= 1")
+        if self.scale_up_after <= 0 or self.scale_down_after <= 0:
+            raise ValueError("scale_up_after and scale_down_after must be positive")
+
+
+class Autoscaler(threading.Thread):
+    """
+    Daemon thread that resizes `consumers` until stop() is called.
+
+    `start_consumer()` must create, start and return a new Consumer; the
+    autoscaler appends it to `consumers`. Scaling down calls stop() on
+    the most recently added active consumer, which exits after its
+    current item, so nothing is lost. Consumers should be created with a
+    `poll_interval` so idle ones notice stop() promptly.
+    """
+
+    def __init__(
+        self,
+        queue: InstrumentedBlockingQueue,
+        policy: AutoscalePolicy,
+        consumers: List[Consumer],
+        start_consumer: Callable[[], Consumer],
+    ) -> None:
+        super().__init__(name="AutoscalerThread", daemon=True)
+        self._queue = queue
+        self._policy = policy
+        self._consumers = consumers
+        self._start_consumer = start_consumer
+        self._stopped = threading.Event()
+        self._hot = 0
+        self._cold = 0
+        self.peak_consumers = len(self.active())
+
+    def active(self) -> List[Consumer]:
+        """Return the consumers that have not been asked to stop."""
+        return [consumer for consumer in self._consumers if not consumer.stopping]
+
+    def step(self, occupancy: float, producer_blocked: float, consumer_idle: float, active: int) -> int:
+        """
+        Feed one sample and return the pool change to apply: +1, -1 or 0.
+
+        `occupancy` is queue size / capacity, and `producer_blocked` and
+        `consumer_idle` are the fractions of the interval spent waiting.
+        """
+        policy = self._policy
+        if occupancy >= policy.scale_up_occupancy or producer_blocked >= policy.scale_up_blocked:
+            self._hot += 1
+            self._cold = 0
+        elif occupancy <= policy.scale_down_occupancy and consumer_idle >= policy.scale_down_idle:
+            self._cold += 1
+            self._hot = 0
+        else:
+            self._hot = self._cold = 0
+
+        if self._hot >= policy.scale_up_after and active < policy.max_consumers:
+            self._hot = 0
+            return 1
+        if self._cold >= policy.scale_down_after and active > policy.min_consumers:
+            self._cold = 0
+            return -1
+        return 0
+
+    def run(self) -> None:
+        interval = self._policy.interval
+        capacity = self._queue.capacity
+        # Wait totals include waits still in progress, so a producer
+        # blocked across several samples shows up in each of them.
+        last_put_wait, last_get_wait = self._queue.wait_seconds()
+        while not self._stopped.wait(interval):
+            put_wait, get_wait = self._queue.wait_seconds()
+            active = self.active()
+            change = self.step(
+                occupancy=self._queue.size() / capacity,
+                producer_blocked=(put_wait - last_put_wait) / interval,
+                consumer_idle=(get_wait - last_get_wait) / (interval * max(1, len(active))),
+                active=len(active),
+            )
+            last_put_wait, last_get_wait = put_wait, get_wait
+            if change > 0:
+                self._consumers.append(self._start_consumer())
+                self.peak_consumers = max(self.peak_consumers, len(active) + 1)
+            elif change < 0:
+                active[-1].stop()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
@@ -3,10 +3,18 @@ blocking_queue.py
 
 Bounded blocking queue implemented using threading.Condition,
 demonstrating wait/notify-based synchronization.
+
+Items are stored in a fixed-size, preallocated circular buffer so that
+put() and get() are O(1) regardless of capacity.
 """
 
 import threading
-from typing import Any, List
+import time
+from typing import Any, Iterable, List, Optional
+
+
+class QueueClosed(Exception):
+    """Raised by put() on a closed queue, and by get() once it is also drained."""
 
 
 class BoundedBlockingQueue:
@@ -17,6 +25,14 @@ class BoundedBlockingQueue:
     - Block producers when the queue is full.
     - Block consumers when the queue is empty.
     - Coordinate threads via wait()/notify() on Condition variables.
+    - Support bounded waits (timeout=), non-blocking offer()/poll(), and
+      close() for out-of-band end-of-stream signalling.
+
+    Storage is a ring buffer: `_head` points at the oldest item,
+    `_tail` at the next free slot, and `_count` tracks occupancy.
+    Subclasses can change the ordering policy by overriding
+    _init_storage(), _append() and _popleft(); capacity accounting,
+    blocking and close() semantics stay here.
     """
 
     def __init__(self, capacity: int) -> None:
@@ -24,43 +40,197 @@ class BoundedBlockingQueue:
             raise ValueError("Queue capacity must be positive")
 
         self._capacity = capacity
-        self._buffer: List[Any] = []
+        self._count = 0
+        self._closed = False
+        self._init_storage()
 
         self._lock = threading.Lock()
         self._not_empty = threading.Condition(self._lock)
         self._not_full = threading.Condition(self._lock)
 
-    def put(self, item: Any) -> None:
+    # ---------- Ring buffer primitives (caller must hold the lock) ----------
+
+    def _init_storage(self) -> None:
+        self._slots: List[Any] = [None] * self._capacity
+        self._head = 0
+        self._tail = 0
+
+    def _append(self, item: Any) -> None:
+        self._slots[self._tail] = item
+        self._tail += 1
+        if self._tail == self._capacity:
+            self._tail = 0
+        self._count += 1
+
+    def _popleft(self) -> Any:
+        item = self._slots[self._head]
+        # Drop the reference so consumed items can be garbage collected.
+        self._slots[self._head] = None
+        self._head += 1
+        if self._head == self._capacity:
+            self._head = 0
+        self._count -= 1
+        return item
+
+    def _wait_for_space(self, timeout: Optional[float]) -> bool:
+        """Wait until a slot is free. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            if self._count < self._capacity:
+                return True
+            if deadline is None:
+                self._not_full.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._not_full.wait(remaining)
+
+    def _wait_for_item(self, timeout: Optional[float]) -> bool:
+        """Wait until an item is available. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._count:
+            if self._closed:
+                raise QueueClosed("Queue is closed and drained")
+            if deadline is None:
+                self._not_empty.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._not_empty.wait(remaining)
+        return True
+
+    # ---------- Public API ----------
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
         """
         Put an item into the queue.
         Blocks if the queue is full until space becomes available.
+
+        Raises TimeoutError if `timeout` seconds pass without space, and
+        QueueClosed if the queue is (or becomes) closed.
         """
         with self._not_full:
-            while len(self._buffer) >= self._capacity:
-                self._not_full.wait()
+            if not self._wait_for_space(timeout):
+                raise TimeoutError("Timed out waiting for queue space")
 
-            self._buffer.append(item)
+            self._append(item)
             # Notify one waiting consumer that an item is available.
             self._not_empty.notify()
 
-    def get(self) -> Any:
+    def get(self, timeout: Optional[float] = None) -> Any:
         """
         Remove and return an item from the queue.
         Blocks if the queue is empty until an item is available.
+
+        Raises TimeoutError if `timeout` seconds pass without an item, and
+        QueueClosed once the queue is closed and fully drained.
         """
         with self._not_empty:
-            while not self._buffer:
-                self._not_empty.wait()
+            if not self._wait_for_item(timeout):
+                raise TimeoutError("Timed out waiting for an item")
 
-            item = self._buffer.pop(0)
+            item = self._popleft()
             # Notify one waiting producer that space is available.
             self._not_full.notify()
             return item
 
+    def offer(self, item: Any) -> bool:
+        """
+        Put an item only if there is space right now.
+
+        Returns True if the item was enqueued, False if the queue is full.
+        Raises QueueClosed on a closed queue.
+        """
+        with self._lock:
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            if self._count >= self._capacity:
+                return False
+            self._append(item)
+            self._not_empty.notify()
+            return True
+
+    def poll(self, default: Any = None) -> Any:
+        """
+        Remove and return an item if one is available right now,
+        otherwise return `default`.
+        """
+        with self._lock:
+            if not self._count:
+                return default
+            item = self._popleft()
+            self._not_full.notify()
+            return item
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """
+        Put a batch of items into the queue, preserving their order.
+
+        As many items as fit are moved under a single lock acquisition;
+        the call blocks only for the part of the batch that does not fit.
+        Raises QueueClosed if the queue is closed before the batch fits;
+        items already enqueued stay in the queue.
+        """
+        batch = list(items)
+        index = 0
+        total = len(batch)
+        with self._not_full:
+            while index < total:
+                self._wait_for_space(None)
+
+                moved = min(self._capacity - self._count, total - index)
+                for item in batch[index:index + moved]:
+                    self._append(item)
+                index += moved
+                # Wake up to one consumer per newly available item.
+                self._not_empty.notify(moved)
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to `max_items` items in FIFO order.
+
+        Blocks until at least one item is available. If `timeout` is given
+        and expires first, an empty list is returned. Raises QueueClosed
+        once the queue is closed and fully drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+
+        with self._not_empty:
+            if not self._wait_for_item(timeout):
+                return []
+
+            taken = min(max_items, self._count)
+            items = [self._popleft() for _ in range(taken)]
+            # Wake up to one producer per freed slot.
+            self._not_full.notify(taken)
+            return items
+
+    def close(self) -> None:
+        """
+        Close the queue and wake every waiting thread.
+
+        Further puts raise QueueClosed. Items already queued can still be
+        retrieved; once they are drained, get()/get_many() raise
+        QueueClosed, signalling end-of-stream without an in-band sentinel.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
     def size(self) -> int:
         """Return current number of items in the queue (non-blocking)."""
         with self._lock:
-            return len(self._buffer)
+            return self._count
 
     @property
     def capacity(self) -> int:
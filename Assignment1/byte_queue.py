@@ -0,0 +1,137 @@
+"""
+byte_queue.py
+
+Bounded blocking queue whose capacity is a byte budget rather than an
+item count, so memory use stays predictable regardless of payload size.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional, Tuple
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+
+
+class ByteBoundedBlockingQueue(BoundedBlockingQueue):
+    """
+    A blocking queue bounded by the total size of the items it holds.
+
+    - `size_fn(item)` gives an item's size in bytes (default: len, which
+      suits bytes/bytearray/str payloads). It is evaluated once per item,
+      outside the lock.
+    - put() blocks while adding the item would exceed `max_bytes`.
+    - An item larger than the whole budget is admitted only when the
+      queue is empty, so it cannot wedge the producer forever.
+
+    Consumer-side behavior (get/get_many/poll, timeouts, close()) is
+    inherited from BoundedBlockingQueue; `capacity` reports `max_bytes`
+    and size() still reports the number of items.
+    """
+
+    def __init__(self, max_bytes: int, size_fn: Callable[[Any], int] = len) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._size_fn = size_fn
+        super().__init__(max_bytes)
+
+    # ---------- Storage (caller must hold the lock) ----------
+
+    def _init_storage(self) -> None:
+        self._items: Deque[Tuple[int, Any]] = deque()
+        self._bytes = 0
+
+    def _append_sized(self, item: Any, size: int) -> None:
+        self._items.append((size, item))
+        self._bytes += size
+        self._count += 1
+
+    def _append(self, item: Any) -> None:
+        self._append_sized(item, self._size_fn(item))
+
+    def _popleft(self) -> Any:
+        size, item = self._items.popleft()
+        self._bytes -= size
+        self._count -= 1
+        # Producers wait for different amounts of room; wake them all so
+        # any that now fit can proceed.
+        self._not_full.notify_all()
+        return item
+
+    def _fits(self, size: int) -> bool:
+        return self._bytes + size <= self._capacity or not self._count
+
+    def _wait_for_room(self, size: int, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            if self._fits(size):
+                return True
+            if deadline is None:
+                self._not_full.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._not_full.wait(remaining)
+
+    # ---------- Producer side ----------
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """
+        Put an item, blocking while it would exceed the byte budget.
+
+        Raises TimeoutError if `timeout` expires and QueueClosed if the
+        queue is closed.
+        """
+        size = self._size_fn(item)
+        with self._not_full:
+            if not self._wait_for_room(size, timeout):
+                raise TimeoutError("Timed out waiting for queue space")
+            self._append_sized(item, size)
+            self._not_empty.notify()
+
+    def offer(self, item: Any) -> bool:
+        """Put an item only if it fits in the byte budget right now."""
+        size = self._size_fn(item)
+        with self._lock:
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            if not self._fits(size):
+                return False
+            self._append_sized(item, size)
+            self._not_empty.notify()
+            return True
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """
+        Put a batch in order under one lock acquisition, blocking only
+        when the next item does not fit in the remaining budget.
+        """
+        sized: List[Tuple[Any, int]] = [(item, self._size_fn(item)) for item in items]
+        with self._not_full:
+            pending = 0
+            for item, size in sized:
+                if not self._fits(size):
+                    # Let consumers start on what we have before waiting.
+                    if pending:
+                        self._not_empty.notify(pending)
+                        pending = 0
+                    self._wait_for_room(size, None)
+                elif self._closed:
+                    raise QueueClosed("Cannot put into a closed queue")
+                self._append_sized(item, size)
+                pending += 1
+            if pending:
+                self._not_empty.notify(pending)
+
+    # ---------- Introspection ----------
+
+    def bytes_used(self) -> int:
+        """Return the total size of the queued items."""
+        with self._lock:
+            return self._bytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._capacity
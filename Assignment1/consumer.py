@@ -6,37 +6,200 @@ and stores items in a destination container.
 """
 
 import threading
-from typing import Any, List
+from typing import Any, Callable, List, Optional, Union
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+from logging_utils import DEBUG, get_logger
+from ordering import TaggedTransform
+from retry import DEAD_LETTERED, RetryingTransform
+
+# Pass as `sentinel` to disable in-band sentinel checks entirely; the
+# consumer then stops only when the queue is closed and drained.
+NO_SENTINEL = object()
 
-from blocking_queue import BoundedBlockingQueue
-from logging_utils import log
 
 class Consumer(threading.Thread):
     """
     Consumer thread.
 
     - Reads items from a BoundedBlockingQueue.
-    - Stores them into a destination container.
-    - Stops when it encounters the sentinel.
+    - With batch_size > 1, drains up to batch_size items per get_many().
+    - Optionally applies a per-item transform.
+    - Stores the results into a destination container, or hands them to
+      a callable sink one at a time so nothing accumulates in memory.
+    - Tracks `consumed_count` as items are stored.
+    - Logs each item at DEBUG (unless log_items=False) and, with
+      summary_every=N, a progress summary every N items at INFO.
+    - Stops when the queue is closed and drained, or when it encounters
+      the sentinel (unless sentinel=NO_SENTINEL). Each consumer must be
+      sent its own sentinel. A batched consumer hands back any other
+      consumers' sentinels it drained, but never data items.
+    - stop() asks the consumer to exit after the item (or batch) it is
+      handling. With `poll_interval`, gets wake up at least that often,
+      so an idle consumer notices stop() promptly instead of waiting
+      for its next item.
+    - A transform wrapped in RetryingTransform retries and dead-letters
+      failing items; dead-lettered items are dropped, not stored or
+      counted.
+    - Any other exception ends the thread: it is kept in `error` and
+      passed to `on_fatal`, so the owner can stop the rest of the
+      pipeline instead of hanging on a queue nobody drains.
     """
 
     def __init__(
         self,
         queue: BoundedBlockingQueue,
-        destination: List[Any],
+        destination: Union[List[Any], Callable[[Any], None]],
         sentinel: Any = None,
+        batch_size: int = 1,
+        transform: Optional[Callable[[Any], Any]] = None,
+        name: str = "ConsumerThread",
+        log_items: bool = True,
+        summary_every: int = 0,
+        poll_interval: Optional[float] = None,
+        on_fatal: Optional[Callable[[Exception], None]] = None,
     ) -> None:
-        super().__init__(name="ConsumerThread")
+        super().__init__(name=name)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self._queue = queue
+        # Lists are not callable, so anything callable is a streaming sink.
+        self._sink: Optional[Callable[[Any], None]] = (
+            destination if callable(destination) else None
+        )
         self._destination = destination
         self._sentinel = sentinel
+        self._batch_size = batch_size
+        self._transform = transform
+        self.consumed_count = 0
+        self._logger = get_logger()
+        self._log_items = log_items
+        self._summary_every = summary_every
+        self._poll_interval = poll_interval
+        self._stopping = False
+        self._on_fatal = on_fatal
+        # Only a RetryingTransform can yield DEAD_LETTERED, so plain
+        # transforms skip the per-item check.
+        self._drops = isinstance(transform, RetryingTransform)
+        # In ordered mode a dead-lettered (sequence, DEAD_LETTERED) pair
+        # must still reach the reorder buffer to release its turn, but it
+        # is not counted as consumed.
+        self._passes_dead = isinstance(transform, TaggedTransform) and isinstance(
+            transform.transform, RetryingTransform
+        )
+        self.error: Optional[Exception] = None
+
+    def stop(self) -> None:
+        """Ask the consumer to exit once its current item or batch is stored."""
+        self._stopping = True
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping
 
     def run(self) -> None:
-        while True:
-            item = self._queue.get()
-            if item == self._sentinel:
-                # No re-insertion needed since we have only one consumer.
-                log("Received sentinel, consumer exiting.")
-                break
-            self._destination.append(item)
-            log(f"Consumed {item} (queue size={self._queue.size()})")
+        try:
+            if self._batch_size == 1:
+                self._run_single()
+            else:
+                self._run_batched()
+        except QueueClosed:
+            self._logger.info(
+                "Queue closed and drained after %d items, consumer exiting.",
+                self.consumed_count,
+            )
+        except Exception as exc:
+            self.error = exc
+            self._logger.warning(
+                "Consumer failed after %d items: %r", self.consumed_count, exc
+            )
+            if self._on_fatal is not None:
+                self._on_fatal(exc)
+
+    def _run_single(self) -> None:
+        # Decide once whether sentinels are in use, so the hot path does a
+        # cheap boolean test instead of an equality check per item.
+        use_sentinel = self._sentinel is not NO_SENTINEL
+        logger = self._logger
+        log_items = self._log_items and logger.enabled_for(DEBUG)
+        every = self._summary_every
+        poll_interval = self._poll_interval
+        while not self._stopping:
+            try:
+                item = self._queue.get(poll_interval)
+            except TimeoutError:
+                continue
+            if use_sentinel and item == self._sentinel:
+                # No re-insertion needed: every consumer gets its own sentinel.
+                logger.info("Received sentinel, consumer exiting.")
+                return
+            counted = True
+            if self._transform is not None:
+                item = self._transform(item)
+                if self._drops and item is DEAD_LETTERED:
+                    continue
+                if self._passes_dead and item[1] is DEAD_LETTERED:
+                    counted = False
+            if self._sink is None:
+                self._destination.append(item)
+            else:
+                self._sink(item)
+            if counted:
+                self.consumed_count += 1
+            if log_items:
+                logger.debug("Consumed %s (queue size=%d)", item, self._queue.size())
+            if every and self.consumed_count % every == 0:
+                logger.info("Consumed %d items so far", self.consumed_count)
+        logger.info("Stopped after %d items, consumer exiting.", self.consumed_count)
+
+    def _run_batched(self) -> None:
+        use_sentinel = self._sentinel is not NO_SENTINEL
+        logger = self._logger
+        log_items = self._log_items and logger.enabled_for(DEBUG)
+        every = self._summary_every
+        poll_interval = self._poll_interval
+        while not self._stopping:
+            batch = self._queue.get_many(self._batch_size, poll_interval)
+            if not batch:
+                continue
+            if use_sentinel:
+                items = [item for item in batch if item != self._sentinel]
+                if len(items) < len(batch):
+                    # Data drained past our sentinel (e.g. from a producer
+                    # that is still running) is kept and stored here, in
+                    # order. Only surplus sentinels, which belong to other
+                    # consumers, are handed back; a single consumer never
+                    # has any, so an SPSC queue is never put to from here.
+                    self._store(self._apply(items))
+                    surplus = len(batch) - len(items) - 1
+                    if surplus:
+                        self._queue.put_many([self._sentinel] * surplus)
+                    logger.info("Received sentinel, consumer exiting.")
+                    return
+            self._store(self._apply(batch))
+            if log_items:
+                logger.debug(
+                    "Consumed batch of %d items (queue size=%d)",
+                    len(batch), self._queue.size(),
+                )
+            if every and self.consumed_count % every < len(batch):
+                logger.info("Consumed %d items so far", self.consumed_count)
+        logger.info("Stopped after %d items, consumer exiting.", self.consumed_count)
+
+    def _apply(self, batch: List[Any]) -> List[Any]:
+        if self._transform is None:
+            return batch
+        results = [self._transform(item) for item in batch]
+        if self._drops:
+            return [item for item in results if item is not DEAD_LETTERED]
+        return results
+
+    def _store(self, items: List[Any]) -> None:
+        if self._sink is None:
+            self._destination.extend(items)
+        else:
+            for item in items:
+                self._sink(item)
+        self.consumed_count += len(items)
+        if self._passes_dead:
+            self.consumed_count -= sum(1 for _, item in items if item is DEAD_LETTERED)
@@ -1,7 +1,174 @@
 # assignment1/logging_utils.py
+"""
+Low-overhead logging for pipeline threads.
+
+- Level-gated: a disabled message costs one integer comparison; its
+  arguments are never formatted.
+- Asynchronous: records are handed to a background writer thread through
+  a bounded BoundedBlockingQueue, so worker threads never wait on stdout
+  (only on a full buffer) and timestamps are formatted off the hot path.
+"""
+
+import atexit
+import sys
 import threading
-from datetime import datetime
+import time
+from typing import Any, List, Optional, TextIO, Tuple
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+# (thread name, creation time, message, args)
+Record = Tuple[str, float, str, Tuple[Any, ...]]
+
+
+class PipelineLogger:
+    """
+    Level-gated logger with an optional background writer thread.
+
+    Messages use %-style arguments (`logger.debug("Got %s", item)`) so
+    that formatting only happens for records that are actually written.
+    """
+
+    def __init__(
+        self,
+        level: int = DEBUG,
+        stream: Optional[TextIO] = None,
+        buffer_size: int = 1024,
+        asynchronous: bool = True,
+    ) -> None:
+        self.level = level
+        # None means "sys.stdout at write time", so redirection still works.
+        self._stream = stream
+        self._buffer: Optional[BoundedBlockingQueue] = (
+            BoundedBlockingQueue(buffer_size) if asynchronous else None
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._clock: Tuple[int, str] = (-1, "")
+
+    def enabled_for(self, level: int) -> bool:
+        return level >= self.level
+
+    def log(self, level: int, msg: str, *args: Any) -> None:
+        if level < self.level:
+            return
+        record: Record = (threading.current_thread().name, time.time(), msg, args)
+        if self._buffer is None:
+            self._write([record])
+            return
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._buffer.put(record)
+        except QueueClosed:
+            # Logger was closed (e.g. replaced by configure_logging) while a
+            # thread still holds it; fall back to writing synchronously.
+            self._write([record])
+
+    def debug(self, msg: str, *args: Any) -> None:
+        self.log(DEBUG, msg, *args)
+
+    def info(self, msg: str, *args: Any) -> None:
+        self.log(INFO, msg, *args)
+
+    def warning(self, msg: str, *args: Any) -> None:
+        self.log(WARNING, msg, *args)
+
+    def flush(self) -> None:
+        """Block until every record logged so far has been written."""
+        if self._buffer is None or self._writer is None or self._buffer.closed:
+            return
+        written = threading.Event()
+        self._buffer.put(written)
+        written.wait()
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        self.flush()
+        if self._buffer is not None:
+            self._buffer.close()
+        if self._writer is not None:
+            self._writer.join()
+
+    # ---------- Writer side ----------
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                writer = threading.Thread(
+                    target=self._drain, name="LogWriterThread", daemon=True
+                )
+                writer.start()
+                self._writer = writer
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                entries = self._buffer.get_many(256)
+            except QueueClosed:
+                return
+            records: List[Record] = []
+            for entry in entries:
+                if isinstance(entry, threading.Event):
+                    # flush() marker: everything before it is now written.
+                    self._write(records)
+                    records = []
+                    entry.set()
+                else:
+                    records.append(entry)
+            self._write(records)
+
+    def _write(self, records: List[Record]) -> None:
+        if not records:
+            return
+        stream = self._stream or sys.stdout
+        stream.write("".join(self._format(record) for record in records))
+        stream.flush()
+
+    def _format(self, record: Record) -> str:
+        name, created, msg, args = record
+        if args:
+            msg = msg % args
+        # Records arrive in bursts within the same second; reuse the text.
+        second = int(created)
+        if self._clock[0] != second:
+            self._clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        return f"[{name}] {self._clock[1]} - {msg}\n"
+
+
+_default_logger = PipelineLogger()
+
+
+def get_logger() -> PipelineLogger:
+    """Return the process-wide pipeline logger."""
+    return _default_logger
+
+
+def configure_logging(
+    level: int = DEBUG,
+    stream: Optional[TextIO] = None,
+    buffer_size: int = 1024,
+    asynchronous: bool = True,
+) -> PipelineLogger:
+    """
+    Replace the process-wide logger. Threads created afterwards use the
+    new one; the previous logger is flushed and closed.
+    """
+    global _default_logger
+    previous = _default_logger
+    _default_logger = PipelineLogger(level, stream, buffer_size, asynchronous)
+    previous.close()
+    return _default_logger
+
 
 def log(msg: str) -> None:
-    print(f"[{threading.current_thread().name}] "
-          f"{datetime.now().strftime('%H:%M:%S')} - {msg}")
+    """Log a lifecycle message at INFO level on the process-wide logger."""
+    _default_logger.info(msg)
+
+
+atexit.register(lambda: _default_logger.flush())
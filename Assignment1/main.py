@@ -8,6 +8,7 @@ Demonstrates:
 - Wait/notify mechanism via Condition
 """
 
+from logging_utils import get_logger
 from pipeline import run_pipeline
 
 def main() -> None:
@@ -16,9 +17,11 @@ def main() -> None:
     result = run_pipeline(
         source=source_items,
         buffer_capacity=3,
-        sentinel=None,  # Using None as sentinel; safe because items are strings
     )
 
+    # Log lines are written by a background thread; let them finish first.
+    get_logger().flush()
+
     print("=== Assignment 1: Producer–Consumer Demo ===")
     print("Source container:      ", source_items)
     print("Destination container: ", result.destination)
@@ -0,0 +1,236 @@
+"""
+metrics.py
+
+Optional instrumentation for the producer-consumer pipeline.
+
+InstrumentedBlockingQueue is a drop-in BoundedBlockingQueue subclass
+that records, under the queue's own lock:
+- time producers spend blocked on `_not_full` and consumers on `_not_empty`,
+  including waits still in progress,
+- an occupancy histogram sampled on every put,
+- per-item queue latency (enqueue -> dequeue), reservoir-sampled.
+
+The plain BoundedBlockingQueue is untouched, so pipelines that do not
+ask for metrics pay nothing.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from blocking_queue import BoundedBlockingQueue
+from ordering import ReorderBuffer
+
+
+class QueueMetrics:
+    """
+    Raw counters for one queue. All updates happen while the owning
+    queue holds its lock, so no extra synchronization is needed.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        histogram_buckets: int = 10,
+        latency_samples: int = 10_000,
+    ) -> None:
+        self.capacity = capacity
+        # Completed waits only; see wait_totals() for waits in progress.
+        self.put_wait_seconds = 0.0
+        self.get_wait_seconds = 0.0
+        # Waits in progress: how many, and the sum of their start times,
+        # so their elapsed time is waiters * now - started.
+        self.put_waiters = 0
+        self.put_wait_started = 0.0
+        self.get_waiters = 0
+        self.get_wait_started = 0.0
+        self.put_count = 0
+        self.get_count = 0
+        # Bucket i counts puts that left the queue between i/n and (i+1)/n
+        # full; the last bucket also includes "completely full".
+        self.occupancy_histogram: List[int] = [0] * histogram_buckets
+        self._latency_samples = latency_samples
+        self._latencies: List[float] = []
+        self._rng = random.Random(0)
+
+    def record_put(self, occupancy: int) -> None:
+        self.put_count += 1
+        buckets = len(self.occupancy_histogram)
+        index = min(occupancy * buckets // self.capacity, buckets - 1)
+        self.occupancy_histogram[index] += 1
+
+    def record_get(self, latency: float) -> None:
+        self.get_count += 1
+        # Reservoir sampling keeps memory bounded on long runs.
+        if len(self._latencies) < self._latency_samples:
+            self._latencies.append(latency)
+        else:
+            slot = self._rng.randrange(self.get_count)
+            if slot < self._latency_samples:
+                self._latencies[slot] = latency
+
+    def wait_totals(self, now: float) -> Tuple[float, float]:
+        """
+        Return (producer, consumer) wait seconds at `now`, counting the
+        elapsed part of waits that have not finished yet.
+        """
+        return (
+            self.put_wait_seconds + self.put_waiters * now - self.put_wait_started,
+            self.get_wait_seconds + self.get_waiters * now - self.get_wait_started,
+        )
+
+    def latency_percentiles(
+        self, percentiles: Sequence[float] = (50, 90, 99)
+    ) -> Dict[str, float]:
+        """Return {"p50": seconds, ...} over the sampled latencies."""
+        if not self._latencies:
+            return {f"p{p:g}": 0.0 for p in percentiles}
+        ordered = sorted(self._latencies)
+        last = len(ordered) - 1
+        return {
+            f"p{p:g}": ordered[min(last, round(p / 100 * last))] for p in percentiles
+        }
+
+
+class InstrumentedBlockingQueue(BoundedBlockingQueue):
+    """BoundedBlockingQueue that feeds a QueueMetrics instance."""
+
+    def __init__(self, capacity: int, metrics: Optional[QueueMetrics] = None) -> None:
+        super().__init__(capacity)
+        self.metrics = metrics or QueueMetrics(capacity)
+        self._enqueued_at: List[float] = [0.0] * capacity
+
+    def _append(self, item: Any) -> None:
+        self._enqueued_at[self._tail] = time.perf_counter()
+        super()._append(item)
+        self.metrics.record_put(self._count)
+
+    def _popleft(self) -> Any:
+        enqueued_at = self._enqueued_at[self._head]
+        item = super()._popleft()
+        self.metrics.record_get(time.perf_counter() - enqueued_at)
+        return item
+
+    def _wait_for_space(self, timeout: Optional[float]) -> bool:
+        if self._closed or self._count < self._capacity:
+            return super()._wait_for_space(timeout)
+        metrics = self.metrics
+        started = time.perf_counter()
+        metrics.put_waiters += 1
+        metrics.put_wait_started += started
+        try:
+            return super()._wait_for_space(timeout)
+        finally:
+            metrics.put_waiters -= 1
+            # Reset when idle so rounding in the running sum cannot drift.
+            if metrics.put_waiters:
+                metrics.put_wait_started -= started
+            else:
+                metrics.put_wait_started = 0.0
+            metrics.put_wait_seconds += time.perf_counter() - started
+
+    def _wait_for_item(self, timeout: Optional[float]) -> bool:
+        if self._count:
+            return True
+        metrics = self.metrics
+        started = time.perf_counter()
+        metrics.get_waiters += 1
+        metrics.get_wait_started += started
+        try:
+            return super()._wait_for_item(timeout)
+        finally:
+            metrics.get_waiters -= 1
+            if metrics.get_waiters:
+                metrics.get_wait_started -= started
+            else:
+                metrics.get_wait_started = 0.0
+            metrics.get_wait_seconds += time.perf_counter() - started
+
+    def wait_seconds(self) -> Tuple[float, float]:
+        """
+        Return (producer, consumer) wait seconds so far, including waits
+        still in progress, read consistently under the queue lock.
+        """
+        with self._lock:
+            return self.metrics.wait_totals(time.perf_counter())
+
+
+@dataclass
+class PipelineMetrics:
+    """Point-in-time (or final) view of a pipeline run."""
+    elapsed_seconds: float
+    produced_count: int
+    consumed_count: int
+    items_per_second: float
+    queue_size: int
+    producer_wait_seconds: float
+    consumer_wait_seconds: float
+    occupancy_histogram: List[int] = field(default_factory=list)
+    latency_percentiles: Dict[str, float] = field(default_factory=dict)
+    # Ordered pipelines only: the reorder window and the most results
+    # that were ever parked waiting for an earlier item.
+    reorder_window: int = 0
+    reorder_peak_pending: int = 0
+    # Consumers not asked to stop (changes over time with autoscaling).
+    consumer_count: int = 0
+
+
+def snapshot(
+    queue: InstrumentedBlockingQueue,
+    started: float,
+    produced_count: int,
+    consumed_count: int,
+    reorder: Optional[ReorderBuffer] = None,
+    consumer_count: int = 0,
+) -> PipelineMetrics:
+    """Build a PipelineMetrics from a queue's counters and worker counts."""
+    elapsed = time.perf_counter() - started
+    metrics = queue.metrics
+    producer_wait, consumer_wait = queue.wait_seconds()
+    # Counters are read without the queue lock: a snapshot taken while the
+    # pipeline runs may be a few items stale, which is fine for monitoring.
+    return PipelineMetrics(
+        elapsed_seconds=elapsed,
+        produced_count=produced_count,
+        consumed_count=consumed_count,
+        items_per_second=consumed_count / elapsed if elapsed > 0 else 0.0,
+        queue_size=queue.size(),
+        producer_wait_seconds=producer_wait,
+        consumer_wait_seconds=consumer_wait,
+        occupancy_histogram=list(metrics.occupancy_histogram),
+        latency_percentiles=metrics.latency_percentiles(),
+        reorder_window=reorder.window if reorder is not None else 0,
+        reorder_peak_pending=reorder.peak_pending if reorder is not None else 0,
+        consumer_count=consumer_count,
+    )
+
+
+class MetricsReporter(threading.Thread):
+    """
+    Daemon thread that calls `callback(take_snapshot())` every `interval`
+    seconds until stop() is called.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        take_snapshot: Callable[[], PipelineMetrics],
+        callback: Callable[[PipelineMetrics], None],
+    ) -> None:
+        super().__init__(name="MetricsThread", daemon=True)
+        if interval <= 0:
+            raise ValueError("Metrics interval must be positive")
+        self._interval = interval
+        self._take_snapshot = take_snapshot
+        self._callback = callback
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._callback(self._take_snapshot())
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
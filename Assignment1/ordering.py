@@ -0,0 +1,129 @@
+"""
+ordering.py
+
+Ordered output for pipelines with parallel consumers.
+
+Producers tag each item with its position in the source and consumers
+push the tagged results into a ReorderBuffer, which emits them in
+source order. The number of items in flight (taken from the source but
+not yet emitted) is capped by the window, so the buffer never holds
+more than `window` out-of-order results.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from blocking_queue import QueueClosed
+from retry import DEAD_LETTERED
+
+Tagged = Tuple[int, Any]
+
+
+class ReorderBuffer:
+    """
+    Re-sequences tagged items and hands them to `emit` in order.
+
+    - reserve(count) is called by producers before taking `count` items
+      from the source; it blocks while the window is full. Unused
+      reservations are returned with cancel().
+    - push((sequence, item)) is called by consumers. It never blocks: the
+      next expected item is emitted immediately (followed by any buffered
+      successors), anything else is parked until its turn.
+
+    Because admission is bounded at the source rather than at push(),
+    consumers always keep draining the queue and cannot deadlock waiting
+    for an item that is still queued behind them. `emit` is called under
+    the buffer's lock, so it never sees concurrent calls. Dead-lettered
+    results (DEAD_LETTERED) take their turn but are not emitted.
+    close() makes pending and future reserve() calls raise QueueClosed.
+    """
+
+    def __init__(self, emit: Callable[[Any], None], window: int) -> None:
+        if window <= 0:
+            raise ValueError("Reorder window must be positive")
+        self._emit = emit
+        self._window = window
+        self._pending: Dict[int, Any] = {}
+        self._next = 0
+        self._in_flight = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._room = threading.Condition(self._lock)
+        self.peak_pending = 0
+
+    def reserve(self, count: int) -> None:
+        """Block until `count` more items may enter the pipeline."""
+        if count > self._window:
+            raise ValueError("Cannot reserve more items than the reorder window")
+        with self._room:
+            while self._in_flight + count > self._window:
+                if self._closed:
+                    raise QueueClosed("Reorder buffer is closed")
+                self._room.wait()
+            if self._closed:
+                raise QueueClosed("Reorder buffer is closed")
+            self._in_flight += count
+
+    def cancel(self, count: int) -> None:
+        """Return reservations that were not used (e.g. at end of source)."""
+        with self._room:
+            self._in_flight -= count
+            self._room.notify_all()
+
+    def push(self, tagged: Tagged) -> None:
+        """Accept a tagged result; emit everything that is now in order."""
+        sequence, item = tagged
+        with self._lock:
+            if sequence != self._next:
+                self._pending[sequence] = item
+                if len(self._pending) > self.peak_pending:
+                    self.peak_pending = len(self._pending)
+                return
+
+            emit = self._emit
+            if item is not DEAD_LETTERED:
+                emit(item)
+            released = 1
+            pending = self._pending
+            following = sequence + 1
+            while following in pending:
+                item = pending.pop(following)
+                if item is not DEAD_LETTERED:
+                    emit(item)
+                following += 1
+                released += 1
+            self._next = following
+            self._in_flight -= released
+            self._room.notify_all()
+
+    def close(self) -> None:
+        """Wake and fail producers waiting for room (used on pipeline abort)."""
+        with self._room:
+            self._closed = True
+            self._room.notify_all()
+
+    def pending(self) -> int:
+        """Return the number of results parked out of order."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+
+class TaggedTransform:
+    """A per-item transform lifted to (sequence, item) pairs."""
+
+    def __init__(self, transform: Callable[[Any], Any]) -> None:
+        self.transform = transform
+
+    def __call__(self, tagged: Tagged) -> Tagged:
+        return tagged[0], self.transform(tagged[1])
+
+
+def on_payload(transform: Optional[Callable[[Any], Any]]) -> Optional[TaggedTransform]:
+    """Lift a per-item transform to (sequence, item) pairs."""
+    if transform is None:
+        return None
+    return TaggedTransform(transform)
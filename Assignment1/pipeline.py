@@ -5,16 +5,32 @@ Orchestrates the classic producer-consumer pipeline:
 
 - A source container (input).
 - A shared bounded blocking queue (communication channel).
-- One producer thread.
-- One consumer thread.
+- One or more producer threads, each reading a shard of the source.
+- One or more consumer threads (or worker processes with backend="process").
 - A destination container (output).
+
+run_pipeline_async() offers the same pipeline for asyncio code, built on
+AsyncBoundedQueue with producer/consumer coroutines instead of threads.
 """
 
-from typing import Iterable, Any, List
+import asyncio
+import inspect
+import threading
+import time
+from typing import (
+    AsyncIterable, Callable, Generator, Iterable, Any, List, Optional, Tuple, Union,
+)
 
-from blocking_queue import BoundedBlockingQueue
-from producer import Producer
-from consumer import Consumer
+from async_queue import AsyncBoundedQueue
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+from producer import Producer, SharedIterator
+from autoscale import AutoscalePolicy, Autoscaler
+from consumer import Consumer, NO_SENTINEL
+from metrics import InstrumentedBlockingQueue, MetricsReporter, PipelineMetrics, snapshot
+from ordering import ReorderBuffer, on_payload
+from process_backend import run_process_pipeline
+from retry import RetryingTransform
+from spsc_queue import SPSCQueue
 from dataclasses import dataclass
 
 @dataclass
@@ -22,36 +38,460 @@ class PipelineResult:
     destination: List[Any]
     produced_count: int
     consumed_count: int
+    metrics: Optional[PipelineMetrics] = None
+    peak_consumers: int = 0
+    dead_lettered_count: int = 0
+
+Sink = Union[Callable[[Any], None], Generator[Any, Any, Any]]
 
 def run_pipeline(
     source: Iterable[Any],
     buffer_capacity: int = 5,
     sentinel: Any = None,
+    batch_size: int = 1,
+    num_producers: int = 1,
+    num_consumers: int = 1,
+    transform: Optional[Callable[[Any], Any]] = None,
+    backend: str = "thread",
+    sink: Optional[Sink] = None,
+    log_items: bool = True,
+    summary_every: int = 0,
+    collect_metrics: bool = False,
+    on_metrics: Optional[Callable[[PipelineMetrics], None]] = None,
+    metrics_interval: float = 1.0,
+    queue_factory: Optional[Callable[[int], BoundedBlockingQueue]] = None,
+    channel: str = "pipe",
+    channel_bytes: int = 1 << 20,
+    ordered: bool = False,
+    reorder_window: int = 0,
+    autoscale: Optional[AutoscalePolicy] = None,
+    retries: int = 0,
+    retry_backoff: float = 0.0,
+    dead_letter: Optional[Callable[[Any, Exception], None]] = None,
 ) -> PipelineResult:
     """
-    Run a single-producer, single-consumer pipeline.
+    Run a producer-consumer pipeline (single-producer, single-consumer by default).
 
-    :param source: Items to be produced (source container).
+    The source is consumed lazily and, with a sink, results are streamed
+    out as they are consumed, so memory stays O(buffer_capacity) even for
+    unbounded generators.
+
+    :param source: Items to be produced (any iterable; never materialized).
     :param buffer_capacity: Capacity of the shared blocking queue.
-    :param sentinel: Sentinel value used to signal end-of-stream.
+    :param sentinel: Accepted for backward compatibility. End-of-stream is
+        signalled by closing the queue, so every value (including None)
+        is treated as ordinary data.
+    :param batch_size: Number of items moved per queue operation; values
+        above 1 use put_many()/get_many() to amortize lock acquisitions.
+    :param num_producers: Number of producer threads. Producers pull items
+        on demand from the shared source.
+    :param num_consumers: Number of consumer threads. Once every producer
+        has finished, the queue is closed; consumers drain it and exit.
+    :param transform: Optional per-item function applied by consumers;
+        the destination receives its return values.
+    :param backend: "thread" (default) runs consumers as threads;
+        "process" runs them as worker processes so CPU-bound transforms
+        scale across cores.
+    :param sink: Optional streaming destination: a callable invoked once
+        per item, or a generator that is primed and fed items via send()
+        and closed at the end. Calls are serialized across consumers. When
+        given, the result's destination list stays empty.
+    :param log_items: Set to False to turn per-item log lines off entirely.
+    :param summary_every: If positive, each worker logs a progress summary
+        every `summary_every` items (works with log_items=False).
+    :param collect_metrics: Instrument the queue and attach a
+        PipelineMetrics (throughput, producer/consumer blocked time,
+        occupancy histogram, queue latency percentiles) to the result.
+        Thread backend only; off by default so the hot path is unchanged.
+    :param on_metrics: Optional callback receiving a PipelineMetrics
+        snapshot every `metrics_interval` seconds while the pipeline
+        runs. Implies collect_metrics.
+    :param queue_factory: Optional callable that builds the shared queue
+        from `buffer_capacity`, e.g. to use PriorityBlockingQueue or
+        FairShareBlockingQueue instead of FIFO order. Thread backend only;
+        takes precedence over the SPSC fast path and metrics.
+    :param channel: Process backend only: "pipe" (default) pickles
+        batches through a ProcessBlockingQueue; "shared_memory" passes
+        bytes-like items through a SharedMemoryRingBuffer without
+        pickling. Workers see each item as a memoryview that is valid
+        only during `transform`.
+    :param channel_bytes: Ring size in bytes for channel="shared_memory".
+    :param ordered: Emit results in source order even with several
+        producers/consumers. Producers tag items with sequence numbers
+        and a ReorderBuffer re-sequences consumer output. Thread backend
+        only.
+    :param reorder_window: Maximum number of items in flight between the
+        source and the ordered output (default: 4 * buffer_capacity, and
+        at least batch_size). Bounds the reorder buffer's memory; its
+        size and peak occupancy are reported in the metrics.
+    :param autoscale: Optional AutoscalePolicy. The consumer pool then
+        starts at `num_consumers` (clamped to the policy's bounds) and
+        grows or shrinks between min_consumers and max_consumers based
+        on queue occupancy and producer/consumer wait time. Thread
+        backend only; uses the instrumented queue for its signals.
+    :param retries: Times a failing `transform` call is retried per item,
+        with exponential backoff starting at `retry_backoff` seconds.
+        Thread backend only.
+    :param dead_letter: Optional `dead_letter(item, error)` callable that
+        receives items whose transform still fails after all retries;
+        they are then skipped. Without it such an error is fatal.
+        Thread backend only.
+    :raises: The first fatal error from any worker (a transform error
+        that was not dead-lettered, or a source/sink error). All workers
+        are stopped and unblocked before it is re-raised, on both
+        backends.
     :return: Destination container with all items consumed from the queue.
+        With a single producer and consumer, or with ordered=True, source
+        order is preserved; otherwise items are grouped per consumer in
+        arrival order.
     """
-    queue = BoundedBlockingQueue(capacity=buffer_capacity)
-    source_list = list(source)
-    produced_count = len(source_list)
+    if num_producers <= 0:
+        raise ValueError("num_producers must be positive")
+    if num_consumers <= 0:
+        raise ValueError("num_consumers must be positive")
+    if backend not in ("thread", "process"):
+        raise ValueError(f"Unknown pipeline backend: {backend!r}")
+    collect_metrics = collect_metrics or on_metrics is not None
+    if collect_metrics and backend != "thread":
+        raise ValueError("Metrics are only supported by the thread backend")
+    if queue_factory is not None and backend != "thread":
+        raise ValueError("queue_factory is only supported by the thread backend")
+    if queue_factory is not None and collect_metrics:
+        raise ValueError("queue_factory cannot be combined with metrics")
+    if channel != "pipe" and backend != "process":
+        raise ValueError("channel is only supported by the process backend")
+    if ordered and backend != "thread":
+        raise ValueError("ordered is only supported by the thread backend")
+    if autoscale is not None:
+        if backend != "thread":
+            raise ValueError("autoscale is only supported by the thread backend")
+        if queue_factory is not None:
+            raise ValueError("queue_factory cannot be combined with autoscale")
+        num_consumers = min(max(num_consumers, autoscale.min_consumers), autoscale.max_consumers)
+    if (retries or dead_letter is not None) and backend != "thread":
+        raise ValueError("retries and dead_letter are only supported by the thread backend")
+    if transform is not None and (retries or dead_letter is not None):
+        transform = RetryingTransform(transform, retries, retry_backoff, dead_letter)
+
+    shared_source = source if num_producers == 1 else SharedIterator(source)
+    # The reorder buffer already serializes its output.
+    max_consumers = num_consumers if autoscale is None else autoscale.max_consumers
+    emit, close_sink = open_sink(sink, serialize=max_consumers > 1 and not ordered)
     destination: List[Any] = []
 
-    producer = Producer(source=source_list, queue=queue, sentinel=sentinel)
-    consumer = Consumer(queue=queue, destination=destination, sentinel=sentinel)
+    try:
+        if backend == "process":
+            produced_count, consumed_count = run_process_pipeline(
+                source=shared_source,
+                destination=emit or destination,
+                buffer_capacity=buffer_capacity,
+                batch_size=batch_size,
+                num_producers=num_producers,
+                num_consumers=num_consumers,
+                transform=transform,
+                log_items=log_items,
+                summary_every=summary_every,
+                channel=channel,
+                channel_bytes=channel_bytes,
+            )
+            return PipelineResult(
+                destination=destination,
+                produced_count=produced_count,
+                consumed_count=consumed_count,
+            )
+
+        if queue_factory is not None:
+            queue = queue_factory(buffer_capacity)
+        elif collect_metrics or autoscale is not None:
+            queue = InstrumentedBlockingQueue(capacity=buffer_capacity)
+        else:
+            queue = make_queue(buffer_capacity, num_producers, num_consumers)
+
+        reorder = (
+            ReorderBuffer(
+                emit or destination.append,
+                window=max(reorder_window or 4 * buffer_capacity, batch_size),
+            )
+            if ordered
+            else None
+        )
+
+        failures: List[Exception] = []
+
+        def abort(error: Exception) -> None:
+            # Stop and unblock every worker so a failed consumer cannot
+            # leave producers waiting on a full queue (or vice versa).
+            failures.append(error)
+            for producer in producers:
+                producer.stop()
+            for consumer in list(consumers):
+                consumer.stop()
+            if reorder is not None:
+                reorder.close()
+            queue.close()
+
+        producers = [
+            Producer(
+                source=shared_source,
+                queue=queue,
+                batch_size=batch_size,
+                send_sentinel=False,
+                name=_thread_name("ProducerThread", index, num_producers),
+                log_items=log_items,
+                summary_every=summary_every,
+                reorder=reorder,
+                on_fatal=abort,
+            )
+            for index in range(num_producers)
+        ]
+        # Each consumer appends to its own list, so no lock is needed on the
+        # hot path; the lists are merged once all consumers have exited.
+        partials: List[List[Any]] = []
+
+        def make_consumer() -> Consumer:
+            index = len(partials)
+            partials.append([])
+            return Consumer(
+                queue=queue,
+                destination=reorder.push if reorder is not None else emit or partials[index],
+                sentinel=NO_SENTINEL,
+                batch_size=batch_size,
+                transform=on_payload(transform) if reorder is not None else transform,
+                name=_thread_name("ConsumerThread", index, max_consumers),
+                log_items=log_items,
+                summary_every=summary_every,
+                # Autoscaled consumers must notice stop() while idle.
+                poll_interval=autoscale.interval if autoscale is not None else None,
+                on_fatal=abort,
+            )
+
+        def start_consumer() -> Consumer:
+            consumer = make_consumer()
+            if failures:
+                consumer.stop()
+            consumer.start()
+            return consumer
+
+        consumers = [make_consumer() for _ in range(num_consumers)]
+
+        started = time.perf_counter()
+
+        def take_snapshot() -> PipelineMetrics:
+            return snapshot(
+                queue,
+                started,
+                produced_count=sum(producer.produced_count for producer in producers),
+                consumed_count=sum(consumer.consumed_count for consumer in consumers),
+                reorder=reorder,
+                consumer_count=sum(1 for consumer in consumers if not consumer.stopping),
+            )
 
-    producer.start()
-    consumer.start()
+        reporter = (
+            MetricsReporter(metrics_interval, take_snapshot, on_metrics)
+            if on_metrics is not None
+            else None
+        )
+        autoscaler = (
+            Autoscaler(queue, autoscale, consumers, start_consumer)
+            if autoscale is not None
+            else None
+        )
 
-    producer.join()
-    consumer.join()
+        for thread in [*producers, *consumers]:
+            thread.start()
+        if reporter is not None:
+            reporter.start()
+        if autoscaler is not None:
+            autoscaler.start()
+
+        for producer in producers:
+            producer.join()
+        if autoscaler is not None:
+            # Freeze the pool before closing so every consumer is joined.
+            autoscaler.stop()
+        # Signal end-of-stream out of band: consumers drain and exit.
+        queue.close()
+        for consumer in consumers:
+            consumer.join()
+        if reporter is not None:
+            reporter.stop()
+        if failures:
+            raise failures[0]
+    finally:
+        close_sink()
+
+    for partial in partials:
+        destination.extend(partial)
 
+    return PipelineResult(
+        destination=destination,
+        produced_count=sum(producer.produced_count for producer in producers),
+        consumed_count=sum(consumer.consumed_count for consumer in consumers),
+        metrics=take_snapshot() if collect_metrics else None,
+        peak_consumers=autoscaler.peak_consumers if autoscaler is not None else len(consumers),
+        dead_lettered_count=(
+            transform.dead_lettered_count if isinstance(transform, RetryingTransform) else 0
+        ),
+    )
+
+
+def make_queue(
+    capacity: int, num_producers: int, num_consumers: int
+) -> Union[BoundedBlockingQueue, SPSCQueue]:
+    """
+    Pick the cheapest queue that is safe for the given topology: the
+    lock-free-fast-path SPSCQueue for one producer and one consumer,
+    BoundedBlockingQueue otherwise.
+    """
+    if num_producers == 1 and num_consumers == 1:
+        return SPSCQueue(capacity=capacity)
+    return BoundedBlockingQueue(capacity=capacity)
+
+
+def open_sink(
+    sink: Optional[Sink], serialize: bool
+) -> Tuple[Optional[Callable[[Any], None]], Callable[[], None]]:
+    """
+    Turn a sink into a per-item callable plus a close hook.
+
+    Generators are primed with next() and fed with send(). With several
+    consumers the callable is wrapped in a lock so the sink never sees
+    concurrent calls.
+    """
+    if sink is None:
+        return None, lambda: None
+
+    if inspect.isgenerator(sink):
+        next(sink)
+        emit: Callable[[Any], None] = sink.send
+        close: Callable[[], None] = sink.close
+    else:
+        emit = sink
+        close = lambda: None
+
+    if serialize:
+        lock = threading.Lock()
+        unlocked = emit
+
+        def emit(item: Any) -> None:
+            with lock:
+                unlocked(item)
+
+    return emit, close
+
+
+def _thread_name(base: str, index: int, count: int) -> str:
+    """Keep the classic thread names for the single-thread case."""
+    return base if count == 1 else f"{base}-{index}"
+
+
+async def run_pipeline_async(
+    source: Union[AsyncIterable[Any], Iterable[Any]],
+    buffer_capacity: int = 5,
+    sentinel: Any = None,
+    batch_size: int = 1,
+    num_consumers: int = 1,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> PipelineResult:
+    """
+    Run a producer-consumer pipeline as coroutines on the current event loop.
+
+    :param source: Async or regular iterable of items to produce.
+    :param buffer_capacity: Capacity of the shared AsyncBoundedQueue.
+    :param sentinel: Accepted for backward compatibility. End-of-stream is
+        signalled by closing the queue, so every value (including None)
+        is treated as ordinary data.
+    :param batch_size: Number of items moved per queue operation.
+    :param num_consumers: Number of consumer coroutines.
+    :param transform: Optional per-item function; may be a coroutine
+        function, in which case its result is awaited.
+    :return: Destination container with all items consumed from the queue.
+
+    The first error from the source or a transform closes the queue,
+    cancels the remaining coroutines and is re-raised once they finish.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if num_consumers <= 0:
+        raise ValueError("num_consumers must be positive")
+
+    queue = AsyncBoundedQueue(capacity=buffer_capacity)
+    partials: List[List[Any]] = [[] for _ in range(num_consumers)]
+
+    producer = asyncio.ensure_future(_produce_async(source, queue, batch_size))
+    tasks = [producer] + [
+        asyncio.ensure_future(_consume_async(queue, partial, batch_size, transform))
+        for partial in partials
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task in done and task.exception() is not None:
+                raise task.exception()
+    finally:
+        # Fail fast, like run_pipeline's abort hook: wake everything still
+        # waiting on the queue and cancel it, so no task outlives the call.
+        if any(not task.done() for task in tasks):
+            await queue.close()
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    produced_count = producer.result()
+
+    destination: List[Any] = [item for partial in partials for item in partial]
     return PipelineResult(
         destination=destination,
         produced_count=produced_count,
         consumed_count=len(destination),
     )
+
+
+async def _iterate(source: Union[AsyncIterable[Any], Iterable[Any]]):
+    if hasattr(source, "__aiter__"):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+async def _produce_async(
+    source: Union[AsyncIterable[Any], Iterable[Any]],
+    queue: AsyncBoundedQueue,
+    batch_size: int,
+) -> int:
+    produced = 0
+    batch: List[Any] = []
+    async for item in _iterate(source):
+        if batch_size == 1:
+            await queue.put(item)
+        else:
+            batch.append(item)
+            if len(batch) == batch_size:
+                await queue.put_many(batch)
+                batch = []
+        produced += 1
+    if batch:
+        await queue.put_many(batch)
+    # Signal end-of-stream out of band: consumers drain and exit.
+    await queue.close()
+    return produced
+
+
+async def _consume_async(
+    queue: AsyncBoundedQueue,
+    destination: List[Any],
+    batch_size: int,
+    transform: Optional[Callable[[Any], Any]],
+) -> None:
+    while True:
+        try:
+            batch = await queue.get_many(batch_size)
+        except QueueClosed:
+            return
+        for item in batch:
+            if transform is not None:
+                item = transform(item)
+                if inspect.isawaitable(item):
+                    item = await item
+            destination.append(item)
@@ -0,0 +1,131 @@
+"""
+priority_queues.py
+
+Non-FIFO scheduling policies for BoundedBlockingQueue.
+
+Both classes keep the base class's bounded-capacity backpressure,
+timeouts and close() semantics and only replace the storage/ordering
+primitives, so they can be dropped into Producer, Consumer or
+run_pipeline(queue_factory=...):
+
+- PriorityBlockingQueue: heap-backed, O(log n) put/get; the item with
+  the smallest key is dequeued first, FIFO among equal keys.
+- FairShareBlockingQueue: items are assigned to named lanes and dequeued
+  by smooth weighted round-robin, so a lane with weight 3 gets three
+  turns for every turn of a weight-1 lane while both have items.
+"""
+
+import heapq
+import itertools
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Tuple
+
+from blocking_queue import BoundedBlockingQueue
+
+
+class PriorityBlockingQueue(BoundedBlockingQueue):
+    """
+    Bounded blocking priority queue.
+
+    `key(item)` gives the priority; lower keys are served first. The
+    default key is the item itself (e.g. `(priority, payload)` tuples).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        key: Callable[[Any], Any] = lambda item: item,
+    ) -> None:
+        self._key = key
+        super().__init__(capacity)
+
+    def _init_storage(self) -> None:
+        # (key, sequence, item): the sequence keeps equal keys FIFO and
+        # means items themselves never need to be comparable.
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._sequence = itertools.count()
+
+    def _append(self, item: Any) -> None:
+        heapq.heappush(self._heap, (self._key(item), next(self._sequence), item))
+        self._count += 1
+
+    def _popleft(self) -> Any:
+        _, _, item = heapq.heappop(self._heap)
+        self._count -= 1
+        return item
+
+
+class FairShareBlockingQueue(BoundedBlockingQueue):
+    """
+    Bounded blocking queue with weighted fair sharing across lanes.
+
+    - `weights` maps lane name -> positive integer share.
+    - `lane(item)` names the lane an item belongs to.
+    - Capacity is shared by all lanes.
+
+    Dequeue uses smooth weighted round-robin (as in nginx): every
+    non-empty lane gains its weight in credit, the lane with the most
+    credit is served and pays back the total weight. This interleaves
+    lanes evenly instead of serving them in bursts. Credits sum to zero
+    across the non-empty lanes, so every credit is reset whenever a lane
+    empties or starts receiving items again; an empty lane neither
+    accumulates credit nor carries debt.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        weights: Dict[Hashable, int],
+        lane: Callable[[Any], Hashable],
+    ) -> None:
+        if not weights:
+            raise ValueError("At least one lane is required")
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Lane weights must be positive")
+        self._weights = dict(weights)
+        self._lane = lane
+        super().__init__(capacity)
+
+    def _init_storage(self) -> None:
+        self._lanes: Dict[Hashable, Deque[Any]] = {name: deque() for name in self._weights}
+        self._credit: Dict[Hashable, int] = {name: 0 for name in self._weights}
+
+    def _append(self, item: Any) -> None:
+        name = self._lane(item)
+        if name not in self._lanes:
+            raise ValueError(f"Unknown lane: {name!r}")
+        items = self._lanes[name]
+        if not items:
+            self._reset_credit()
+        items.append(item)
+        self._count += 1
+
+    def _popleft(self) -> Any:
+        total = 0
+        chosen = None
+        for name, items in self._lanes.items():
+            if not items:
+                continue
+            weight = self._weights[name]
+            self._credit[name] += weight
+            total += weight
+            if chosen is None or self._credit[name] > self._credit[chosen]:
+                chosen = name
+        self._credit[chosen] -= total
+        self._count -= 1
+        items = self._lanes[chosen]
+        item = items.popleft()
+        if not items:
+            self._reset_credit()
+        return item
+
+    def _reset_credit(self) -> None:
+        # The set of non-empty lanes changed: zeroing only one lane would
+        # leave its share of the zero-sum credit with the others.
+        for name in self._credit:
+            self._credit[name] = 0
+
+    def lane_sizes(self) -> Dict[Hashable, int]:
+        """Return the number of queued items per lane."""
+        with self._lock:
+            return {name: len(items) for name, items in self._lanes.items()}
@@ -0,0 +1,357 @@
+"""
+process_backend.py
+
+Process-based consumer backend for CPU-bound per-item work.
+
+Thread consumers share one interpreter, so a CPU-heavy transform is
+serialized by the GIL. This backend keeps the producer threads in the
+parent process but runs consumers as separate processes, connected by a
+bounded channel with the same blocking/backpressure semantics as
+BoundedBlockingQueue: a pipe-backed ProcessBlockingQueue by default, or
+a SharedMemoryRingBuffer for bytes payloads.
+"""
+
+import multiprocessing
+import pickle
+import queue as queue_module
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional, Tuple, Union
+
+from blocking_queue import QueueClosed
+from logging_utils import log
+from producer import Producer
+from shm_ring_buffer import SharedMemoryRingBuffer
+
+CHANNELS = ("pipe", "shared_memory")
+# Seconds between liveness checks of worker processes while waiting for results.
+_LIVENESS_INTERVAL = 0.1
+
+
+class _EndOfStream:
+    """
+    Picklable end-of-stream marker.
+
+    A user-supplied sentinel may not survive a pickle round trip with its
+    identity or equality intact (e.g. a bare object()), so the process
+    backend signals shutdown with its own marker type instead. Workers
+    echo it back on the results queue tagged with their index.
+    """
+
+    def __init__(self, worker: Optional[int] = None) -> None:
+        self.worker = worker
+
+
+class _WorkerFailed:
+    """Final message of a worker whose transform raised."""
+
+    def __init__(self, error: Exception, worker: int) -> None:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            # Keep the message deliverable even for unpicklable errors.
+            error = RuntimeError(repr(error))
+        self.error = error
+        self.worker = worker
+
+
+class ProcessBlockingQueue:
+    """
+    A bounded blocking queue that can be shared between processes.
+
+    Backed by multiprocessing.Queue (a pipe plus a bounded semaphore):
+    - put()/put_many() block while `capacity` messages are in flight.
+    - get()/get_many() block until a message is available.
+
+    put_many() sends the whole batch as a single message, so one pickle
+    and one pipe write are paid per batch. Capacity therefore bounds the
+    number of in-flight messages; with single-item puts that is the
+    number of items, exactly as in BoundedBlockingQueue.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        context = context or multiprocessing.get_context()
+        self._capacity = capacity
+        self._queue = context.Queue(maxsize=capacity)
+        # Items already received by this process but not yet returned.
+        # Each process that unpickles the queue gets its own buffer.
+        self._pending: Deque[Any] = deque()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pending"] = deque()
+        return state
+
+    def put(self, item: Any) -> None:
+        """Put a single item, blocking while the channel is full."""
+        self._queue.put([item])
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Put a batch of items as one message, blocking while the channel is full."""
+        batch = list(items)
+        if batch:
+            self._queue.put(batch)
+
+    def get(self) -> Any:
+        """Remove and return one item, blocking until one is available."""
+        if not self._pending:
+            self._pending.extend(self._queue.get())
+        return self._pending.popleft()
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to `max_items` items from a single message.
+
+        Blocks until a message is available. If `timeout` is given and
+        expires first, an empty list is returned.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+
+        if not self._pending:
+            try:
+                self._pending.extend(self._queue.get(timeout=timeout))
+            except queue_module.Empty:
+                return []
+
+        taken = min(max_items, len(self._pending))
+        return [self._pending.popleft() for _ in range(taken)]
+
+    def size(self) -> int:
+        """Return the approximate number of in-flight messages."""
+        try:
+            return self._queue.qsize()
+        except NotImplementedError:
+            # qsize() relies on sem_getvalue(), which macOS does not provide.
+            return 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+
+def _owned(value: Any) -> Any:
+    # Views into the shared-memory ring are recycled once released and
+    # cannot be pickled, so results are copied out of them.
+    return value.tobytes() if isinstance(value, memoryview) else value
+
+
+def _consumer_process(
+    channel: Union[ProcessBlockingQueue, SharedMemoryRingBuffer],
+    results: Any,
+    batch_size: int,
+    transform: Optional[Callable[[Any], Any]],
+    abort: Any,
+    index: int,
+) -> None:
+    """
+    Consumer loop run inside each worker process.
+
+    Transformed items are sent back in one message per batch, followed
+    by a single _EndOfStream once this worker's marker is received (pipe
+    channel) or the channel is closed and drained (shared-memory channel).
+    Each batch is pickled here rather than by the queue's feeder thread,
+    which would only print an unpicklable result to stderr and drop it.
+    If the transform raises or a result cannot be pickled, a
+    _WorkerFailed is sent instead. Once
+    `abort` is set, remaining items are drained without being processed
+    so blocked producers are released.
+    """
+    while True:
+        try:
+            batch = channel.get_many(batch_size)
+        except QueueClosed:
+            results.put(_EndOfStream(index))
+            return
+        output: List[Any] = []
+        finished = False
+        skip = abort.is_set()
+        try:
+            for item in batch:
+                if isinstance(item, _EndOfStream):
+                    # Markers are always sent as their own message, so nothing
+                    # can follow one within the same batch.
+                    finished = True
+                    break
+                if not skip:
+                    output.append(_owned(item if transform is None else transform(item)))
+            payload = pickle.dumps(output, pickle.HIGHEST_PROTOCOL) if output else None
+        except Exception as exc:
+            results.put(_WorkerFailed(exc, index))
+            return
+        if payload is not None:
+            results.put(payload)
+        if finished:
+            results.put(_EndOfStream(index))
+            return
+
+
+def run_process_pipeline(
+    source: Iterable[Any],
+    destination: Union[List[Any], Callable[[Any], None]],
+    buffer_capacity: int,
+    batch_size: int,
+    num_producers: int,
+    num_consumers: int,
+    transform: Optional[Callable[[Any], Any]],
+    log_items: bool = True,
+    summary_every: int = 0,
+    channel: str = "pipe",
+    channel_bytes: int = 1 << 20,
+) -> Tuple[int, int]:
+    """
+    Run producers as threads and consumers as worker processes.
+
+    `source` is read lazily; when several producers share it, it must be
+    a SharedIterator. Results are collected in the parent process and
+    appended to `destination` (or passed to it, if it is a callable
+    sink); order is only preserved with one producer and one consumer.
+
+    `transform` must be picklable (a module-level function) when the
+    platform uses the "spawn" start method.
+
+    `channel="shared_memory"` moves bytes-like items through a
+    SharedMemoryRingBuffer of `channel_bytes` bytes instead of pickling
+    them through a pipe. Workers then see each item as a memoryview that
+    is only valid during `transform`; memoryview results are copied.
+
+    The first error from a worker's transform, the source or the sink
+    stops the producers, makes the remaining workers discard what is
+    left in the channel, and is re-raised once everything has exited.
+
+    :return: (produced_count, consumed_count)
+    """
+    if channel not in CHANNELS:
+        raise ValueError(f"Unknown process channel: {channel!r}")
+
+    context = multiprocessing.get_context()
+    shared = channel == "shared_memory"
+    if shared:
+        queue: Union[ProcessBlockingQueue, SharedMemoryRingBuffer] = SharedMemoryRingBuffer(
+            capacity=channel_bytes, context=context
+        )
+    else:
+        # Messages carry whole batches, so scale the message bound to keep
+        # roughly `buffer_capacity` items in flight.
+        queue = ProcessBlockingQueue(
+            capacity=max(1, buffer_capacity // batch_size), context=context
+        )
+    results = context.Queue()
+    abort = context.Event()
+    failures: List[Exception] = []
+
+    def fail(error: Exception) -> None:
+        failures.append(error)
+        abort.set()
+        for producer in producers:
+            producer.stop()
+        if shared:
+            # Wakes producers blocked on a full ring; workers drain and exit.
+            queue.close()
+
+    workers = [
+        context.Process(
+            target=_consumer_process,
+            args=(queue, results, batch_size, transform, abort, index),
+            name=f"ConsumerProcess-{index}",
+            daemon=True,
+        )
+        for index in range(num_consumers)
+    ]
+    producers = [
+        Producer(
+            source=source,
+            queue=queue,
+            batch_size=batch_size,
+            send_sentinel=False,
+            name=f"ProducerThread-{index}" if num_producers > 1 else "ProducerThread",
+            log_items=log_items,
+            summary_every=summary_every,
+            on_fatal=fail,
+        )
+        for index in range(num_producers)
+    ]
+
+    def finish_producing() -> None:
+        for producer in producers:
+            producer.join()
+        if shared:
+            queue.close()
+        else:
+            for _ in range(num_consumers):
+                queue.put(_EndOfStream())
+        log("All producers finished, end-of-stream sent to consumer processes.")
+
+    for worker in workers:
+        worker.start()
+    for producer in producers:
+        producer.start()
+    finisher = threading.Thread(target=finish_producing, name="FinisherThread")
+    finisher.start()
+
+    # Drain results before joining workers: a process that still has
+    # buffered queue data cannot exit.
+    store = destination if callable(destination) else destination.append
+    consumed_count = 0
+    finished = set()
+    while len(finished) < num_consumers:
+        try:
+            message = results.get(timeout=_LIVENESS_INTERVAL)
+        except queue_module.Empty:
+            # A process exits only after flushing what it put, so a dead
+            # worker whose final message is not queued by now never sent one
+            # (killed, os._exit, crashed interpreter).
+            lost = [
+                index for index, worker in enumerate(workers)
+                if index not in finished and worker.exitcode is not None
+            ]
+            if lost and results.empty():
+                for index in lost:
+                    fail(RuntimeError(
+                        f"{workers[index].name} exited with code "
+                        f"{workers[index].exitcode} before finishing"
+                    ))
+                # The dead process may have held a lock shared with the
+                # others (e.g. the results queue's write lock), so the
+                # survivors cannot be trusted to finish either.
+                for index, worker in enumerate(workers):
+                    if index not in finished:
+                        worker.terminate()
+                        finished.add(index)
+            continue
+        if isinstance(message, _EndOfStream):
+            finished.add(message.worker)
+        elif isinstance(message, _WorkerFailed):
+            finished.add(message.worker)
+            fail(message.error)
+        elif not failures:
+            try:
+                batch = pickle.loads(message)
+                for item in batch:
+                    store(item)
+                consumed_count += len(batch)
+            except Exception as exc:
+                fail(exc)
+
+    # Failed workers never read their end-of-stream marker, and with no
+    # worker left nobody drains the channel: do it here so the producers
+    # and the finisher can always finish.
+    while finisher.is_alive():
+        if not shared:
+            queue.get_many(batch_size, timeout=0.05)
+        finisher.join(0.05)
+    for worker in workers:
+        worker.join()
+    if shared:
+        queue.dispose()
+    if failures:
+        raise failures[0]
+    produced_count = sum(producer.produced_count for producer in producers)
+    return produced_count, consumed_count
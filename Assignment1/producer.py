@@ -6,18 +6,74 @@ and places items into a shared blocking queue.
 """
 
 import threading
-from typing import Iterable, Any
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Any, List, Optional, Tuple
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+from logging_utils import DEBUG, get_logger
+from ordering import ReorderBuffer
+
+
+class SharedIterator:
+    """
+    Thread-safe wrapper that lets several producers pull from one iterable.
+
+    Items are handed out lazily on demand, so the source is never
+    materialized and faster producers naturally take more of it.
+    take_numbered() also returns each item's position in the source,
+    assigned under the same lock so numbering matches source order.
+    """
+
+    def __init__(self, source: Iterable[Any]) -> None:
+        self._iterator = iter(source)
+        self._lock = threading.Lock()
+        self._position = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        with self._lock:
+            item = next(self._iterator)
+            self._position += 1
+            return item
+
+    def take(self, count: int) -> List[Any]:
+        """Return up to `count` items under a single lock acquisition."""
+        with self._lock:
+            batch = list(islice(self._iterator, count))
+            self._position += len(batch)
+            return batch
+
+    def take_numbered(self, count: int) -> List[Tuple[int, Any]]:
+        """Like take(), but return (position, item) pairs."""
+        with self._lock:
+            batch = list(islice(self._iterator, count))
+            start = self._position
+            self._position += len(batch)
+        return list(zip(range(start, start + len(batch)), batch))
 
-from blocking_queue import BoundedBlockingQueue
-from logging_utils import log
 
 class Producer(threading.Thread):
     """
     Producer thread.
 
-    - Reads items from a source container (iterable).
+    - Reads items lazily from a source container (any iterable, including
+      unbounded generators).
     - Puts each item into the shared BoundedBlockingQueue.
-    - After producing all items, sends a sentinel to signal completion.
+    - With batch_size > 1, enqueues items in batches via put_many().
+    - Tracks `produced_count` as items are actually enqueued.
+    - Logs each item at DEBUG (unless log_items=False) and, with
+      summary_every=N, a progress summary every N items at INFO.
+    - After producing all items, sends a sentinel to signal completion
+      (unless send_sentinel=False, e.g. when several producers share a
+      queue and the pipeline emits sentinels once all of them are done).
+    - With a `reorder` buffer, enqueues (sequence, item) pairs numbered
+      in source order, reserving room in the reorder window before
+      taking items from the source.
+    - stop() makes it exit after the current item or batch; a closed
+      queue ends it quietly. An exception from the source is kept in
+      `error` and passed to `on_fatal`.
     """
 
     def __init__(
@@ -25,18 +81,111 @@ class Producer(threading.Thread):
         source: Iterable[Any],
         queue: BoundedBlockingQueue,
         sentinel: Any = None,
+        batch_size: int = 1,
+        send_sentinel: bool = True,
+        name: str = "ProducerThread",
+        log_items: bool = True,
+        summary_every: int = 0,
+        reorder: Optional[ReorderBuffer] = None,
+        on_fatal: Optional[Callable[[Exception], None]] = None,
     ) -> None:
-        super().__init__(name="ProducerThread")
-        self._source = list(source)
+        super().__init__(name=name)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._source = source
         self._queue = queue
         self._sentinel = sentinel
+        self._batch_size = batch_size
+        self._send_sentinel = send_sentinel
+        self.produced_count = 0
+        self._logger = get_logger()
+        self._log_items = log_items
+        self._summary_every = summary_every
+        self._reorder = reorder
+        self._on_fatal = on_fatal
+        self._stopping = False
+        self.error: Optional[Exception] = None
+
+    def stop(self) -> None:
+        """Ask the producer to exit after the item or batch it is enqueuing."""
+        self._stopping = True
 
     def run(self) -> None:
-        for item in self._source:
-            self._queue.put(item)
-
-            #have added logging just to check concurrency
-            log(f"Produced {item} (queue size={self._queue.size()})")
-        # Signal end-of-stream with sentinel.
-        self._queue.put(self._sentinel)
-        log("Produced sentinel, producer exiting.")
+        try:
+            self._produce()
+        except QueueClosed:
+            self._logger.info(
+                "Queue closed after %d items, producer exiting.", self.produced_count
+            )
+        except Exception as exc:
+            self.error = exc
+            self._logger.warning(
+                "Producer failed after %d items: %r", self.produced_count, exc
+            )
+            if self._on_fatal is not None:
+                self._on_fatal(exc)
+
+    def _produce(self) -> None:
+        logger = self._logger
+        # Checked once per run: when disabled, neither the message nor the
+        # queue.size() lock acquisition is paid per item.
+        log_items = self._log_items and logger.enabled_for(DEBUG)
+        every = self._summary_every
+        if self._batch_size == 1:
+            for item in self._items():
+                self._queue.put(item)
+                self.produced_count += 1
+
+                #have added logging just to check concurrency
+                if log_items:
+                    logger.debug("Produced %s (queue size=%d)", item, self._queue.size())
+                if every and self.produced_count % every == 0:
+                    logger.info("Produced %d items so far", self.produced_count)
+                if self._stopping:
+                    logger.info("Stopped after %d items, producer exiting.", self.produced_count)
+                    return
+        else:
+            for batch in self._batches():
+                self._queue.put_many(batch)
+                self.produced_count += len(batch)
+                if log_items:
+                    logger.debug(
+                        "Produced batch of %d items (queue size=%d)",
+                        len(batch), self._queue.size(),
+                    )
+                if every and self.produced_count % every < len(batch):
+                    logger.info("Produced %d items so far", self.produced_count)
+                if self._stopping:
+                    logger.info("Stopped after %d items, producer exiting.", self.produced_count)
+                    return
+        if self._send_sentinel:
+            # Signal end-of-stream with sentinel.
+            self._queue.put(self._sentinel)
+            logger.info("Produced sentinel, producer exiting.")
+        else:
+            logger.info("Source exhausted after %d items, producer exiting.", self.produced_count)
+
+    def _items(self) -> Iterable[Any]:
+        if self._reorder is None:
+            return self._source
+        return (batch[0] for batch in self._batches())
+
+    def _batches(self) -> Iterator[List[Any]]:
+        reorder = self._reorder
+        if isinstance(self._source, SharedIterator):
+            take = self._source.take if reorder is None else self._source.take_numbered
+        else:
+            iterator = iter(self._source)
+            if reorder is not None:
+                iterator = enumerate(iterator)
+            take = lambda count: list(islice(iterator, count))
+        size = self._batch_size
+        while True:
+            if reorder is not None:
+                reorder.reserve(size)
+            batch = take(size)
+            if reorder is not None and len(batch) < size:
+                reorder.cancel(size - len(batch))
+            if not batch:
+                return
+            yield batch
@@ -0,0 +1,79 @@
+"""
+retry.py
+
+Per-item error handling for consumer transforms.
+
+RetryingTransform wraps a transform so that a failing item is retried
+with exponential backoff and, if it keeps failing, handed to a
+dead-letter sink instead of killing the consumer. Without a dead-letter
+sink the last error is re-raised and treated as fatal by the pipeline.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from logging_utils import get_logger
+
+# Returned by RetryingTransform for a dead-lettered item; consumers and
+# the reorder buffer drop it instead of storing it.
+DEAD_LETTERED = object()
+
+
+class RetryingTransform:
+    """
+    Callable wrapper adding retries and dead-lettering to a transform.
+
+    - An item whose transform raises is retried up to `retries` times,
+      sleeping `backoff * 2**attempt` seconds before each retry.
+    - If every attempt fails, `dead_letter(item, error)` is called and
+      DEAD_LETTERED is returned; with no dead-letter sink the last error
+      propagates.
+    - Dead-letter calls are serialized, so the sink may be a plain list's
+      append or any non-thread-safe callable.
+
+    Only Exception subclasses are handled; KeyboardInterrupt and friends
+    always propagate.
+    """
+
+    def __init__(
+        self,
+        transform: Callable[[Any], Any],
+        retries: int = 0,
+        backoff: float = 0.0,
+        dead_letter: Optional[Callable[[Any, Exception], None]] = None,
+    ) -> None:
+        if retries < 0:
+            raise ValueError("retries must not be negative")
+        if backoff < 0:
+            raise ValueError("backoff must not be negative")
+        self._transform = transform
+        self._retries = retries
+        self._backoff = backoff
+        self._dead_letter = dead_letter
+        self._lock = threading.Lock()
+        self.retry_count = 0
+        self.dead_lettered_count = 0
+
+    def __call__(self, item: Any) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return self._transform(item)
+            except Exception as exc:
+                if attempt < self._retries:
+                    if self._backoff:
+                        time.sleep(self._backoff * 2 ** attempt)
+                    attempt += 1
+                    with self._lock:
+                        self.retry_count += 1
+                    continue
+                if self._dead_letter is None:
+                    raise
+                with self._lock:
+                    self._dead_letter(item, exc)
+                    self.dead_lettered_count += 1
+                get_logger().warning(
+                    "Dead-lettered %r after %d attempt(s): %r", item, attempt + 1, exc
+                )
+                return DEAD_LETTERED
@@ -0,0 +1,349 @@
+"""
+shm_ring_buffer.py
+
+Zero-copy bytes channel between processes.
+
+ProcessBlockingQueue pickles every batch through a pipe. For binary
+record streams that serialization dominates, so SharedMemoryRingBuffer
+instead copies each payload once into a ring buffer in
+multiprocessing.shared_memory and hands consumers memoryviews into it.
+"""
+
+import multiprocessing
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Iterable, List, Optional
+
+from blocking_queue import QueueClosed
+
+# Control block: write, read and reclaim offsets, ready-frame count,
+# closed flag. Offsets only grow; the ring position is offset % capacity.
+_CONTROL = struct.Struct("<QQQQQ")
+_CONTROL_SIZE = 64
+# Frame header: payload length, frame state. Frames are 8-byte aligned,
+# so a header always fits before the end of the ring.
+_FRAME = struct.Struct("<II")
+_ALIGN = 8
+_WRAP = 0xFFFFFFFF
+
+_READY, _TAKEN, _RELEASED = 0, 1, 2
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+class SharedMemoryRingBuffer:
+    """
+    A bounded blocking queue of bytes payloads shared between processes.
+
+    Follows the BoundedBlockingQueue contract: put()/put_many() block
+    while the ring lacks room, get()/get_many() block until a payload is
+    available, `timeout=` raises TimeoutError (get_many returns []), and
+    close() makes puts raise QueueClosed and gets raise it once drained.
+
+    - Items must support the buffer protocol (bytes, bytearray,
+      memoryview, array...); put() copies them into the ring once.
+    - get() returns a read-only memoryview of the payload in shared
+      memory, without copying. The view stays valid until the same
+      thread's next get()/get_many() or release(); after that the slot
+      is recycled and the view is released, so copy (bytes(view)) any
+      payload that must outlive it.
+    - `capacity` is the ring size in bytes. Each frame takes an 8-byte
+      header plus the payload rounded up to 8 bytes.
+
+    The creating process owns the segment and must call dispose() when
+    done; other processes receive a handle by pickling (e.g. as a
+    Process argument) and attach to the same segment.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        context = context or multiprocessing.get_context()
+        self._capacity = _aligned(capacity)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_CONTROL_SIZE + self._capacity
+        )
+        _CONTROL.pack_into(self._shm.buf, 0, 0, 0, 0, 0, 0)
+        self._owner = True
+
+        self._lock = context.Lock()
+        self._not_empty = context.Condition(self._lock)
+        self._not_full = context.Condition(self._lock)
+        # Offsets of frames handed out by this handle, per thread.
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        state["_owner"] = False
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(name=state["_shm"])
+        self._local = threading.local()
+
+    # ---------- Ring primitives (caller must hold the lock) ----------
+
+    def _control(self) -> List[int]:
+        return list(_CONTROL.unpack_from(self._shm.buf, 0))
+
+    def _store_control(self, control: List[int]) -> None:
+        _CONTROL.pack_into(self._shm.buf, 0, *control)
+
+    def _set_state(self, offset: int, state: int) -> None:
+        struct.pack_into("<I", self._shm.buf, _CONTROL_SIZE + offset % self._capacity + 4, state)
+
+    def _room_needed(self, write: int, frame: int) -> int:
+        tail_room = self._capacity - write % self._capacity
+        return frame if frame <= tail_room else frame + tail_room
+
+    def _write_frame(self, control: List[int], data: memoryview, frame: int) -> None:
+        buf = self._shm.buf
+        write = control[0]
+        position = write % self._capacity
+        tail_room = self._capacity - position
+        if frame > tail_room:
+            # Payloads must be contiguous: mark the tail as skipped.
+            _FRAME.pack_into(buf, _CONTROL_SIZE + position, _WRAP, _RELEASED)
+            write += tail_room
+            position = 0
+        start = _CONTROL_SIZE + position
+        _FRAME.pack_into(buf, start, data.nbytes, _READY)
+        buf[start + _FRAME.size:start + _FRAME.size + data.nbytes] = data
+        control[0] = write + frame
+        control[3] += 1
+
+    def _take_frame(self, control: List[int]) -> memoryview:
+        buf = self._shm.buf
+        read = control[1]
+        position = read % self._capacity
+        length, _ = _FRAME.unpack_from(buf, _CONTROL_SIZE + position)
+        if length == _WRAP:
+            read += self._capacity - position
+            position = 0
+            length, _ = _FRAME.unpack_from(buf, _CONTROL_SIZE + position)
+        _FRAME.pack_into(buf, _CONTROL_SIZE + position, length, _TAKEN)
+        self._outstanding().append(read)
+        control[1] = read + _aligned(_FRAME.size + length)
+        control[3] -= 1
+        start = _CONTROL_SIZE + position + _FRAME.size
+        return buf[start:start + length].toreadonly()
+
+    def _reclaim(self, control: List[int]) -> bool:
+        """Advance the reclaim offset over released frames."""
+        buf = self._shm.buf
+        reclaim, read = control[2], control[1]
+        start = reclaim
+        while reclaim < read:
+            position = reclaim % self._capacity
+            length, state = _FRAME.unpack_from(buf, _CONTROL_SIZE + position)
+            if state != _RELEASED:
+                break
+            if length == _WRAP:
+                reclaim += self._capacity - position
+            else:
+                reclaim += _aligned(_FRAME.size + length)
+        control[2] = reclaim
+        return reclaim != start
+
+    def _outstanding(self) -> List[int]:
+        try:
+            return self._local.frames
+        except AttributeError:
+            self._local.frames = []
+            self._local.views = []
+            return self._local.frames
+
+    def _release_outstanding(self, control: List[int]) -> None:
+        frames = self._outstanding()
+        if not frames:
+            return
+        for view in self._local.views:
+            view.release()
+        for offset in frames:
+            self._set_state(offset, _RELEASED)
+        frames.clear()
+        self._local.views.clear()
+        if self._reclaim(control):
+            # Freed room may fit several waiting producers of any size.
+            self._not_full.notify_all()
+
+    def _wait(self, condition: Any, ready: Any, deadline: Optional[float]) -> bool:
+        while not ready():
+            if deadline is None:
+                condition.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                condition.wait(remaining)
+        return True
+
+    def _put_locked(self, data: memoryview, deadline: Optional[float]) -> bool:
+        frame = _aligned(_FRAME.size + data.nbytes)
+        if frame > self._capacity:
+            raise ValueError(
+                f"Item of {data.nbytes} bytes does not fit a {self._capacity}-byte ring"
+            )
+        control = self._control()
+
+        def has_room() -> bool:
+            control[:] = self._control()
+            if control[4]:
+                raise QueueClosed("Cannot put into a closed queue")
+            used = control[0] - control[2]
+            return self._capacity - used >= self._room_needed(control[0], frame)
+
+        if not self._wait(self._not_full, has_room, deadline):
+            return False
+        self._write_frame(control, data, frame)
+        self._store_control(control)
+        return True
+
+    def _wait_for_item(self, control: List[int], deadline: Optional[float]) -> bool:
+        def has_item() -> bool:
+            control[:] = self._control()
+            if not control[3] and control[4]:
+                raise QueueClosed("Queue is closed and drained")
+            return control[3] > 0
+
+        return self._wait(self._not_empty, has_item, deadline)
+
+    # ---------- Public API ----------
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """
+        Copy a bytes-like item into the ring.
+        Blocks until there is room for it.
+
+        Raises TimeoutError if `timeout` seconds pass without room,
+        QueueClosed if the queue is (or becomes) closed, and ValueError
+        if the item can never fit.
+        """
+        data = memoryview(item).cast("B")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if not self._put_locked(data, deadline):
+                raise TimeoutError("Timed out waiting for queue space")
+            self._not_empty.notify()
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """
+        Copy a batch of items into the ring, in order, under one lock
+        acquisition; blocks only when the next item does not fit.
+        """
+        views = [memoryview(item).cast("B") for item in items]
+        with self._lock:
+            for index, data in enumerate(views):
+                control = self._control()
+                used = control[0] - control[2]
+                frame = _aligned(_FRAME.size + data.nbytes)
+                if self._capacity - used < self._room_needed(control[0], frame):
+                    # Let consumers start on what we have before waiting.
+                    self._not_empty.notify_all()
+                self._put_locked(data, None)
+            if views:
+                self._not_empty.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> memoryview:
+        """
+        Return a view of the next payload, blocking until one is available.
+
+        Releases the views previously returned to this thread. Raises
+        TimeoutError if `timeout` expires first, and QueueClosed once the
+        queue is closed and fully drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            control = self._control()
+            self._release_outstanding(control)
+            self._store_control(control)
+            if not self._wait_for_item(control, deadline):
+                raise TimeoutError("Timed out waiting for an item")
+            view = self._take_frame(control)
+            self._store_control(control)
+        self._local.views.append(view)
+        return view
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[memoryview]:
+        """
+        Return views of up to `max_items` payloads in FIFO order.
+
+        Same blocking and release rules as get(); returns [] if
+        `timeout` expires before any payload is available.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            control = self._control()
+            self._release_outstanding(control)
+            self._store_control(control)
+            if not self._wait_for_item(control, deadline):
+                return []
+            views = [self._take_frame(control) for _ in range(min(max_items, control[3]))]
+            self._store_control(control)
+        self._local.views.extend(views)
+        return views
+
+    def release(self) -> None:
+        """Release the views returned to this thread so their room can be reused."""
+        with self._lock:
+            control = self._control()
+            self._release_outstanding(control)
+            self._store_control(control)
+
+    def close(self) -> None:
+        """
+        Close the queue and wake every waiting thread and process.
+
+        Further puts raise QueueClosed; once drained, gets raise it too.
+        """
+        with self._lock:
+            control = self._control()
+            control[4] = 1
+            self._store_control(control)
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def dispose(self) -> None:
+        """
+        Release this handle's views and detach from the shared memory.
+        The owning handle also frees the segment.
+        """
+        self.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    @property
+    def closed(self) -> bool:
+        with self._lock:
+            return bool(self._control()[4])
+
+    def size(self) -> int:
+        """Return the number of payloads waiting to be read."""
+        with self._lock:
+            return self._control()[3]
+
+    def bytes_used(self) -> int:
+        """Return the number of ring bytes not yet reclaimed."""
+        with self._lock:
+            control = self._control()
+            return control[0] - control[2]
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
@@ -0,0 +1,139 @@
+"""
+spill_queue.py
+
+Bounded blocking queue that overflows to disk instead of blocking.
+
+Up to `capacity` items are kept in the in-memory ring buffer. Anything
+beyond that is pickled into an append-only segment file and replayed in
+FIFO order as consumers catch up, so RAM stays bounded while producers
+keep running at full speed through bursts.
+"""
+
+import mmap
+import pickle
+import struct
+import tempfile
+from typing import Any, Iterable, Optional
+
+from blocking_queue import BoundedBlockingQueue, QueueClosed
+
+# Each spilled item is stored as a little-endian uint32 length + pickle.
+_FRAME_HEADER = struct.Struct("<I")
+
+
+class SpillingBlockingQueue(BoundedBlockingQueue):
+    """
+    A queue whose in-memory part is bounded by `capacity` and whose
+    overflow is spilled to a temporary segment file in `spill_dir`
+    (default: the system temp directory).
+
+    - put()/offer()/put_many() never block for space; they only raise
+      QueueClosed on a closed queue.
+    - Once anything has spilled, later items are spilled too, so the
+      file always holds the newest items and FIFO order is preserved.
+    - When the ring buffer empties, the next get() promotes up to
+      `capacity` spilled items back into it. Reads go through an mmap of
+      the segment file; the file is truncated once it has been drained.
+    - size() counts both in-memory and spilled items.
+
+    Items that spill must be picklable. The segment file is deleted
+    when the queue is garbage collected.
+    """
+
+    def __init__(self, capacity: int, spill_dir: Optional[str] = None) -> None:
+        self._spill_dir = spill_dir
+        super().__init__(capacity)
+
+    # ---------- Storage (caller must hold the lock) ----------
+
+    def _init_storage(self) -> None:
+        super()._init_storage()
+        self._segment = tempfile.TemporaryFile(dir=self._spill_dir)
+        self._map: Optional[mmap.mmap] = None
+        self._spilled = 0
+        self._read_offset = 0
+        self._write_offset = 0
+
+    def _append(self, item: Any) -> None:
+        if self._spilled or self._count >= self._capacity:
+            self._spill(item)
+        else:
+            super()._append(item)
+
+    def _popleft(self) -> Any:
+        if self._count == self._spilled:
+            self._promote()
+        return super()._popleft()
+
+    def _spill(self, item: Any) -> None:
+        payload = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._segment.write(_FRAME_HEADER.pack(len(payload)))
+        self._segment.write(payload)
+        self._write_offset += _FRAME_HEADER.size + len(payload)
+        self._spilled += 1
+        self._count += 1
+
+    def _promote(self) -> None:
+        """Move up to `capacity` spilled items into the empty ring buffer."""
+        if self._map is None or len(self._map) < self._write_offset:
+            self._segment.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._segment.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = self._map
+        offset = self._read_offset
+        moved = min(self._capacity, self._spilled)
+        for _ in range(moved):
+            (length,) = _FRAME_HEADER.unpack_from(view, offset)
+            offset += _FRAME_HEADER.size
+            # _count already includes spilled items; the base _append
+            # increments it again, so compensate here.
+            super()._append(pickle.loads(view[offset:offset + length]))
+            self._count -= 1
+            offset += length
+        self._read_offset = offset
+        self._spilled -= moved
+
+        if not self._spilled:
+            # Drained: reclaim the disk space instead of growing forever.
+            self._map.close()
+            self._map = None
+            self._segment.seek(0)
+            self._segment.truncate()
+            self._read_offset = 0
+            self._write_offset = 0
+
+    def _wait_for_space(self, timeout: Optional[float]) -> bool:
+        # Overflow goes to disk, so producers never wait for space.
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        return True
+
+    # ---------- Producer side ----------
+
+    def offer(self, item: Any) -> bool:
+        """Put an item; always succeeds unless the queue is closed."""
+        self.put(item)
+        return True
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Put a batch of items under one lock acquisition, spilling any overflow."""
+        batch = list(items)
+        with self._lock:
+            self._wait_for_space(None)
+            for item in batch:
+                self._append(item)
+            self._not_empty.notify(len(batch))
+
+    # ---------- Introspection ----------
+
+    def spilled_count(self) -> int:
+        """Return the number of items currently held on disk."""
+        with self._lock:
+            return self._spilled
+
+    def spilled_bytes(self) -> int:
+        """Return the size of the unread part of the segment file."""
+        with self._lock:
+            return self._write_offset - self._read_offset
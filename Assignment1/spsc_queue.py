@@ -0,0 +1,230 @@
+"""
+spsc_queue.py
+
+Single-producer / single-consumer bounded queue with a lock-free fast path.
+
+With exactly one thread calling put*() and one thread calling get*(),
+each index is written by only one side: the producer advances `_tail`
+after filling a slot and the consumer advances `_head` after emptying
+one. Under the GIL these attribute stores are atomic and ordered, so
+the uncontended path needs no lock at all. The Condition variables are
+only used when the buffer is full/empty, together with "waiting" flags
+that tell the other side it has to take the lock and notify.
+"""
+
+import threading
+import time
+from typing import Any, Iterable, List, Optional
+
+from blocking_queue import QueueClosed
+
+
+class SPSCQueue:
+    """
+    Bounded blocking queue for exactly one producer and one consumer.
+
+    Same public contract as BoundedBlockingQueue (put/get with timeout,
+    offer/poll, put_many/get_many, close). Using it from more than one
+    producer or more than one consumer thread is not supported; close()
+    and size() may be called from any thread.
+
+    `_head` and `_tail` are monotonically increasing counters; the slot
+    for counter n is n % capacity and occupancy is `_tail - _head`.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        self._capacity = capacity
+        self._slots: List[Any] = [None] * capacity
+        self._head = 0  # written by the consumer only
+        self._tail = 0  # written by the producer only
+        self._closed = False
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._consumer_waiting = False
+        self._producer_waiting = False
+
+    # ---------- Slow paths (take the lock) ----------
+
+    def _wait_for_space(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            # Publish the flag before re-checking, so a consumer that frees a
+            # slot after our check is guaranteed to see it and notify.
+            self._producer_waiting = True
+            try:
+                while True:
+                    if self._closed:
+                        raise QueueClosed("Cannot put into a closed queue")
+                    if self._tail - self._head < self._capacity:
+                        return True
+                    if deadline is None:
+                        self._not_full.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self._not_full.wait(remaining)
+            finally:
+                self._producer_waiting = False
+
+    def _wait_for_item(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._consumer_waiting = True
+            try:
+                while self._tail == self._head:
+                    if self._closed:
+                        raise QueueClosed("Queue is closed and drained")
+                    if deadline is None:
+                        self._not_empty.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self._not_empty.wait(remaining)
+                return True
+            finally:
+                self._consumer_waiting = False
+
+    def _wake_consumer(self) -> None:
+        if self._consumer_waiting:
+            with self._lock:
+                self._not_empty.notify()
+
+    def _wake_producer(self) -> None:
+        if self._producer_waiting:
+            with self._lock:
+                self._not_full.notify()
+
+    # ---------- Producer side ----------
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """
+        Put an item, blocking while the queue is full.
+
+        Raises TimeoutError if `timeout` expires and QueueClosed if the
+        queue is closed.
+        """
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        tail = self._tail
+        if tail - self._head >= self._capacity and not self._wait_for_space(timeout):
+            raise TimeoutError("Timed out waiting for queue space")
+        self._slots[tail % self._capacity] = item
+        self._tail = tail + 1
+        self._wake_consumer()
+
+    def offer(self, item: Any) -> bool:
+        """Put an item only if there is space right now."""
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        tail = self._tail
+        if tail - self._head >= self._capacity:
+            return False
+        self._slots[tail % self._capacity] = item
+        self._tail = tail + 1
+        self._wake_consumer()
+        return True
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Put a batch in order, blocking only for the part that does not fit."""
+        batch = list(items)
+        index = 0
+        total = len(batch)
+        capacity = self._capacity
+        slots = self._slots
+        while index < total:
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            tail = self._tail
+            free = capacity - (tail - self._head)
+            if not free:
+                self._wait_for_space(None)
+                continue
+            moved = min(free, total - index)
+            for offset in range(moved):
+                slots[(tail + offset) % capacity] = batch[index + offset]
+            self._tail = tail + moved
+            index += moved
+            self._wake_consumer()
+
+    # ---------- Consumer side ----------
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Remove and return an item, blocking while the queue is empty.
+
+        Raises TimeoutError if `timeout` expires and QueueClosed once the
+        queue is closed and drained.
+        """
+        head = self._head
+        if self._tail == head and not self._wait_for_item(timeout):
+            raise TimeoutError("Timed out waiting for an item")
+        index = head % self._capacity
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        self._wake_producer()
+        return item
+
+    def poll(self, default: Any = None) -> Any:
+        """Remove and return an item if one is available, else `default`."""
+        head = self._head
+        if self._tail == head:
+            return default
+        index = head % self._capacity
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        self._wake_producer()
+        return item
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to `max_items` items in FIFO order.
+
+        Returns an empty list if `timeout` expires first; raises
+        QueueClosed once the queue is closed and drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+        head = self._head
+        if self._tail == head and not self._wait_for_item(timeout):
+            return []
+        capacity = self._capacity
+        slots = self._slots
+        taken = min(max_items, self._tail - head)
+        items = []
+        for offset in range(taken):
+            index = (head + offset) % capacity
+            items.append(slots[index])
+            slots[index] = None
+        self._head = head + taken
+        self._wake_producer()
+        return items
+
+    # ---------- Lifecycle / introspection ----------
+
+    def close(self) -> None:
+        """Close the queue and wake both sides (see BoundedBlockingQueue.close)."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def size(self) -> int:
+        """Return current number of items in the queue (lock-free snapshot)."""
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
@@ -0,0 +1,188 @@
+"""
+stages.py
+
+Multi-stage pipelines built from BoundedBlockingQueue, Producer and
+Consumer.
+
+Each stage has its own transform, worker count and input queue
+capacity, so I/O-bound and CPU-bound steps can overlap and be tuned
+independently:
+
+    result = (
+        Pipeline()
+        .stage(parse, workers=4)
+        .stage(enrich, workers=2, capacity=100)
+        .sink(write_row)
+        .run(lines)
+    )
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+from consumer import Consumer, NO_SENTINEL
+from logging_utils import log
+from pipeline import PipelineResult, Sink, make_queue, open_sink
+from producer import Producer
+
+
+@dataclass
+class Stage:
+    """One step of a multi-stage pipeline."""
+    transform: Callable[[Any], Any]
+    workers: int
+    capacity: int
+    name: str
+
+
+class Pipeline:
+    """
+    Fluent builder for a chain of stages.
+
+    - stage() appends a transform with its own workers and queue capacity.
+    - sink() sets an optional streaming destination for the last stage.
+    - run() wires everything together and blocks until the source is
+      fully processed.
+
+    Shutdown cascades stage by stage: once every worker of a stage has
+    exited, the next stage's input queue is closed. The first error from
+    the source, a transform or the sink stops every worker, closes every
+    queue and is re-raised by run().
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1,
+        log_items: bool = True,
+        summary_every: int = 0,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._batch_size = batch_size
+        self._log_items = log_items
+        self._summary_every = summary_every
+        self._stages: List[Stage] = []
+        self._sink: Optional[Sink] = None
+
+    def stage(
+        self,
+        transform: Callable[[Any], Any],
+        workers: int = 1,
+        capacity: int = 5,
+        name: Optional[str] = None,
+    ) -> "Pipeline":
+        """Append a stage and return the pipeline for chaining."""
+        if workers <= 0:
+            raise ValueError("Stage workers must be positive")
+        if capacity <= 0:
+            raise ValueError("Stage capacity must be positive")
+        self._stages.append(
+            Stage(
+                transform=transform,
+                workers=workers,
+                capacity=capacity,
+                name=name or getattr(transform, "__name__", f"stage{len(self._stages)}"),
+            )
+        )
+        return self
+
+    def sink(self, sink: Sink) -> "Pipeline":
+        """Stream final results to a callable or generator instead of a list."""
+        self._sink = sink
+        return self
+
+    @property
+    def stages(self) -> List[Stage]:
+        return list(self._stages)
+
+    def run(self, source: Iterable[Any]) -> PipelineResult:
+        """
+        Push every item of `source` through all stages.
+
+        Raises the first error from any stage once all workers have exited.
+
+        :return: PipelineResult whose destination holds the output of the
+            last stage (empty when a sink is set). Order is preserved only
+            when every stage has a single worker.
+        """
+        if not self._stages:
+            raise ValueError("Pipeline has no stages")
+
+        # A stage's input queue is fed by the previous stage's workers (or
+        # the single producer), which lets 1:1 links use SPSCQueue.
+        queues = [
+            make_queue(
+                stage.capacity,
+                num_producers=self._stages[position - 1].workers if position else 1,
+                num_consumers=stage.workers,
+            )
+            for position, stage in enumerate(self._stages)
+        ]
+        last = len(self._stages) - 1
+        emit, close_sink = open_sink(self._sink, serialize=self._stages[last].workers > 1)
+        partials: List[List[Any]] = [[] for _ in range(self._stages[last].workers)]
+        pools: List[List[Consumer]] = []
+        failures: List[Exception] = []
+
+        def abort(error: Exception) -> None:
+            # Stop every stage at once: a failed worker would otherwise
+            # leave its upstream blocked on a full queue.
+            failures.append(error)
+            producer.stop()
+            for pool in pools:
+                for worker in pool:
+                    worker.stop()
+            for queue in queues:
+                queue.close()
+
+        producer = Producer(
+            source=source,
+            queue=queues[0],
+            batch_size=self._batch_size,
+            send_sentinel=False,
+            log_items=self._log_items,
+            summary_every=self._summary_every,
+            on_fatal=abort,
+        )
+        for position, stage in enumerate(self._stages):
+            pools.append([
+                Consumer(
+                    queue=queues[position],
+                    destination=(
+                        queues[position + 1].put if position < last
+                        else emit or partials[index]
+                    ),
+                    sentinel=NO_SENTINEL,
+                    batch_size=self._batch_size,
+                    transform=stage.transform,
+                    name=f"{stage.name}-{index}",
+                    log_items=self._log_items,
+                    summary_every=self._summary_every,
+                    on_fatal=abort,
+                )
+                for index in range(stage.workers)
+            ])
+
+        try:
+            producer.start()
+            for pool in pools:
+                for worker in pool:
+                    worker.start()
+
+            producer.join()
+            for position, pool in enumerate(pools):
+                queues[position].close()
+                for worker in pool:
+                    worker.join()
+                log(f"Stage {self._stages[position].name!r} finished.")
+            if failures:
+                raise failures[0]
+        finally:
+            close_sink()
+
+        destination: List[Any] = [item for partial in partials for item in partial]
+        return PipelineResult(
+            destination=destination,
+            produced_count=producer.produced_count,
+            consumed_count=sum(worker.consumed_count for worker in pools[last]),
+        )
@@ -0,0 +1,42 @@
+"""
+bench_cache.py
+
+Startup cost of loading a SalesTable by parsing the CSV versus mapping
+the binary columnar cache written on the first run.
+
+Run from the Assignment2 directory:
+    python -m Benchmarks.bench_cache
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from Benchmarks.bench_csv import write_dataset
+from io_utils import load_sales_table_from_csv
+
+ROWS = [10_000, 100_000, 1_000_000]
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'rows':>9} {'parse s':>8} {'build cache s':>14} {'mapped s':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in ROWS:
+            path = Path(tmp) / f"sales_{rows}.csv"
+            write_dataset(path, rows)
+            parse = _timed(lambda: load_sales_table_from_csv(path))
+            build = _timed(lambda: load_sales_table_from_csv(path, cache=True))
+            mapped = _timed(lambda: load_sales_table_from_csv(path, cache=True))
+            print(f"{rows:>9} {parse:>8.3f} {build:>14.3f} {mapped:>9.4f} {parse / mapped:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+bench_csv.py
+
+Compares CSV ingestion through the fast _read_rows path (csv.reader by
+column index, memoized dates/booleans, shared strings) with the original
+csv.DictReader + strptime-per-row loader.
+
+The bundled dataset is repeated with fresh order ids into a temporary
+file of each size.
+
+Run from the Assignment2 directory:
+    python -m Benchmarks.bench_csv
+"""
+
+from __future__ import annotations
+
+import csv
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+from io_utils import DATE_FORMAT, _parse_bool, load_sales_from_csv
+from models import SaleRecord
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+ROWS = [10_000, 100_000, 500_000]
+REPEAT = 3
+
+
+def dictreader_load(path: Path) -> List[SaleRecord]:
+    """The original loader: a dict and a strptime call per row."""
+    with path.open(newline="", encoding="utf-8") as f:
+        return [
+            SaleRecord(
+                order_id=row["order_id"],
+                order_date=datetime.strptime(row["order_date"], DATE_FORMAT).date(),
+                country=row["country"],
+                category=row["category"],
+                product=row["product"],
+                customer_id=row["customer_id"],
+                quantity=int(row["quantity"]),
+                unit_price=float(row["unit_price"]),
+                discount=float(row["discount"]),
+                returned=_parse_bool(row["returned"]),
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+def write_dataset(path: Path, rows: int) -> None:
+    with DATA_CSV.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        base = list(reader)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(rows):
+            writer.writerow([f"S{i}"] + base[i % len(base)][1:])
+
+
+def _best_of(fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'rows':>8} {'DictReader s':>13} {'fast s':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in ROWS:
+            path = Path(tmp) / f"sales_{rows}.csv"
+            write_dataset(path, rows)
+            baseline = _best_of(lambda: dictreader_load(path))
+            fast = _best_of(lambda: load_sales_from_csv(path))
+            print(f"{rows:>8} {baseline:>13.3f} {fast:>8.3f} {baseline / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+bench_parallel.py
+
+Scaling of aggregate_csv_parallel() with the number of worker
+processes, against the single-process streaming path used by main.py.
+Speedups are bounded by the CPU count of the machine.
+
+Run from the Assignment2 directory:
+    python -m Benchmarks.bench_parallel
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from aggregation import aggregate_sales
+from Benchmarks.bench_csv import write_dataset
+from io_utils import iter_sales_from_csv
+from parallel import aggregate_csv_parallel
+
+ROWS = 1_000_000
+CHUNK_BYTES = 4 * 1024 * 1024
+WORKERS = [1, 2, 4, 8]
+
+
+def main() -> None:
+    print(f"rows={ROWS:,} cpus={os.cpu_count()}")
+    print(f"{'mode':>12} {'seconds':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sales.csv"
+        write_dataset(path, ROWS)
+
+        start = time.perf_counter()
+        aggregate_sales(iter_sales_from_csv(path))
+        streaming = time.perf_counter() - start
+        print(f"{'streaming':>12} {streaming:>8.3f} {1.0:>7.1f}x")
+
+        for workers in WORKERS:
+            start = time.perf_counter()
+            aggregate_csv_parallel(path, workers=workers, chunk_bytes=CHUNK_BYTES)
+            elapsed = time.perf_counter() - start
+            print(f"{f'{workers} workers':>12} {elapsed:>8.3f} {streaming / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
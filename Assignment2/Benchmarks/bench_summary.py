@@ -0,0 +1,91 @@
+"""
+bench_summary.py
+
+Compares SalesAnalyzer.summary() computed the old way (seven separate
+analysis passes, net_amount recomputed in each) with the fused
+single-pass aggregation, for both SaleRecord lists and a SalesTable.
+
+Rows are synthesized by cycling the bundled dataset with fresh order
+ids and dates, so group cardinalities stay realistic at any size.
+
+Run from the Assignment2 directory:
+    python -m Benchmarks.bench_summary
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from analysis import (
+    average_order_value,
+    monthly_revenue,
+    returns_rate,
+    revenue_by_category,
+    revenue_by_country,
+    top_n_customers_by_revenue,
+    total_revenue,
+)
+from io_utils import load_sales_from_csv
+from models import SaleRecord
+from sales_analysis import SalesAnalyzer
+from sales_table import SalesTable
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+ROWS = [10_000, 100_000, 500_000]
+REPEAT = 3
+
+
+def synthesize(rows: int) -> List[SaleRecord]:
+    base = load_sales_from_csv(DATA_CSV)
+    return [
+        replace(
+            base[i % len(base)],
+            order_id=f"S{i}",
+            order_date=base[i % len(base)].order_date + timedelta(days=(i // len(base)) % 365),
+        )
+        for i in range(rows)
+    ]
+
+
+def separate_passes(sales) -> Dict[str, object]:
+    """The pre-fusion summary(): one full scan per metric."""
+    return {
+        "total_revenue": total_revenue(sales),
+        "average_order_value": average_order_value(sales),
+        "returns_rate": returns_rate(sales),
+        "revenue_by_country": revenue_by_country(sales),
+        "revenue_by_category": revenue_by_category(sales),
+        "monthly_revenue": monthly_revenue(sales),
+        "top_customers_by_revenue": top_n_customers_by_revenue(sales),
+    }
+
+
+def _best_of(make_input: Callable[[], object], run: Callable[[object], object]) -> float:
+    """Best wall time of `run` over REPEAT fresh inputs (input building not timed)."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        sales = make_input()
+        start = time.perf_counter()
+        run(sales)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'rows':>8} {'input':>7} {'separate s':>11} {'fused s':>9} {'speedup':>8}")
+    for rows in ROWS:
+        records = synthesize(rows)
+        # A fresh table per run, so its cached net amount column is not
+        # shared between the two measurements.
+        inputs = (("rows", lambda: records), ("table", lambda: SalesTable.from_records(records)))
+        for name, make_input in inputs:
+            separate = _best_of(make_input, separate_passes)
+            fused = _best_of(make_input, lambda sales: SalesAnalyzer(sales).summary())
+            print(f"{rows:>8} {name:>7} {separate:>11.3f} {fused:>9.3f} {separate / fused:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
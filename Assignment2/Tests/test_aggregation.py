@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from aggregation import SalesAggregates, aggregate_sales
+from analysis import (
+    average_order_value,
+    monthly_revenue,
+    returns_rate,
+    revenue_by_category,
+    revenue_by_country,
+    summarize,
+    top_n_customers_by_revenue,
+    total_revenue,
+)
+from io_utils import iter_sales_from_csv, load_sales_from_csv
+from sales_analysis import SalesAnalyzer
+from sales_table import SalesTable
+
+from Tests.test_sales_analysis import _sample_sales
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+
+
+class TestAggregateSales(unittest.TestCase):
+    def test_sample_accumulators(self):
+        agg = aggregate_sales(_sample_sales())
+        self.assertEqual(agg.count, 5)
+        self.assertEqual(agg.returned_count, 1)
+        self.assertAlmostEqual(agg.total_revenue, 1120.0)
+        self.assertEqual(list(agg.revenue_by_country), ["USA", "Canada"])
+        self.assertEqual(agg.revenue_by_month, {(2024, 1): 950.0, (2024, 2): 170.0})
+
+    def test_consumes_iterator_once(self):
+        agg = aggregate_sales(iter(_sample_sales()))
+        self.assertEqual(agg.count, 5)
+
+    def test_empty(self):
+        agg = aggregate_sales([])
+        self.assertEqual(agg, SalesAggregates())
+        self.assertEqual(average_order_value(agg), 0.0)
+        self.assertEqual(returns_rate(agg), 0.0)
+        self.assertEqual(top_n_customers_by_revenue(agg), [])
+
+
+class TestFusedMatchesSeparatePasses(unittest.TestCase):
+    """
+    Analysis functions fed aggregates must agree with the per-function
+    passes: group dicts (values and order) exactly, scalar totals up to
+    float summation order.
+    """
+
+    def _assert_matches(self, records):
+        for source in (records, SalesTable.from_records(records)):
+            agg = aggregate_sales(source)
+            self.assertAlmostEqual(total_revenue(agg), total_revenue(records), places=6)
+            self.assertAlmostEqual(average_order_value(agg), average_order_value(records), places=6)
+            self.assertEqual(returns_rate(agg), returns_rate(records))
+            for fn in (revenue_by_country, revenue_by_category, monthly_revenue):
+                self.assertEqual(list(fn(agg).items()), list(fn(records).items()))
+            for n in (0, 3, 1000):
+                self.assertEqual(
+                    top_n_customers_by_revenue(agg, n=n),
+                    top_n_customers_by_revenue(records, n=n),
+                )
+
+    def test_sample_sales(self):
+        self._assert_matches(_sample_sales())
+
+    def test_dataset(self):
+        self._assert_matches(load_sales_from_csv(DATA_CSV))
+
+    def test_analyzer_aggregates_once(self):
+        analyzer = SalesAnalyzer(_sample_sales())
+        first = analyzer.aggregates()
+        analyzer.summary()
+        analyzer.top_n_customers_by_revenue(n=1)
+        self.assertIs(analyzer.aggregates(), first)
+
+
+class TestIncrementalAggregation(unittest.TestCase):
+    def test_add_one_at_a_time_matches_batch(self):
+        agg = SalesAggregates()
+        for sale in _sample_sales():
+            agg.add(sale)
+        self.assertEqual(agg, aggregate_sales(_sample_sales()))
+
+    def test_update_in_chunks_matches_single_pass(self):
+        records = load_sales_from_csv(DATA_CSV)
+        agg = SalesAggregates()
+        for start in range(0, len(records), 7):
+            agg.update(records[start:start + 7])
+        self.assertEqual(agg, aggregate_sales(records))
+
+    @unittest.skipIf(sys.version_info >= (3, 12), "sum() compensates rounding on 3.12+")
+    def test_total_reproduces_row_based_sum(self):
+        """
+        Table and aggregate paths add net amounts left to right, exactly
+        like sum() over the rows, so they reproduce its rounding.
+        """
+        sale = replace(_sample_sales()[0], quantity=1, unit_price=0.1, discount=0.0)
+        records = [sale] * 10
+        table = SalesTable.from_records(records)
+        # Ten 0.1 sales: a left-to-right float sum gives 0.9999999999999999.
+        self.assertEqual(total_revenue(records), 0.9999999999999999)
+        for source in (table, aggregate_sales(records), aggregate_sales(table)):
+            self.assertEqual(total_revenue(source), total_revenue(records))
+            self.assertEqual(average_order_value(source), average_order_value(records))
+        self.assertEqual(SalesAnalyzer(records).summary()["total_revenue"], 0.9999999999999999)
+
+    def test_merge_of_slices(self):
+        records = load_sales_from_csv(DATA_CSV)
+        whole = aggregate_sales(records)
+        merged = aggregate_sales(records[:40]).merge(
+            aggregate_sales(SalesTable.from_records(records[40:]))
+        )
+        self.assertEqual(merged.count, whole.count)
+        self.assertEqual(merged.returned_count, whole.returned_count)
+        self.assertAlmostEqual(merged.total_revenue, whole.total_revenue, places=6)
+        for name in ("revenue_by_country", "revenue_by_category",
+                     "revenue_by_month", "revenue_by_customer"):
+            mine, theirs = getattr(merged, name), getattr(whole, name)
+            self.assertEqual(list(mine), list(theirs))
+            for key in theirs:
+                self.assertAlmostEqual(mine[key], theirs[key], places=6)
+
+    def test_streamed_summary_matches_analyzer(self):
+        streamed = summarize(aggregate_sales(iter_sales_from_csv(DATA_CSV)))
+        self.assertEqual(streamed, SalesAnalyzer(load_sales_from_csv(DATA_CSV)).summary())
+
+
+class TestIterSalesFromCsv(unittest.TestCase):
+    def test_yields_same_records_as_loader(self):
+        self.assertEqual(list(iter_sales_from_csv(DATA_CSV)), load_sales_from_csv(DATA_CSV))
+
+    def test_is_lazy(self):
+        stream = iter_sales_from_csv(DATA_CSV)
+        first = next(stream)
+        self.assertEqual(first, load_sales_from_csv(DATA_CSV)[0])
+        stream.close()
+
+    def test_missing_file_raises_on_iteration(self):
+        stream = iter_sales_from_csv(DATA_CSV.with_name("missing.csv"))
+        with self.assertRaises(FileNotFoundError):
+            next(stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
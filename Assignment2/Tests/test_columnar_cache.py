@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from analysis import summarize
+import columnar_cache
+from columnar_cache import cache_path_for, read_cache, write_cache
+from io_utils import load_sales_from_csv, load_sales_table_from_csv
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+
+
+class TestColumnarCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.csv = Path(self._tmp.name) / "sales.csv"
+        shutil.copyfile(DATA_CSV, self.csv)
+        self.cache = cache_path_for(self.csv)
+
+    def test_first_load_writes_cache_and_second_maps_it(self):
+        parsed = load_sales_table_from_csv(self.csv, cache=True)
+        self.assertTrue(self.cache.exists())
+        self.assertFalse(parsed.read_only)
+
+        mapped = load_sales_table_from_csv(self.csv, cache=True)
+        self.assertTrue(mapped.read_only)
+        self.assertIsInstance(mapped.quantity, memoryview)
+        self.assertEqual(list(mapped), list(parsed))
+        self.assertEqual(summarize(mapped), summarize(parsed))
+
+    def test_records_loader_uses_cache(self):
+        expected = load_sales_from_csv(self.csv)
+        self.assertEqual(load_sales_from_csv(self.csv, cache=True), expected)
+        self.assertEqual(load_sales_from_csv(self.csv, cache=True), expected)
+
+    def test_custom_cache_location(self):
+        custom = Path(self._tmp.name) / "custom.bin"
+        load_sales_table_from_csv(self.csv, cache=custom)
+        self.assertTrue(custom.exists())
+        self.assertFalse(self.cache.exists())
+        self.assertTrue(load_sales_table_from_csv(self.csv, cache=custom).read_only)
+
+    def test_mapped_table_is_read_only(self):
+        load_sales_table_from_csv(self.csv, cache=True)
+        mapped = load_sales_table_from_csv(self.csv, cache=True)
+        record = mapped.record(0)
+        with self.assertRaises(TypeError):
+            mapped.append(*(getattr(record, f) for f in record.__dataclass_fields__))
+
+    def test_stale_when_source_changes(self):
+        load_sales_table_from_csv(self.csv, cache=True)
+        lines = self.csv.read_text(encoding="utf-8").splitlines(keepends=True)
+        self.csv.write_text("".join(lines[:-1]), encoding="utf-8")
+        self.assertIsNone(read_cache(self.csv, self.cache))
+
+        table = load_sales_table_from_csv(self.csv, cache=True)
+        self.assertEqual(len(table), len(lines) - 2)
+        self.assertEqual(len(load_sales_table_from_csv(self.csv, cache=True)), len(lines) - 2)
+
+    def test_stale_when_only_mtime_changes(self):
+        load_sales_table_from_csv(self.csv, cache=True)
+        stat = self.csv.stat()
+        os.utime(self.csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertIsNone(read_cache(self.csv, self.cache))
+
+    def test_corrupt_or_missing_cache_is_ignored(self):
+        self.assertIsNone(read_cache(self.csv, self.cache))
+        for content in (b"", b"SALESCOL", b"not a cache at all"):
+            self.cache.write_bytes(content)
+            self.assertIsNone(read_cache(self.csv, self.cache))
+            self.assertFalse(load_sales_table_from_csv(self.csv, cache=True).read_only)
+
+    def test_rejected_cache_is_unmapped(self):
+        load_sales_table_from_csv(self.csv, cache=True)
+        content = self.cache.read_bytes()
+        mappings = []
+        real_mmap = columnar_cache.mmap.mmap
+
+        def recording_mmap(*args, **kwargs):
+            mappings.append(real_mmap(*args, **kwargs))
+            return mappings[-1]
+
+        with mock.patch.object(columnar_cache.mmap, "mmap", recording_mmap):
+            # A column whose item size no longer matches fails after some
+            # views into the mapping already exist.
+            self.cache.write_bytes(content.replace(b'"itemsize": 8', b'"itemsize": 9', 1))
+            self.assertIsNone(read_cache(self.csv, self.cache))
+            stat = self.csv.stat()
+            os.utime(self.csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertIsNone(read_cache(self.csv, self.cache))
+
+        self.assertEqual(len(mappings), 2)
+        self.assertTrue(all(mapping.closed for mapping in mappings))
+
+    def test_empty_table_round_trip(self):
+        header = DATA_CSV.read_text(encoding="utf-8").splitlines()[0]
+        self.csv.write_text(header + "\n", encoding="utf-8")
+        table = load_sales_table_from_csv(self.csv, cache=True)
+        write_cache(table, self.csv, self.cache)
+        mapped = read_cache(self.csv, self.cache)
+        self.assertEqual(len(mapped), 0)
+        self.assertEqual(list(mapped), [])
+
+    def test_unwritable_cache_only_warns(self):
+        missing_dir = Path(self._tmp.name) / "no" / "such" / "dir" / "c.bin"
+        with self.assertWarns(UserWarning):
+            table = load_sales_table_from_csv(self.csv, cache=missing_dir)
+        self.assertEqual(len(table), len(load_sales_from_csv(self.csv)))
+
+    def test_missing_csv(self):
+        with self.assertRaises(FileNotFoundError):
+            load_sales_table_from_csv(Path(self._tmp.name) / "nope.csv", cache=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import csv
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from io_utils import load_sales_from_csv, load_sales_table_from_csv
+from Benchmarks.bench_csv import dictreader_load
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+
+HEADER = ("order_id,order_date,country,category,product,customer_id,"
+          "quantity,unit_price,discount,returned")
+
+
+class TestFastCsvLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write(self, text: str) -> Path:
+        path = Path(self._tmp.name) / "sales.csv"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_matches_dictreader_loader(self):
+        self.assertEqual(load_sales_from_csv(DATA_CSV), dictreader_load(DATA_CSV))
+
+    def test_columns_in_any_order_and_extra_columns(self):
+        path = self._write(
+            "returned,notes,customer_id,order_id,order_date,country,category,"
+            "product,quantity,unit_price,discount\n"
+            "yes,gift,C1,O1,2024-01-10,USA,Electronics,Laptop,2,10.5,0.1\n"
+        )
+        [record] = load_sales_from_csv(path)
+        self.assertEqual(record.order_id, "O1")
+        self.assertEqual(record.customer_id, "C1")
+        self.assertEqual(record.order_date, date(2024, 1, 10))
+        self.assertEqual(record.quantity, 2)
+        self.assertTrue(record.returned)
+
+    def test_blank_lines_are_skipped(self):
+        path = self._write(
+            HEADER + "\n\nO1,2024-01-10,USA,E,Laptop,C1,1,1.0,0,FALSE\n\n"
+        )
+        self.assertEqual(len(load_sales_from_csv(path)), 1)
+
+    def test_repeated_values_are_shared(self):
+        records = load_sales_from_csv(DATA_CSV)
+        by_value = {}
+        for r in records:
+            for value in (r.country, r.category, r.customer_id, r.order_date):
+                self.assertIs(by_value.setdefault(value, value), value)
+
+    def test_missing_columns_message(self):
+        path = self._write("order_id,order_date\nO1,2024-01-10\n")
+        with self.assertRaisesRegex(ValueError, "CSV missing required columns: "):
+            load_sales_from_csv(path)
+
+    def test_empty_file_reports_all_columns_missing(self):
+        path = self._write("")
+        with self.assertRaises(ValueError) as ctx:
+            load_sales_table_from_csv(path)
+        self.assertIn("'returned'", str(ctx.exception))
+
+    def test_invalid_date_message_shows_row_as_dict(self):
+        line = "O1,10/01/2024,USA,E,Laptop,C1,1,1.0,0,FALSE"
+        path = self._write(HEADER + "\n" + line + "\n")
+        expected = dict(zip(HEADER.split(","), next(csv.reader([line]))))
+        with self.assertRaises(ValueError) as ctx:
+            load_sales_from_csv(path)
+        self.assertEqual(str(ctx.exception), f"Invalid date format in row: {expected}")
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            load_sales_from_csv(Path(self._tmp.name) / "nope.csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from aggregation import aggregate_sales
+from analysis import summarize
+from io_utils import load_sales_from_csv
+from parallel import aggregate_csv_parallel, chunk_ranges
+from sales_analysis import SalesAnalyzer
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+
+
+class TestParallelAggregation(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write(self, text: str, newline: str = "\n") -> Path:
+        path = Path(self._tmp.name) / "sales.csv"
+        with path.open("w", encoding="utf-8", newline=newline) as f:
+            f.write(text)
+        return path
+
+    def _assert_close(self, actual, expected):
+        self.assertEqual(actual.count, expected.count)
+        self.assertEqual(actual.returned_count, expected.returned_count)
+        self.assertAlmostEqual(actual.total_revenue, expected.total_revenue, places=6)
+        for name in ("revenue_by_country", "revenue_by_category",
+                     "revenue_by_month", "revenue_by_customer"):
+            mine, theirs = getattr(actual, name), getattr(expected, name)
+            self.assertEqual(list(mine), list(theirs))
+            for key in theirs:
+                self.assertAlmostEqual(mine[key], theirs[key], places=6)
+
+    def test_chunks_are_line_aligned_and_contiguous(self):
+        data = DATA_CSV.read_bytes()
+        ranges = chunk_ranges(DATA_CSV, chunk_bytes=500)
+        self.assertGreater(len(ranges), 5)
+        self.assertEqual(ranges[0][0], data.index(b"\n") + 1)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_matches_sequential_with_worker_processes(self):
+        expected = aggregate_sales(load_sales_from_csv(DATA_CSV))
+        for workers in (1, 2):
+            result = aggregate_csv_parallel(DATA_CSV, workers=workers, chunk_bytes=700)
+            self._assert_close(result, expected)
+
+    def test_single_chunk_is_exact(self):
+        result = aggregate_csv_parallel(DATA_CSV, workers=2)
+        self.assertEqual(result, aggregate_sales(load_sales_from_csv(DATA_CSV)))
+
+    def test_crlf_line_endings(self):
+        text = DATA_CSV.read_text(encoding="utf-8")
+        path = self._write(text, newline="\r\n")
+        result = aggregate_csv_parallel(path, workers=2, chunk_bytes=300)
+        self._assert_close(result, aggregate_sales(load_sales_from_csv(DATA_CSV)))
+
+    def test_summary_from_aggregates(self):
+        aggregates = aggregate_csv_parallel(DATA_CSV, workers=2, chunk_bytes=1000)
+        summary = SalesAnalyzer.from_aggregates(aggregates).summary()
+        self.assertEqual(summary, summarize(aggregates))
+        self.assertEqual(
+            summary["top_customers_by_revenue"][0][0],
+            SalesAnalyzer(load_sales_from_csv(DATA_CSV)).summary()["top_customers_by_revenue"][0][0],
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "CSV missing required columns"):
+            aggregate_csv_parallel(self._write("order_id\nO1\n"), workers=2)
+
+        header = DATA_CSV.read_text(encoding="utf-8").splitlines()[0]
+        bad = self._write(header + "\nO1,2024/01/01,USA,E,P,C1,1,1.0,0,FALSE\n")
+        with self.assertRaisesRegex(ValueError, "Invalid date format in row"):
+            aggregate_csv_parallel(bad, workers=2, chunk_bytes=10)
+
+        with self.assertRaises(ValueError):
+            aggregate_csv_parallel(DATA_CSV, workers=0)
+        with self.assertRaises(FileNotFoundError):
+            aggregate_csv_parallel(Path(self._tmp.name) / "missing.csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from analysis import (
+    average_order_value,
+    generic_group_sum,
+    monthly_revenue,
+    returns_rate,
+    revenue_by_category,
+    revenue_by_country,
+    top_n_customers_by_revenue,
+    total_revenue,
+)
+from io_utils import load_sales_from_csv, load_sales_table_from_csv
+from sales_analysis import SalesAnalyzer
+from sales_table import SalesTable
+
+from Tests.test_sales_analysis import _sample_sales
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "Data" / "sales.csv"
+
+
+class TestSalesTable(unittest.TestCase):
+    def test_round_trip_preserves_records(self):
+        records = _sample_sales()
+        table = SalesTable.from_records(records)
+        self.assertEqual(len(table), len(records))
+        self.assertEqual(list(table), records)
+
+    def test_categorical_columns_are_dictionary_encoded(self):
+        table = SalesTable.from_records(_sample_sales())
+        # 5 rows but only 2 countries and 3 customers are stored.
+        self.assertEqual(table.country.values, ["USA", "Canada"])
+        self.assertEqual(table.customer_id.values, ["C1", "C2", "C3"])
+        self.assertEqual(list(table.country.codes), [0, 0, 1, 1, 0])
+
+    def test_net_amount_matches_records(self):
+        records = _sample_sales()
+        table = SalesTable.from_records(records)
+        self.assertEqual(list(table.net_amount), [r.net_amount for r in records])
+
+    def test_group_sum_keeps_first_appearance_order(self):
+        table = SalesTable.from_records(_sample_sales())
+        totals = table.customer_id.group_sum([1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(list(totals), ["C1", "C2", "C3"])
+        self.assertEqual(sum(totals.values()), 15.0)
+
+    def test_loader_matches_row_loader(self):
+        table = load_sales_table_from_csv(DATA_CSV)
+        self.assertEqual(list(table), load_sales_from_csv(DATA_CSV))
+
+
+class TestColumnarAnalysisMatchesRows(unittest.TestCase):
+    """
+    Every analysis function must return exactly the same result (not just
+    approximately) for a SalesTable as for the equivalent SaleRecord list,
+    including dict ordering and tie-breaking.
+    """
+
+    def _assert_identical(self, records):
+        table = SalesTable.from_records(records)
+        self.assertEqual(total_revenue(table), total_revenue(records))
+        self.assertEqual(average_order_value(table), average_order_value(records))
+        self.assertEqual(returns_rate(table), returns_rate(records))
+        for fn in (revenue_by_country, revenue_by_category, monthly_revenue):
+            self.assertEqual(list(fn(table).items()), list(fn(records).items()))
+        for n in (0, 2, 5, 1000):
+            self.assertEqual(
+                top_n_customers_by_revenue(table, n=n),
+                top_n_customers_by_revenue(records, n=n),
+            )
+        self.assertEqual(
+            generic_group_sum(table, key_fn=lambda s: s.product, value_fn=lambda s: s.quantity),
+            generic_group_sum(records, key_fn=lambda s: s.product, value_fn=lambda s: s.quantity),
+        )
+        self.assertEqual(SalesAnalyzer(table).summary(), SalesAnalyzer(records).summary())
+
+    def test_sample_sales(self):
+        self._assert_identical(_sample_sales())
+
+    def test_dataset(self):
+        self._assert_identical(load_sales_from_csv(DATA_CSV))
+
+    def test_empty(self):
+        self._assert_identical([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+aggregation.py
+
+Single-pass, incremental computation of every summary metric.
+
+Calling each analysis function separately scans the sales once per
+metric and recomputes net_amount every time. aggregate_sales() instead
+visits each sale once and feeds all accumulators together; the
+functions in analysis.py accept the resulting SalesAggregates in place
+of the sales themselves and only apply their final sorting/slicing.
+
+SalesAggregates is also an incremental accumulator: update() folds in
+more sales (e.g. a stream from io_utils.iter_sales_from_csv) and merge()
+combines partial results, so memory is bounded by the number of distinct
+groups rather than rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, Tuple, Union
+
+from models import SaleRecord
+from sales_table import SalesTable
+
+
+@dataclass
+class SalesAggregates:
+    """
+    Raw accumulators for all summary metrics.
+
+    Group dicts keep first-appearance order and are summed in input
+    order, exactly like the per-function defaultdict passes, so the
+    analysis functions produce the same groups, values and tie order
+    from either source.
+    """
+    count: int = 0
+    returned_count: int = 0
+    # Running sum in input order. Python 3.12+ sum() compensates rounding,
+    # so totals may differ from total_revenue(rows) in the last digit there.
+    total_revenue: float = 0.0
+    revenue_by_country: Dict[str, float] = field(default_factory=dict)
+    revenue_by_category: Dict[str, float] = field(default_factory=dict)
+    revenue_by_month: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    revenue_by_customer: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, sale: SaleRecord) -> None:
+        """Fold a single sale into the accumulators."""
+        self.update((sale,))
+
+    def update(self, sales: Union[Iterable[SaleRecord], SalesTable]) -> "SalesAggregates":
+        """
+        Fold `sales` (rows, consumed once, or a SalesTable) into the
+        accumulators in input order and return self.
+        """
+        if isinstance(sales, SalesTable):
+            return self.merge(_aggregate_table(sales))
+
+        count, returned_count, total = self.count, self.returned_count, self.total_revenue
+        by_country = self.revenue_by_country
+        by_category = self.revenue_by_category
+        by_month = self.revenue_by_month
+        by_customer = self.revenue_by_customer
+        # Month keys per distinct date; dates repeat heavily.
+        months: Dict[date, Tuple[int, int]] = {}
+
+        for s in sales:
+            count += 1
+            if s.returned:
+                returned_count += 1
+            net = s.net_amount
+            total += net
+            by_country[s.country] = by_country.get(s.country, 0.0) + net
+            by_category[s.category] = by_category.get(s.category, 0.0) + net
+            by_customer[s.customer_id] = by_customer.get(s.customer_id, 0.0) + net
+            month = months.get(s.order_date)
+            if month is None:
+                month = months[s.order_date] = (s.order_date.year, s.order_date.month)
+            by_month[month] = by_month.get(month, 0.0) + net
+
+        self.count, self.returned_count, self.total_revenue = count, returned_count, total
+        return self
+
+    def merge(self, other: "SalesAggregates") -> "SalesAggregates":
+        """
+        Add another partial result into this one and return self.
+
+        Merging the aggregates of consecutive slices in order gives the
+        same groups in the same order as aggregating the whole input;
+        group sums may differ only by float summation order.
+        """
+        self.count += other.count
+        self.returned_count += other.returned_count
+        self.total_revenue += other.total_revenue
+        for mine, theirs in (
+            (self.revenue_by_country, other.revenue_by_country),
+            (self.revenue_by_category, other.revenue_by_category),
+            (self.revenue_by_month, other.revenue_by_month),
+            (self.revenue_by_customer, other.revenue_by_customer),
+        ):
+            for key, value in theirs.items():
+                mine[key] = mine.get(key, 0.0) + value
+        return self
+
+
+def _aggregate_table(table: SalesTable) -> SalesAggregates:
+    net = table.net_amount
+    return SalesAggregates(
+        count=len(table),
+        returned_count=sum(table.returned),
+        total_revenue=sum(net),
+        revenue_by_country=table.country.group_sum(net),
+        revenue_by_category=table.category.group_sum(net),
+        revenue_by_month=table.month_column().group_sum(net),
+        revenue_by_customer=table.customer_id.group_sum(net),
+    )
+
+
+def aggregate_sales(sales: Union[Iterable[SaleRecord], SalesTable]) -> SalesAggregates:
+    """
+    Compute all summary accumulators in one pass over `sales`.
+
+    Accepts SaleRecord rows (any iterable, consumed once, so a generator
+    streams in constant memory) or a SalesTable, whose dictionary codes
+    and cached net amount column are used directly.
+    """
+    if isinstance(sales, SalesTable):
+        return _aggregate_table(sales)
+    return SalesAggregates().update(sales)
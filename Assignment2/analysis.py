@@ -1,24 +1,42 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Callable, Dict, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
 
+from aggregation import SalesAggregates, aggregate_sales
 from models import SaleRecord
+from sales_table import SalesTable
 
+# Every function accepts SaleRecord rows or a columnar SalesTable; table
+# inputs take a column-wise path with results identical to the row path.
+Sales = Union[Iterable[SaleRecord], SalesTable]
+# The summary metrics can also be finished from precomputed single-pass
+# aggregates (see aggregation.aggregate_sales).
+SalesOrAggregates = Union[Sales, SalesAggregates]
 
-def total_revenue(sales: Iterable[SaleRecord]) -> float:
+
+def total_revenue(sales: SalesOrAggregates) -> float:
     """Total net revenue over all (non-returned) sales."""
+    if isinstance(sales, SalesAggregates):
+        return sales.total_revenue
+    if isinstance(sales, SalesTable):
+        return sum(sales.net_amount)
     # functional style: sum + map + lambda
     return sum(map(lambda s: s.net_amount, sales))
 
 
-def revenue_by_country(sales: Iterable[SaleRecord]) -> Dict[str, float]:
+def revenue_by_country(sales: SalesOrAggregates) -> Dict[str, float]:
     """
     Aggregate net revenue per country, sorted by revenue descending.
     """
-    totals: Dict[str, float] = defaultdict(float)
-    for s in sales:
-        totals[s.country] += s.net_amount
+    if isinstance(sales, SalesAggregates):
+        totals = sales.revenue_by_country
+    elif isinstance(sales, SalesTable):
+        totals = sales.country.group_sum(sales.net_amount)
+    else:
+        totals = defaultdict(float)
+        for s in sales:
+            totals[s.country] += s.net_amount
 
     # returning a normal dict but sorted for deterministic output
     return dict(
@@ -26,51 +44,70 @@ def revenue_by_country(sales: Iterable[SaleRecord]) -> Dict[str, float]:
     )
 
 
-def average_order_value(sales: Iterable[SaleRecord]) -> float:
+def average_order_value(sales: SalesOrAggregates) -> float:
     """
     Average net revenue per order.
     """
-    amounts: List[float] = list(map(lambda s: s.net_amount, sales))
+    if isinstance(sales, SalesAggregates):
+        return sales.total_revenue / sales.count if sales.count else 0.0
+    amounts: Sequence[float] = (
+        sales.net_amount if isinstance(sales, SalesTable)
+        else list(map(lambda s: s.net_amount, sales))
+    )
     if not amounts:
         return 0.0
     return sum(amounts) / len(amounts)
 
 
 def top_n_customers_by_revenue(
-    sales: Iterable[SaleRecord], n: int = 5
+    sales: SalesOrAggregates, n: int = 5
 ) -> List[Tuple[str, float]]:
     """
     Top N customers by total net revenue.
     Returns list of (customer_id, revenue) sorted descending.
     """
-    totals: Dict[str, float] = defaultdict(float)
-    for s in sales:
-        totals[s.customer_id] += s.net_amount
+    if isinstance(sales, SalesAggregates):
+        totals = sales.revenue_by_customer
+    elif isinstance(sales, SalesTable):
+        totals = sales.customer_id.group_sum(sales.net_amount)
+    else:
+        totals = defaultdict(float)
+        for s in sales:
+            totals[s.customer_id] += s.net_amount
 
     sorted_customers = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
     return sorted_customers[:n]
 
 
 def monthly_revenue(
-    sales: Iterable[SaleRecord],
+    sales: SalesOrAggregates,
 ) -> Dict[Tuple[int, int], float]:
     """
     Monthly revenue trend.
     Returns dict keyed by (year, month) with total net revenue.
     Sorted by (year, month) ascending.
     """
-    totals: Dict[Tuple[int, int], float] = defaultdict(float)
-    for s in sales:
-        key = (s.order_date.year, s.order_date.month)
-        totals[key] += s.net_amount
+    if isinstance(sales, SalesAggregates):
+        totals = sales.revenue_by_month
+    elif isinstance(sales, SalesTable):
+        totals = sales.month_column().group_sum(sales.net_amount)
+    else:
+        totals = defaultdict(float)
+        for s in sales:
+            key = (s.order_date.year, s.order_date.month)
+            totals[key] += s.net_amount
 
     return dict(sorted(totals.items(), key=lambda kv: kv[0]))
 
 
-def returns_rate(sales: Iterable[SaleRecord]) -> float:
+def returns_rate(sales: SalesOrAggregates) -> float:
     """
     Percentage of orders marked as returned, in range [0,1].
     """
+    if isinstance(sales, SalesAggregates):
+        return sales.returned_count / sales.count if sales.count else 0.0
+    if isinstance(sales, SalesTable):
+        return sum(sales.returned) / len(sales) if len(sales) else 0.0
     sales_list = list(sales)
     if not sales_list:
         return 0.0
@@ -79,13 +116,16 @@ def returns_rate(sales: Iterable[SaleRecord]) -> float:
 
 
 def generic_group_sum(
-    sales: Iterable[SaleRecord],
+    sales: Sales,
     key_fn: Callable[[SaleRecord], str],
     value_fn: Callable[[SaleRecord], float],
 ) -> Dict[str, float]:
     """
     Example of a reusable, functional-style grouping helper.
     Groups by key_fn(s) and sums value_fn(s).
+
+    Arbitrary callables need whole rows, so a SalesTable is iterated as
+    SaleRecord objects here.
     """
     totals: Dict[str, float] = defaultdict(float)
     for s in sales:
@@ -93,12 +133,36 @@ def generic_group_sum(
     return dict(totals)
 
 
-def revenue_by_category(sales: Iterable[SaleRecord]) -> Dict[str, float]:
+def revenue_by_category(sales: SalesOrAggregates) -> Dict[str, float]:
     """
     Revenue per category using the generic_group_sum functional helper.
     """
+    if isinstance(sales, SalesAggregates):
+        return dict(sales.revenue_by_category)
+    if isinstance(sales, SalesTable):
+        return sales.category.group_sum(sales.net_amount)
     return generic_group_sum(
         sales,
         key_fn=lambda s: s.category,
         value_fn=lambda s: s.net_amount,
     )
+
+
+def summarize(sales: SalesOrAggregates, top_n: int = 5) -> Dict[str, object]:
+    """
+    Every summary metric in one dictionary.
+
+    Rows and tables are aggregated in a single pass first; pass
+    SalesAggregates (e.g. built while streaming a file) to skip that.
+    """
+    if not isinstance(sales, SalesAggregates):
+        sales = aggregate_sales(sales)
+    return {
+        "total_revenue": total_revenue(sales),
+        "average_order_value": average_order_value(sales),
+        "returns_rate": returns_rate(sales),
+        "revenue_by_country": revenue_by_country(sales),
+        "revenue_by_category": revenue_by_category(sales),
+        "monthly_revenue": monthly_revenue(sales),
+        "top_customers_by_revenue": top_n_customers_by_revenue(sales, n=top_n),
+    }
@@ -0,0 +1,190 @@
+"""
+columnar_cache.py
+
+Binary, memory-mappable cache of a parsed sales CSV.
+
+Parsing text is the dominant cost of every run. A SalesTable is already
+columnar, so it can be written out as raw column buffers and mapped back
+without parsing: numeric and code columns become zero-copy memoryviews
+over the file, and only the dictionaries and order ids are decoded.
+
+File layout (all columns 8-byte aligned, native byte order):
+
+    b"SALESCOL" | header length (<Q) | JSON header | column buffers...
+
+The header records the source file's size, mtime and a sampled SHA-256,
+plus byte order and item sizes; any mismatch makes the cache stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sales_table import DictionaryColumn, SalesTable
+
+MAGIC = b"SALESCOL"
+VERSION = 1
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGN = 8
+# Bytes hashed from each end of the source; hashing a whole multi-GB file
+# on every run would cost more than parsing the cache saves.
+_HASH_SAMPLE = 1024 * 1024
+
+# Typed columns stored as raw buffers, by SalesTable attribute.
+_ARRAY_COLUMNS = ("order_ordinal", "quantity", "unit_price", "discount", "returned")
+_DICTIONARY_COLUMNS = ("country", "category", "product", "customer_id")
+
+
+def cache_path_for(source: str | Path) -> Path:
+    """Default cache location: next to the source, e.g. sales.csv.colcache."""
+    source = Path(source)
+    return source.with_name(source.name + ".colcache")
+
+
+def source_key(source: str | Path) -> Dict[str, object]:
+    """
+    Identify the current contents of `source`: size, mtime and a SHA-256
+    of its first and last megabyte.
+    """
+    source = Path(source)
+    stat = source.stat()
+    digest = hashlib.sha256()
+    with source.open("rb") as f:
+        digest.update(f.read(_HASH_SAMPLE))
+        if stat.st_size > _HASH_SAMPLE:
+            f.seek(max(_HASH_SAMPLE, stat.st_size - _HASH_SAMPLE))
+            digest.update(f.read(_HASH_SAMPLE))
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % _ALIGN)
+
+
+def write_cache(table: SalesTable, source: str | Path, cache_path: str | Path) -> None:
+    """
+    Write `table`, parsed from `source`, to `cache_path`.
+
+    The file is written to a temporary name and renamed into place, so a
+    concurrent reader never sees a partial cache. Raises ValueError if an
+    order id contains a newline (order ids are stored newline-separated).
+    """
+    if any("\n" in order_id for order_id in table.order_id):
+        raise ValueError("Order ids containing newlines cannot be cached")
+
+    buffers = [(name, getattr(table, name)) for name in _ARRAY_COLUMNS]
+    buffers += [(name, getattr(table, name).codes) for name in _DICTIONARY_COLUMNS]
+    blobs = {name: memoryview(column).cast("B") for name, column in buffers}
+    blobs["order_id"] = memoryview("\n".join(table.order_id).encode("utf-8"))
+
+    columns = {}
+    offset = 0
+    for name, blob in blobs.items():
+        columns[name] = {"offset": offset, "length": blob.nbytes}
+        offset += blob.nbytes + len(_padding(blob.nbytes))
+    for name, column in buffers:
+        columns[name].update(typecode=column.typecode, itemsize=column.itemsize)
+
+    header = json.dumps({
+        "version": VERSION,
+        "source": source_key(source),
+        "byteorder": sys.byteorder,
+        "rows": len(table),
+        "columns": columns,
+        "dictionaries": {name: getattr(table, name).values for name in _DICTIONARY_COLUMNS},
+    }).encode("utf-8")
+    # Pad with JSON whitespace so the first column starts aligned.
+    header += b" " * (-(len(MAGIC) + _HEADER_LENGTH.size + len(header)) % _ALIGN)
+
+    cache_path = Path(cache_path)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            for blob in blobs.values():
+                f.write(blob)
+                f.write(_padding(blob.nbytes))
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def read_cache(source: str | Path, cache_path: str | Path) -> Optional[SalesTable]:
+    """
+    Map `cache_path` as a read-only SalesTable, or return None if it is
+    missing, unreadable or stale for the current contents of `source`.
+
+    Numeric and code columns are views into the mapping, so only the
+    pages an analysis touches are ever read from disk. Whenever None is
+    returned, every view is released and the mapping is closed.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    views: List[memoryview] = []
+    try:
+        table = _map_table(mapped, source, views)
+    except (KeyError, TypeError, ValueError, struct.error):
+        table = None
+    if table is None:
+        # The mapping cannot be closed while any view into it is alive.
+        for view in reversed(views):
+            view.release()
+        mapped.close()
+    return table
+
+
+def _map_table(mapped: mmap.mmap, source: str | Path, views: List[memoryview]) -> Optional[SalesTable]:
+    """Build the table over `mapped`, recording every view it creates in `views`."""
+    if mapped[:len(MAGIC)] != MAGIC:
+        return None
+    (header_length,) = _HEADER_LENGTH.unpack_from(mapped, len(MAGIC))
+    data_start = len(MAGIC) + _HEADER_LENGTH.size + header_length
+    header = json.loads(mapped[len(MAGIC) + _HEADER_LENGTH.size:data_start])
+    if (
+        header["version"] != VERSION
+        or header["byteorder"] != sys.byteorder
+        or header["source"] != source_key(source)
+    ):
+        return None
+
+    view = memoryview(mapped)
+    views.append(view)
+    columns = header["columns"]
+    rows = header["rows"]
+
+    def typed(name: str) -> memoryview:
+        spec = columns[name]
+        start = data_start + spec["offset"]
+        column = view[start:start + spec["length"]].cast(spec["typecode"])
+        views.append(column)
+        if column.itemsize != spec["itemsize"] or len(column) != rows:
+            raise ValueError(f"Column {name} does not match this platform")
+        return column
+
+    table = SalesTable()
+    for name in _ARRAY_COLUMNS:
+        setattr(table, name, typed(name))
+    for name in _DICTIONARY_COLUMNS:
+        values = header["dictionaries"][name]
+        setattr(table, name, DictionaryColumn.from_encoded(typed(name), values))
+    spec = columns["order_id"]
+    start = data_start + spec["offset"]
+    text = str(view[start:start + spec["length"]], "utf-8")
+    table.order_id = text.split("\n") if rows else []
+    table.read_only = True
+    return table
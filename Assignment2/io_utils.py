@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime
+import warnings
+from datetime import date, datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
+from columnar_cache import cache_path_for, read_cache, write_cache
 from models import SaleRecord
+from sales_table import SalesTable
 
 DATE_FORMAT = "%Y-%m-%d"
 
+REQUIRED_COLUMNS = (
+    "order_id", "order_date", "country", "category", "product",
+    "customer_id", "quantity", "unit_price", "discount", "returned",
+)
+
 
 def _parse_bool(value: str) -> bool:
     return str(value).strip().upper() in {"TRUE", "T", "1", "YES", "Y"}
 
 
-def load_sales_from_csv(path: str | Path) -> List[SaleRecord]:
+def _read_rows(path: str | Path) -> Iterator[Tuple]:
     """
-    Load sales data from a CSV file into a list of SaleRecord objects.
+    Validate the CSV at `path` and yield each row's converted fields,
+    in SaleRecord field order.
 
     Required headers:
       order_id, order_date, country, category, product, customer_id,
@@ -29,41 +38,157 @@ def load_sales_from_csv(path: str | Path) -> List[SaleRecord]:
         raise FileNotFoundError(f"CSV file not found: {path}")
 
     with path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        yield from convert_rows(header, reader)
+
+
+def column_positions(header: List[str]) -> Tuple[int, ...]:
+    """
+    Validate the header and return the index of each required column,
+    in REQUIRED_COLUMNS order.
+
+    Raises ValueError if a required column is missing.
+    """
+    # 2) CSV schema validation
+    missing = set(REQUIRED_COLUMNS) - set(header)
+    if missing:
+        raise ValueError(f"CSV missing required columns: {missing}")
 
-        # 2) CSV schema validation
-        required_cols = {
-            "order_id", "order_date", "country", "category", "product",
-            "customer_id", "quantity", "unit_price", "discount", "returned",
-        }
+    # Later duplicates win, matching csv.DictReader.
+    position = {name: index for index, name in enumerate(header)}
+    return tuple(position[name] for name in REQUIRED_COLUMNS)
 
-        missing = required_cols - set(reader.fieldnames or [])
-        if missing:
-            raise ValueError(f"CSV missing required columns: {missing}")
 
-        records: List[SaleRecord] = []
+def convert_rows(header: List[str], rows: Iterable[List[str]]) -> Iterator[Tuple]:
+    """
+    Convert csv.reader rows laid out as `header` into SaleRecord fields.
+
+    Used by the serial loaders here and by the chunk workers in
+    parallel.py, so both paths convert rows identically.
 
-        for row in reader:
-            # 3) Defensive date parsing
+    Fast path: fields are picked by column index (no dict per row).
+    Dates and booleans repeat heavily, so each distinct raw value is
+    parsed once and memoized; repeated strings (country, category,
+    product, customer_id) are shared instead of allocated per row.
+    """
+    (i_id, i_date, i_country, i_category, i_product,
+     i_customer, i_qty, i_price, i_discount, i_returned) = column_positions(header)
+    width = len(header)
+
+    dates: Dict[str, date] = {}
+    flags: Dict[str, bool] = {}
+    strings: Dict[str, str] = {}
+    shared = strings.setdefault
+
+    for row in rows:
+        if not row:
+            continue  # blank line, skipped like csv.DictReader
+        if len(row) < width:
+            row = row + [None] * (width - len(row))
+
+        # 3) Defensive date parsing (memoized per distinct string)
+        raw_date = row[i_date]
+        order_date = dates.get(raw_date)
+        if order_date is None:
             try:
-                order_date = datetime.strptime(row["order_date"], DATE_FORMAT).date()
+                order_date = datetime.strptime(raw_date, DATE_FORMAT).date()
             except ValueError:
-                raise ValueError(f"Invalid date format in row: {row}")
-
-            # 4) Convert and build SaleRecord
-            records.append(
-                SaleRecord(
-                    order_id=row["order_id"],
-                    order_date=order_date,
-                    country=row["country"],
-                    category=row["category"],
-                    product=row["product"],
-                    customer_id=row["customer_id"],
-                    quantity=int(row["quantity"]),
-                    unit_price=float(row["unit_price"]),
-                    discount=float(row["discount"]),
-                    returned=_parse_bool(row["returned"]),
-                )
-            )
-
-    return records
+                raise ValueError(f"Invalid date format in row: {_row_dict(header, row)}")
+            dates[raw_date] = order_date
+
+        raw_returned = row[i_returned]
+        returned = flags.get(raw_returned)
+        if returned is None:
+            returned = flags[raw_returned] = _parse_bool(raw_returned)
+
+        # 4) Convert fields
+        yield (
+            row[i_id],
+            order_date,
+            shared(row[i_country], row[i_country]),
+            shared(row[i_category], row[i_category]),
+            shared(row[i_product], row[i_product]),
+            shared(row[i_customer], row[i_customer]),
+            int(row[i_qty]),
+            float(row[i_price]),
+            float(row[i_discount]),
+            returned,
+        )
+
+
+def _row_dict(header: List[str], row: List[str]) -> Dict:
+    """Rebuild the csv.DictReader view of a row for error messages."""
+    record = dict(zip(header, row))
+    if len(row) > len(header):
+        record[None] = row[len(header):]
+    return record
+
+
+def load_sales_from_csv(
+    path: str | Path, cache: Union[bool, str, Path] = False
+) -> List[SaleRecord]:
+    """
+    Load sales data from a CSV file into a list of SaleRecord objects.
+
+    Required headers:
+      order_id, order_date, country, category, product, customer_id,
+      quantity, unit_price, discount, returned
+
+    With `cache` (True for the default location, or a cache file path)
+    the rows come from the binary columnar cache when it is fresh; see
+    load_sales_table_from_csv.
+    """
+    if cache:
+        return list(load_sales_table_from_csv(path, cache=cache))
+    return [SaleRecord(*fields) for fields in _read_rows(path)]
+
+
+def iter_sales_from_csv(path: str | Path) -> Iterator[SaleRecord]:
+    """
+    Lazily yield SaleRecord objects from a CSV file, one row at a time.
+
+    Only the current row is held in memory, so files of any size can be
+    fed to aggregation.aggregate_sales(). Same validation and errors as
+    load_sales_from_csv; they are raised when iteration starts (or
+    reaches the bad row), not when this function is called.
+    """
+    for fields in _read_rows(path):
+        yield SaleRecord(*fields)
+
+
+def load_sales_table_from_csv(
+    path: str | Path, cache: Union[bool, str, Path] = False
+) -> SalesTable:
+    """
+    Load sales data from a CSV file straight into a columnar SalesTable,
+    without creating a SaleRecord per row. Same validation and errors as
+    load_sales_from_csv.
+
+    `cache` enables the binary columnar cache: True stores it next to the
+    CSV (see columnar_cache.cache_path_for), a path stores it there. If
+    the cache matches the CSV's size, mtime and sampled hash, the table
+    is memory-mapped from it without parsing (and is read-only);
+    otherwise the CSV is parsed and the cache rewritten. Failing to write
+    the cache only warns.
+    """
+    if cache:
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"CSV file not found: {path}")
+        cache_path = cache_path_for(path) if cache is True else Path(cache)
+        table = read_cache(path, cache_path)
+        if table is not None:
+            return table
+
+    table = SalesTable()
+    append = table.append
+    for fields in _read_rows(path):
+        append(*fields)
+
+    if cache:
+        try:
+            write_cache(table, path, cache_path)
+        except (OSError, ValueError) as exc:
+            warnings.warn(f"Could not write sales cache {cache_path}: {exc}")
+    return table
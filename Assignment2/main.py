@@ -2,31 +2,54 @@
 main.py
 
 Entry point for Assignment 2 – Sales Analysis.
-Loads the CSV file and prints a full analytical summary to console.
+Streams the CSV file and prints a full analytical summary to console.
+
+    python -m main [--workers N | --cache]
 """
 
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
-
-from io_utils import load_sales_from_csv
-from sales_analysis import SalesAnalyzer
-
-
-def main() -> None:
-    # Path: Assignment2/data/sales.csv
-    csv_path = Path(__file__).parent / "data" / "sales.csv"
-
-    # Load sales records into SaleRecord objects
-    sales = load_sales_from_csv(csv_path)
-
-    # Create analyzer
-    analyzer = SalesAnalyzer(sales)
-
-    summary = analyzer.summary()
+from typing import List, Optional
+
+from aggregation import aggregate_sales
+from analysis import summarize
+from io_utils import iter_sales_from_csv, load_sales_table_from_csv
+from parallel import aggregate_csv_parallel
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Print the sales analytics report.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--workers", type=int, default=None,
+        help="parse and aggregate the file in N processes (default: stream in this process)",
+    )
+    source.add_argument(
+        "--cache", action="store_true",
+        help="load from (or build) the binary columnar cache next to the CSV",
+    )
+    args = parser.parse_args(argv)
+
+    # Path: Assignment2/Data/sales.csv
+    csv_path = Path(__file__).parent / "Data" / "sales.csv"
+
+    if args.workers is not None:
+        # Map-reduce over line-aligned byte ranges of the file.
+        aggregates = aggregate_csv_parallel(csv_path, workers=args.workers)
+    elif args.cache:
+        # Memory-map the parsed columns instead of re-parsing the text.
+        aggregates = aggregate_sales(load_sales_table_from_csv(csv_path, cache=True))
+    else:
+        # Stream records through the single-pass accumulators; memory grows
+        # with the number of distinct groups, not with the file size.
+        aggregates = aggregate_sales(iter_sales_from_csv(csv_path))
+
+    summary = summarize(aggregates)
 
     print("===== SALES ANALYTICS =====")
-    print(f"Total records: {len(sales)}")
+    print(f"Total records: {aggregates.count}")
 
     print("\n--- Overall Metrics ---")
     print(f"Total revenue:         {summary['total_revenue']:.2f}")
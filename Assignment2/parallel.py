@@ -0,0 +1,126 @@
+"""
+parallel.py
+
+Multi-core CSV loading and map-reduce aggregation.
+
+The file is split into byte ranges aligned on line boundaries. Each
+range is parsed and pre-aggregated into a SalesAggregates in a
+ProcessPoolExecutor worker (map), and the partial results are merged in
+file order (reduce). Every metric in analysis.py and summarize() can
+then be finished from the merged aggregates.
+
+Top-N customers cannot be merged from per-chunk top-N lists (a
+customer's orders span chunks), so workers return full per-customer
+sums; the merge stays bounded by the number of distinct customers.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from aggregation import SalesAggregates
+from io_utils import column_positions, convert_rows
+from models import SaleRecord
+
+DEFAULT_CHUNK_BYTES = 32 * 1024 * 1024
+
+
+def _read_header(path: Path) -> Tuple[List[str], int]:
+    """Validate the header row; return it and the offset of the first data row."""
+    if not path.exists():
+        raise FileNotFoundError(f"CSV file not found: {path}")
+    with path.open("rb") as f:
+        line = f.readline()
+        header = next(csv.reader([line.decode("utf-8")]), [])
+        column_positions(header)
+        return header, f.tell()
+
+
+def chunk_ranges(path: str | Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split the data rows of `path` into (start, end) byte ranges of about
+    `chunk_bytes` each, every range starting and ending on a line boundary.
+
+    Assumes no quoted field contains a newline, which holds for the sales
+    schema.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+    path = Path(path)
+    _, start = _read_header(path)
+    size = path.stat().st_size
+
+    ranges = []
+    with path.open("rb") as f:
+        while start < size:
+            end = start + chunk_bytes
+            if end < size:
+                # Extend to the end of the line containing byte end - 1.
+                f.seek(end - 1)
+                f.readline()
+                end = f.tell()
+            end = min(end, size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def aggregate_range(path: str | Path, header: List[str], start: int, end: int) -> SalesAggregates:
+    """
+    Parse the rows in bytes [start, end) of `path` and aggregate them.
+    Runs in worker processes; `header` comes from the parent.
+    """
+    with Path(path).open("rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    rows = csv.reader(io.StringIO(text, newline=""))
+    return SalesAggregates().update(
+        SaleRecord(*fields) for fields in convert_rows(header, rows)
+    )
+
+
+def aggregate_csv_parallel(
+    path: str | Path,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> SalesAggregates:
+    """
+    Aggregate every summary metric of a sales CSV using `workers`
+    processes (default: one per CPU).
+
+    Same validation and errors as load_sales_from_csv: header problems
+    are raised before any worker starts, bad rows surface from the worker
+    that parsed them. Groups come out in the same first-appearance order
+    as a sequential pass; sums may differ only by float summation order.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    path = Path(path)
+    header, _ = _read_header(path)
+    ranges = chunk_ranges(path, chunk_bytes)
+
+    result = SalesAggregates()
+    if workers == 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            result.merge(aggregate_range(path, header, start, end))
+        return result
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        partials = executor.map(
+            aggregate_range,
+            [path] * len(ranges),
+            [header] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        )
+        # map() yields in submission order, so groups keep file order.
+        for partial in partials:
+            result.merge(partial)
+    return result
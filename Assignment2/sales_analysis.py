@@ -1,16 +1,18 @@
 from __future__ import annotations
-from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from aggregation import SalesAggregates, aggregate_sales
 from analysis import (
     average_order_value,
     monthly_revenue,
     returns_rate,
     revenue_by_category,
     revenue_by_country,
+    summarize,
     top_n_customers_by_revenue,
     total_revenue,
 )
 from models import SaleRecord
+from sales_table import SalesTable
 
 # -------------------------------------------------------------------
 # Class-Based API (Wrapper Around Functional Analytics)
@@ -21,49 +23,74 @@ class SalesAnalyzer:
     Object-oriented wrapper around the functional sales analysis utilities.
 
     This class:
-    - Encapsulates a collection of SaleRecord instances.
+    - Encapsulates a collection of SaleRecord instances, or a columnar
+      SalesTable (kept as-is, so the column-wise analytics are used).
     - Exposes high-level analytical methods as instance methods.
     - Delegates actual computation to the pure functions defined above.
+    - Computes every summary metric in one fused pass on first use and
+      answers all metric methods from those cached aggregates.
 
+    The records are treated as immutable once passed in: build a new
+    analyzer after appending to a SalesTable.
     """
 
-    def __init__(self, sales: Iterable[SaleRecord]):
+    def __init__(self, sales: Union[Iterable[SaleRecord], SalesTable]):
         # Store a local list copy to avoid external mutation issues.
-        self._sales: List[SaleRecord] = list(sales)
+        self._sales: Union[List[SaleRecord], SalesTable] = (
+            sales if isinstance(sales, SalesTable) else list(sales)
+        )
+        self._aggregates: Optional[SalesAggregates] = None
+
+    @classmethod
+    def from_aggregates(cls, aggregates: SalesAggregates) -> "SalesAnalyzer":
+        """
+        Build an analyzer over precomputed aggregates, e.g. from
+        parallel.aggregate_csv_parallel() or a streamed file. Every metric
+        method and summary() works; the analyzer holds no records.
+        """
+        analyzer = cls(())
+        analyzer._aggregates = aggregates
+        return analyzer
+
+    def aggregates(self) -> SalesAggregates:
+        """Return the single-pass aggregates, computing them on first use."""
+        if self._aggregates is None:
+            self._aggregates = aggregate_sales(self._sales)
+        return self._aggregates
 
     # ---------- Core metrics ----------
 
     def total_revenue(self) -> float:
         """Return total net revenue across all records."""
-        return total_revenue(self._sales)
+        return total_revenue(self.aggregates())
 
     def average_order_value(self) -> float:
         """Return the average order value across all records."""
-        return average_order_value(self._sales)
+        return average_order_value(self.aggregates())
 
     def returns_rate(self) -> float:
         """Return the overall returns rate (0–1)."""
-        return returns_rate(self._sales)
+        return returns_rate(self.aggregates())
 
     # ---------- Grouped aggregations ----------
 
     def revenue_by_country(self) -> Dict[str, float]:
         """Return net revenue aggregated by country."""
-        return revenue_by_country(self._sales)
+        return revenue_by_country(self.aggregates())
 
     def revenue_by_category(self) -> Dict[str, float]:
         """Return net revenue aggregated by category."""
-        return revenue_by_category(self._sales)
+        return revenue_by_category(self.aggregates())
 
     def monthly_revenue(self) -> Dict[Tuple[int, int], float]:
         """Return net revenue aggregated by (year, month)."""
-        return monthly_revenue(self._sales)
+        return monthly_revenue(self.aggregates())
 
     def top_n_customers_by_revenue(
         self, n: int = 5
     ) -> List[Tuple[str, float]]:
         """Return top N customers by net revenue."""
-        return top_n_customers_by_revenue(self._sales, n=n)
+        return top_n_customers_by_revenue(self.aggregates(), n=n)
 
     # ---------- Convenience summary ----------
 
@@ -71,14 +98,7 @@ class SalesAnalyzer:
         """
         Return a dictionary summarizing key analytics.
 
-        Useful for printing a single report from main.py.
+        All values are derived from one pass over the records; see
+        analysis.summarize().
         """
-        return {
-            "total_revenue": self.total_revenue(),
-            "average_order_value": self.average_order_value(),
-            "returns_rate": self.returns_rate(),
-            "revenue_by_country": self.revenue_by_country(),
-            "revenue_by_category": self.revenue_by_category(),
-            "monthly_revenue": self.monthly_revenue(),
-            "top_customers_by_revenue": self.top_n_customers_by_revenue(),
-        }
+        return summarize(self.aggregates())
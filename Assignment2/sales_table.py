@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from itertools import compress, repeat
+from operator import mul, sub
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from models import SaleRecord
+
+
+class DictionaryColumn:
+    """
+    Dictionary-encoded column (strings, or any hashable key).
+
+    Each distinct value is stored once in `values`; rows hold a compact
+    integer code into it. Codes are assigned in order of first
+    appearance, so grouping by code visits groups in the same order as
+    grouping the original strings with a dict.
+    """
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+
+    @classmethod
+    def from_encoded(cls, codes: Sequence[int], values: List[Hashable]) -> "DictionaryColumn":
+        """Wrap existing codes (e.g. a memory-mapped view) and their values."""
+        column = cls()
+        column.codes = codes
+        column.values = values
+        column._index = {value: code for code, value in enumerate(values)}
+        return column
+
+    def append(self, value: Hashable) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, row: int) -> Hashable:
+        return self.values[self.codes[row]]
+
+    def group_sum(self, values: Sequence[float]) -> Dict[Hashable, float]:
+        """
+        Sum `values` per distinct value. Groups come out in first-appearance
+        order and are summed in row order, exactly like a defaultdict pass.
+        """
+        totals = [0.0] * len(self.values)
+        for code, value in zip(self.codes, values):
+            totals[code] += value
+        return dict(zip(self.values, totals))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class SalesTable:
+    """
+    Columnar, memory-compact alternative to a list of SaleRecord objects.
+
+    - Numeric columns are typed arrays (`array` module): quantity (int64),
+      unit_price and discount (float64), returned (uint8) and order date
+      as proleptic ordinals (int32).
+    - country, category, product and customer_id are dictionary-encoded.
+    - order_id is kept as a plain list of strings (unique per row).
+
+    The net amount column is derived once on first use and cached, so
+    every analysis shares it instead of recomputing SaleRecord.net_amount.
+    Iterating a table yields SaleRecord objects for code that needs rows.
+
+    Tables loaded from a columnar cache are backed by read-only
+    memory-mapped views (`read_only` is True) and cannot be appended to.
+    """
+
+    def __init__(self) -> None:
+        self.order_id: List[str] = []
+        self.order_ordinal = array("i")
+        self.country = DictionaryColumn()
+        self.category = DictionaryColumn()
+        self.product = DictionaryColumn()
+        self.customer_id = DictionaryColumn()
+        self.quantity = array("q")
+        self.unit_price = array("d")
+        self.discount = array("d")
+        self.returned = array("B")
+        self.read_only = False
+        self._net_amount: Optional[array] = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[SaleRecord]) -> "SalesTable":
+        """Build a table from SaleRecord objects, preserving their order."""
+        table = cls()
+        for r in records:
+            table.append(
+                r.order_id, r.order_date, r.country, r.category, r.product,
+                r.customer_id, r.quantity, r.unit_price, r.discount, r.returned,
+            )
+        return table
+
+    def append(
+        self,
+        order_id: str,
+        order_date: date,
+        country: str,
+        category: str,
+        product: str,
+        customer_id: str,
+        quantity: int,
+        unit_price: float,
+        discount: float,
+        returned: bool,
+    ) -> None:
+        """Append one row (fields in SaleRecord order)."""
+        if self.read_only:
+            raise TypeError("Cannot append to a read-only (memory-mapped) SalesTable")
+        self.order_id.append(order_id)
+        self.order_ordinal.append(order_date.toordinal())
+        self.country.append(country)
+        self.category.append(category)
+        self.product.append(product)
+        self.customer_id.append(customer_id)
+        self.quantity.append(quantity)
+        self.unit_price.append(unit_price)
+        self.discount.append(discount)
+        self.returned.append(1 if returned else 0)
+        self._net_amount = None
+
+    def __len__(self) -> int:
+        return len(self.order_id)
+
+    def record(self, row: int) -> SaleRecord:
+        """Materialize one row as a SaleRecord."""
+        return SaleRecord(
+            order_id=self.order_id[row],
+            order_date=date.fromordinal(self.order_ordinal[row]),
+            country=self.country[row],
+            category=self.category[row],
+            product=self.product[row],
+            customer_id=self.customer_id[row],
+            quantity=self.quantity[row],
+            unit_price=self.unit_price[row],
+            discount=self.discount[row],
+            returned=bool(self.returned[row]),
+        )
+
+    def __iter__(self) -> Iterator[SaleRecord]:
+        return (self.record(row) for row in range(len(self)))
+
+    @property
+    def net_amount(self) -> array:
+        """
+        Per-row net revenue (0.0 for returns), computed once, column-wise,
+        as quantity * unit_price * (1 - discount) with returned rows zeroed:
+        the same operations, in the same order, as SaleRecord.net_amount.
+        """
+        if self._net_amount is None:
+            gross = map(mul, self.quantity, self.unit_price)
+            net = list(map(mul, gross, map(sub, repeat(1.0), self.discount)))
+            for row in compress(range(len(net)), self.returned):
+                net[row] = 0.0
+            self._net_amount = array("d", net)
+        return self._net_amount
+
+    def month_column(self) -> DictionaryColumn:
+        """
+        Dictionary-encoded (year, month) per row. Dates repeat heavily,
+        so each distinct ordinal is converted only once.
+        """
+        months = DictionaryColumn()
+        cache: Dict[int, Tuple[int, int]] = {}
+        for ordinal in self.order_ordinal:
+            key = cache.get(ordinal)
+            if key is None:
+                d = date.fromordinal(ordinal)
+                key = cache[ordinal] = (d.year, d.month)
+            months.append(key)
+        return months